@@ -0,0 +1,122 @@
+"""
+대규모 직업 목록용 근사 최근접 이웃(ANN) 인덱스
+
+실제 채용공고 수십만 건처럼 직업 수가 매우 많을 때, 전체 행렬을 스캔하지 않고
+일부 후보만 계산하는 IVF(inverted file) 방식 인덱스입니다.
+- 로드 시 k-means로 점수 벡터를 n_lists개 군집으로 나누고,
+  군집별로 행이 연속되도록 정렬한 점수 행렬을 만듭니다.
+- 검색 시 사용자 벡터와 가까운 군집 n_probe개의 행만 계산합니다.
+  n_probe를 늘리면 정확도(recall)가 오르고 계산량도 늘어납니다. (n_probe = n_lists면 전체 스캔과 동일)
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# 기본 군집 수는 sqrt(직업 수)
+DEFAULT_PROBES = 8
+KMEANS_ITERATIONS = 10
+KMEANS_MAX_TRAIN = 50000
+KMEANS_SEED = 0
+
+# 군집 할당 시 한 번에 계산할 행 수 (거리 행렬 메모리 상한)
+ASSIGN_CHUNK_SIZE = 65536
+
+
+def default_n_lists(n: int) -> int:
+    """직업 수에 맞는 기본 군집 수"""
+    return max(1, int(round(np.sqrt(n))))
+
+
+def _squared_distances(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """점과 군집 중심 사이의 유클리드 거리 제곱 (M x C)"""
+    return (
+        np.einsum('ij,ij->i', points, points)[:, None]
+        - 2.0 * points @ centroids.T
+        + np.einsum('ij,ij->i', centroids, centroids)[None, :]
+    )
+
+
+def _assign(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """각 행을 가장 가까운 군집으로 할당"""
+    labels = np.empty(len(matrix), dtype=np.intp)
+    for start in range(0, len(matrix), ASSIGN_CHUNK_SIZE):
+        chunk = matrix[start:start + ASSIGN_CHUNK_SIZE]
+        labels[start:start + ASSIGN_CHUNK_SIZE] = _squared_distances(chunk, centroids).argmin(axis=1)
+    return labels
+
+
+def train_centroids(
+    matrix: np.ndarray,
+    n_lists: int,
+    iterations: int = KMEANS_ITERATIONS,
+    seed: int = KMEANS_SEED
+) -> np.ndarray:
+    """
+    k-means 군집 중심 학습 (같은 데이터면 항상 같은 결과)
+    직업 수가 많으면 KMEANS_MAX_TRAIN개 표본으로만 학습합니다.
+    """
+    rng = np.random.default_rng(seed)
+    train = matrix
+    if len(train) > KMEANS_MAX_TRAIN:
+        train = train[np.sort(rng.choice(len(train), KMEANS_MAX_TRAIN, replace=False))]
+    train = np.asarray(train, dtype=np.float32)
+
+    centroids = train[rng.choice(len(train), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _assign(train, centroids)
+        counts = np.bincount(labels, minlength=n_lists)
+        sums = np.zeros_like(centroids, dtype=np.float64)
+        np.add.at(sums, labels, train)
+        # 빈 군집은 이전 중심 유지
+        filled = counts > 0
+        centroids[filled] = (sums[filled] / counts[filled, None]).astype(np.float32)
+    return centroids
+
+
+class IVFIndex:
+    """k-means 군집 기반 역색인 (유클리드/코사인 후보 선택)"""
+
+    def __init__(self, matrix: np.ndarray, n_lists: int = None, stored_matrix: np.ndarray = None):
+        """
+        Args:
+            matrix: 직업 점수 행렬 (N x 6)
+            n_lists: 군집 수 (기본값: sqrt(N))
+            stored_matrix: 검색 시 꺼낼 행렬 (기본값: matrix, 고정소수점 저장이면 uint16 행렬)
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        stored_matrix = matrix if stored_matrix is None else np.asarray(stored_matrix)
+        n = len(matrix)
+        self.n_lists = min(n_lists or default_n_lists(n), n)
+        self.centroids = train_centroids(matrix, self.n_lists)
+        centroid_norms = np.linalg.norm(self.centroids, axis=1)
+        self.unit_centroids = self.centroids / np.where(centroid_norms > 0, centroid_norms, 1.0)[:, None]
+
+        # 군집별로 행이 연속되도록 정렬 (군집 안에서는 원본 순서 유지)
+        labels = _assign(matrix, self.centroids)
+        self.rows = np.argsort(labels, kind='stable')
+        self.matrix = np.ascontiguousarray(stored_matrix[self.rows])
+        self.norms = np.linalg.norm(matrix[self.rows], axis=1)
+        self.offsets = np.zeros(self.n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=self.n_lists), out=self.offsets[1:])
+
+    def probe(self, user_vec: np.ndarray, n_probe: int, method: str) -> np.ndarray:
+        """사용자 벡터와 가까운 군집 n_probe개 (cosine이면 중심 방향 기준)"""
+        n_probe = min(max(int(n_probe), 1), self.n_lists)
+        if method == 'cosine':
+            keys = -(self.unit_centroids @ user_vec)
+        else:
+            keys = _squared_distances(user_vec[None, :], self.centroids)[0]
+        if n_probe == self.n_lists:
+            return np.arange(self.n_lists)
+        return np.argpartition(keys, n_probe - 1)[:n_probe]
+
+    def candidates(self, user_vec: np.ndarray, n_probe: int, method: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        탐색할 군집들의 (점수 행렬, 행 노름, 원본 인덱스)
+        """
+        lists = np.sort(self.probe(user_vec, n_probe, method))
+        positions = np.concatenate([
+            np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists
+        ])
+        return self.matrix[positions], self.norms[positions], self.rows[positions]
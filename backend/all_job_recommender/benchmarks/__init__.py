@@ -0,0 +1,6 @@
+"""
+직업 추천 성능 측정 스크립트 모음
+
+backend 디렉토리에서 모듈로 실행합니다.
+예: python -m all_job_recommender.benchmarks.bench_index
+"""
@@ -0,0 +1,80 @@
+"""
+근사 검색(IVF) recall vs 지연 시간 측정
+
+합성 직업 카탈로그에서 n_probe(탐색 군집 수)를 바꿔가며 index_type='ivf'의
+평균 지연 시간과 recall@top_n(정확한 brute force Top N 중 찾은 비율)을 측정합니다.
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_ann [--sizes 100000 300000] [--probes 1 2 4 8 16]
+"""
+
+import argparse
+import time
+
+from all_job_recommender.benchmarks.bench_index import make_queries, make_synthetic_occupations
+from all_job_recommender.job_recommender import JobRecommender
+
+DEFAULT_SIZES = [100000, 300000]
+DEFAULT_PROBES = [1, 2, 4, 8, 16, 32]
+METHODS = ['euclidean', 'cosine']
+
+
+def measure(recommender, queries, top_n, method, n_probe=None, exact=None):
+    """
+    쿼리당 평균 지연 시간(ms)과 recall 계산
+    Returns:
+        (평균 지연 ms, recall, 쿼리별 결과 soc_code 집합)
+    """
+    found = []
+    start = time.perf_counter()
+    for user_scores in queries:
+        results = recommender.recommend_jobs(user_scores, top_n=top_n, method=method, n_probe=n_probe)
+        found.append({job['soc_code'] for job in results})
+    latency = (time.perf_counter() - start) / len(queries) * 1000
+
+    recall = None
+    if exact is not None:
+        recall = sum(len(a & b) for a, b in zip(found, exact)) / sum(len(b) for b in exact)
+    return latency, recall, found
+
+
+def run(sizes, probes, n_queries, top_n):
+    queries = make_queries(n_queries)
+    rows = []
+
+    for size in sizes:
+        occupations = make_synthetic_occupations(size)
+        # 점수 계산 자체를 측정하기 위해 결과 캐시는 끈다
+        brute = JobRecommender.from_occupations(occupations, cache_size=0)
+        start = time.perf_counter()
+        ivf = JobRecommender.from_occupations(occupations, index_type='ivf', cache_size=0)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"\nN={size}  군집 수={ivf.ann.n_lists}  인덱스 생성 {build_ms:.0f}ms")
+
+        for method in METHODS:
+            brute_ms, _, exact = measure(brute, queries, top_n, method)
+            print(f"  [{method}] brute: {brute_ms:.3f}ms")
+            for n_probe in probes:
+                ivf_ms, recall, _ = measure(ivf, queries, top_n, method, n_probe=n_probe, exact=exact)
+                rows.append({
+                    'size': size, 'method': method, 'n_probe': n_probe,
+                    'brute_ms': brute_ms, 'ivf_ms': ivf_ms, 'recall': recall,
+                })
+                print(f"  [{method}] n_probe={n_probe:>3}: {ivf_ms:.3f}ms "
+                      f"(x{brute_ms / ivf_ms:.1f})  recall@{top_n}={recall:.3f}")
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="근사 검색 recall vs 지연 시간")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--probes', type=int, nargs='+', default=DEFAULT_PROBES)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--top-n', type=int, default=10)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("IVF 근사 검색 recall vs 평균 지연 시간 (기준: brute force)")
+    print("=" * 60)
+    run(args.sizes, args.probes, args.queries, args.top_n)
@@ -0,0 +1,97 @@
+"""
+유클리드 검색 방식별 성능 비교 (brute force vs KD-tree vs Ball-tree)
+
+합성 직업 카탈로그 크기를 늘려가며 recommend_jobs(method='euclidean')의
+평균 지연 시간을 측정하고, 트리 인덱스가 brute force보다 빨라지는 지점을 출력합니다.
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_index [--sizes 1000 10000 ...] [--queries 200]
+        [--storage float32|fixed_point]
+"""
+
+import argparse
+import random
+import time
+
+from all_job_recommender.job_recommender import DIMENSIONS, JobRecommender, OCCUPATION_SCORES_FILE
+
+DEFAULT_SIZES = [895, 2000, 5000, 10000, 20000, 50000, 100000, 200000]
+INDEX_TYPES = ['brute', 'kd_tree', 'ball_tree']
+
+
+def make_synthetic_occupations(n, seed=0):
+    """O*NET 점수 분포(1.0~5.0, 소수 2자리)를 흉내낸 합성 직업 목록 생성"""
+    rng = random.Random(seed)
+    return [
+        {
+            'soc_code': f"99-{i:07d}",
+            'title': f"Synthetic Occupation {i}",
+            **{dim: round(rng.uniform(1.0, 5.0), 2) for dim in DIMENSIONS},
+        }
+        for i in range(n)
+    ]
+
+
+def make_queries(n, seed=1):
+    """인적성검사 결과처럼 1~5 사이 소수 2자리 점수의 사용자 벡터 생성"""
+    rng = random.Random(seed)
+    return [{dim: round(rng.uniform(1.0, 5.0), 2) for dim in DIMENSIONS} for _ in range(n)]
+
+
+def time_queries(recommender, queries, top_n):
+    """쿼리당 평균 지연 시간(ms)"""
+    start = time.perf_counter()
+    for user_scores in queries:
+        recommender.recommend_jobs(user_scores, top_n=top_n, method='euclidean')
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def run(sizes, n_queries, top_n, storage='float32'):
+    queries = make_queries(n_queries)
+    rows = []
+
+    for size in sizes:
+        if size == 895:
+            occupations = JobRecommender(OCCUPATION_SCORES_FILE).occupations
+        else:
+            occupations = make_synthetic_occupations(size)
+
+        row = {'size': len(occupations)}
+        for index_type in INDEX_TYPES:
+            # 점수 계산 자체를 측정하기 위해 결과 캐시는 끈다
+            start = time.perf_counter()
+            recommender = JobRecommender.from_occupations(
+                occupations, index_type=index_type, cache_size=0, storage=storage
+            )
+            row[f"{index_type}_build_ms"] = (time.perf_counter() - start) * 1000
+            row[index_type] = time_queries(recommender, queries, top_n)
+        rows.append(row)
+
+        print(f"N={row['size']:>8}  "
+              + "  ".join(f"{t}={row[t]:.3f}ms (build {row[f'{t}_build_ms']:.0f}ms)" for t in INDEX_TYPES))
+
+    # 트리가 brute force보다 처음으로 빨라지는 크기
+    print("\n" + "=" * 60)
+    for index_type in INDEX_TYPES[1:]:
+        crossover = next((row['size'] for row in rows if row[index_type] < row['brute']), None)
+        if crossover is None:
+            print(f"{index_type}: 측정 범위 내에서 brute force보다 빠르지 않음")
+        else:
+            print(f"{index_type}: N >= {crossover} 부터 brute force보다 빠름")
+    print("=" * 60)
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="유클리드 검색 방식별 성능 비교")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--top-n', type=int, default=10)
+    parser.add_argument('--storage', choices=['float32', 'fixed_point'], default='float32')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("유클리드 검색 방식별 recommend_jobs 평균 지연 시간")
+    print("=" * 60)
+    run(args.sizes, args.queries, args.top_n, args.storage)
@@ -0,0 +1,64 @@
+"""
+직업 데이터 로딩 방식별 성능 비교
+
+워커 시작 시 직업 데이터를 읽는 세 가지 경로를 비교합니다.
+- json     : occupation_scores.json 파싱 + JobRecommender 초기화 (기존 방식)
+- csv      : occupation_scores_kr.csv를 pandas로 읽기 (views_recommend 방식)
+- artifact : occupation_artifact/를 mmap으로 열기 + JobRecommender 초기화
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_loader [--repeat 50]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+import pandas as pd
+
+from all_job_recommender.job_recommender import JobRecommender, OCCUPATION_SCORES_FILE
+from all_job_recommender.occupation_artifact import ARTIFACT_DIR, BASE_DIR, artifact_exists
+
+KR_CSV_FILE = BASE_DIR / "occupation_scores_kr.csv"
+
+LOADERS = {
+    'json': lambda: JobRecommender(OCCUPATION_SCORES_FILE, cache_size=0),
+    'csv': lambda: pd.read_csv(KR_CSV_FILE, encoding="utf-8"),
+    'artifact': lambda: JobRecommender(ARTIFACT_DIR, cache_size=0),
+}
+
+
+def measure(loader, repeat):
+    """로딩 시간(ms) 목록과 Python 힙 최대 사용량(KB)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    result = loader()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return timings, peak / 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="직업 데이터 로딩 방식별 성능 비교")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    if not artifact_exists(ARTIFACT_DIR):
+        print("아티팩트가 없습니다. 먼저 python -m all_job_recommender.occupation_artifact 를 실행하세요.")
+        raise SystemExit(1)
+
+    print("=" * 60)
+    print("직업 데이터 로딩 시간 (ms) / 최대 힙 사용량 (KB)")
+    print("=" * 60)
+    for name, loader in LOADERS.items():
+        timings, peak_kb = measure(loader, args.repeat)
+        print(f"{name:>9}: median={statistics.median(timings):8.3f}ms  "
+              f"min={min(timings):8.3f}ms  peak={peak_kb:9.1f}KB")
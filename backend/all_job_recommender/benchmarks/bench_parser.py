@@ -0,0 +1,154 @@
+"""
+O*NET 파싱 루프 성능 비교 (항목별 리스트 검사 vs 매핑 표 조회)
+
+이전 방식: 행마다 Domain Source를 비교하고 점수를 변환한 뒤, 성향별 `element_name in [...]` 리스트를 모두 검사
+현재 방식: (Domain Source, Element Name)으로 매핑 표를 한 번 조회하고, 표에 있는 행만 점수 변환
+
+두 방식 모두 같은 매핑 표(element_mapping.json)에서 만들어 같은 결과를 내는지 확인한 뒤,
+메모리에 읽어 둔 행에 대해 파싱 루프 시간만 측정합니다. (파일 읽기 제외)
+O*NET 데이터 디렉토리가 없으면 실제 파일과 비슷한 크기의 합성 행을 사용합니다.
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_parser [--data-dir ../db_30_0_text] [--repeat 5]
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from all_job_recommender.onet_parser import (
+    DIMENSIONS, ONET_DATA_DIR, iter_tsv_rows, load_element_mapping, normalize_score,
+)
+
+# 합성 데이터: 파일별 (직업 수, 매핑되지 않은 항목 수, 항목당 행 수)
+SYNTHETIC_OCCUPATIONS = 900
+SYNTHETIC_UNMAPPED = {'Work Styles.txt': 7, 'Skills.txt': 24, 'Abilities.txt': 49}
+SYNTHETIC_DOMAINS = ['Analyst', 'Incumbent']
+
+
+def load_rows(data_dir, mapping):
+    """파일별 행 목록 (디렉토리가 없으면 합성 데이터)"""
+    data_dir = Path(data_dir)
+    if all((data_dir / filename).exists() for filename in mapping):
+        return {filename: list(iter_tsv_rows(data_dir / filename)) for filename in mapping}, 'onet'
+
+    rng = random.Random(0)
+    rows = {}
+    for filename, routes in mapping.items():
+        elements = sorted({element for _, element in routes})
+        elements += [f"Unmapped {filename} {i}" for i in range(SYNTHETIC_UNMAPPED.get(filename, 20))]
+        rows[filename] = [
+            {
+                'O*NET-SOC Code': f"{11 + 2 * (occ % 22)}-{occ:04d}.00",
+                'Element Name': element,
+                'Scale ID': scale_id,
+                'Data Value': f"{rng.uniform(0, 7 if scale_id == 'LV' else 5):.2f}",
+                'Domain Source': rng.choice(SYNTHETIC_DOMAINS),
+            }
+            for occ in range(SYNTHETIC_OCCUPATIONS)
+            for element in elements
+            for scale_id in ('IM', 'LV')
+        ]
+    return rows, 'synthetic'
+
+
+def build_chains(routes):
+    """매핑 표를 이전 코드 형태로 변환: Domain Source, [(성향, [항목명, ...]), ...]"""
+    domains = {domain for domain, _ in routes}
+    if len(domains) != 1:
+        raise ValueError("이전 방식은 파일당 Domain Source 하나만 지원합니다.")
+    chains = {dim: [] for dim in DIMENSIONS}
+    for (_, element_name), dimensions in routes.items():
+        for dim in dimensions:
+            chains[dim].append(element_name)
+    return domains.pop(), [(dim, names) for dim, names in chains.items() if names]
+
+
+def parse_chained(rows, domain, chains):
+    """이전 방식 파싱 루프"""
+    collected = {}
+    for row in rows:
+        soc_code = row.get('O*NET-SOC Code', '').strip()
+        element_name = row.get('Element Name', '').strip()
+        scale_id = row.get('Scale ID', '').strip()
+        data_value = row.get('Data Value', '').strip()
+        domain_source = row.get('Domain Source', '').strip()
+
+        if domain_source != domain:
+            continue
+
+        score = normalize_score(data_value, scale_id)
+        if score is None:
+            continue
+
+        for dim, names in chains:
+            if element_name in names:
+                collected.setdefault((soc_code, dim), []).append(score)
+    return collected
+
+
+def parse_routed(rows, routes):
+    """현재 방식 파싱 루프 (onet_parser.collect_chunk_scores와 같은 분기)"""
+    collected = {}
+    for row in rows:
+        dimensions = routes.get((row.get('Domain Source', '').strip(), row.get('Element Name', '').strip()))
+        if dimensions is None:
+            continue
+
+        soc_code = row.get('O*NET-SOC Code', '').strip()
+        scale_id = row.get('Scale ID', '').strip()
+        data_value = row.get('Data Value', '').strip()
+
+        score = normalize_score(data_value, scale_id)
+        if score is None:
+            continue
+
+        for dim in dimensions:
+            collected.setdefault((soc_code, dim), []).append(score)
+    return collected
+
+
+def best_of(func, repeat):
+    """repeat회 중 가장 빠른 실행 시간(ms)과 결과"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(data_dir, repeat):
+    mapping = load_element_mapping()
+    rows, source = load_rows(data_dir, mapping)
+    print(f"데이터: {source}")
+
+    total_before = total_after = 0.0
+    for filename, routes in mapping.items():
+        domain, chains = build_chains(routes)
+        before_ms, before = best_of(lambda: parse_chained(rows[filename], domain, chains), repeat)
+        after_ms, after = best_of(lambda: parse_routed(rows[filename], routes), repeat)
+        if before != after:
+            raise AssertionError(f"{filename}: 두 방식의 결과가 다릅니다.")
+        total_before += before_ms
+        total_after += after_ms
+        print(f"{filename:<16} {len(rows[filename]):>8}행  이전 {before_ms:8.1f}ms  "
+              f"현재 {after_ms:8.1f}ms  (x{before_ms / after_ms:.2f})")
+
+    print(f"{'합계':<16} {'':>9}   이전 {total_before:8.1f}ms  현재 {total_after:8.1f}ms  "
+          f"(x{total_before / total_after:.2f})")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="O*NET 파싱 루프 성능 비교")
+    parser.add_argument('--data-dir', default=str(ONET_DATA_DIR))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("O*NET 파싱 루프: 리스트 검사 vs 매핑 표 조회")
+    print("=" * 60)
+    run(args.data_dir, args.repeat)
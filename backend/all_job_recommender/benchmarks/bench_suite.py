@@ -0,0 +1,234 @@
+"""
+직업 추천 벤치마크 모음 (JSON 출력)
+
+실제 O*NET 데이터와 합성 카탈로그(기본 10k, 100k, 1M)에 대해 다음을 측정합니다.
+- JobRecommender.recommend_jobs (euclidean, cosine)
+- JobRecommender.get_job_details
+- JobRecommendView.get (DRF 테스트 클라이언트로 /api/assessment/recommend/ 호출)
+
+항목별로 지연 시간 백분위수(p50/p90/p95/p99), 처리량(초당 호출 수),
+호출 중 최대 메모리 할당량(tracemalloc)을 기록하고, 결과를 JSON으로 저장하여 버전 간 비교에 사용합니다.
+점수 계산 자체를 측정하기 위해 추천 결과 캐시는 끕니다.
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_suite [--sizes 10000 100000 1000000] [--queries 500]
+        [--no-real] [--output bench_results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from all_job_recommender import job_recommender
+from all_job_recommender.benchmarks.bench_index import make_queries, make_synthetic_occupations
+from all_job_recommender.job_recommender import DIMENSIONS, JobRecommender
+from all_job_recommender.snapshot import SnapshotHolder
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+DEFAULT_QUERIES = 500
+WARMUP_CALLS = 20
+# 메모리 측정은 tracemalloc 오버헤드 때문에 지연 시간 측정과 따로 일부 호출만 수행
+MEMORY_CALLS = 20
+PERCENTILES = [50, 90, 95, 99]
+
+VIEW_PARAMS = ["comm", "resp", "prob", "grow", "stre", "adap"]
+
+
+# ----------------------
+#   측정
+# ----------------------
+def measure(func, args_list):
+    """
+    args_list의 인자마다 func를 호출하여 지연 시간과 메모리 측정
+    Returns:
+        호출 수, 지연 시간 통계(ms), 처리량, 최대 메모리 할당량(KB)
+    """
+    for args in args_list[:WARMUP_CALLS]:
+        func(*args)
+
+    latencies = np.empty(len(args_list), dtype=np.float64)
+    total_start = time.perf_counter()
+    for i, args in enumerate(args_list):
+        start = time.perf_counter()
+        func(*args)
+        latencies[i] = time.perf_counter() - start
+    total = time.perf_counter() - total_start
+    latencies *= 1000
+
+    tracemalloc.start()
+    for args in args_list[:MEMORY_CALLS]:
+        func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'calls': len(args_list),
+        'latency_ms': {
+            'mean': float(latencies.mean()),
+            **{f"p{p}": float(np.percentile(latencies, p)) for p in PERCENTILES},
+            'max': float(latencies.max()),
+        },
+        'throughput_per_s': len(args_list) / total if total > 0 else None,
+        'peak_alloc_kb': peak / 1024,
+    }
+
+
+def build_catalog(size):
+    """
+    카탈로그 생성 (size가 None이면 실제 데이터)
+    로드 시간은 메모리 측정(tracemalloc)을 켠 상태의 값이라 실제보다 느립니다. (버전 간 비교용)
+    Returns:
+        (이름, JobRecommender, 로드 측정값)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    if size is None:
+        name = 'onet'
+        recommender = JobRecommender(cache_size=0)
+    else:
+        name = f"synthetic_{size}"
+        recommender = JobRecommender.from_occupations(make_synthetic_occupations(size), cache_size=0)
+    load_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return name, recommender, {'load_ms': load_ms, 'load_peak_kb': peak / 1024}
+
+
+# ----------------------
+#   대상별 벤치마크
+# ----------------------
+def bench_recommender(recommender, queries):
+    """recommend_jobs (euclidean, cosine)와 get_job_details"""
+    results = {}
+    for method in ['euclidean', 'cosine']:
+        results[f"recommend_jobs:{method}"] = measure(
+            lambda user_scores, m=method: recommender.recommend_jobs(user_scores, top_n=10, method=m),
+            [(user_scores,) for user_scores in queries],
+        )
+
+    rng = random.Random(2)
+    codes = list(recommender.soc_index)
+    results['get_job_details'] = measure(
+        recommender.get_job_details,
+        [(rng.choice(codes),) for _ in queries],
+    )
+    return results
+
+
+def setup_django():
+    """DRF 테스트 클라이언트를 쓰기 위한 Django 설정 (DJANGO_SETTINGS_MODULE 기본값: config.settings)"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+
+
+def bench_view(recommender, queries):
+    """JobRecommendView.get (URL 라우팅, 미들웨어, 직렬화 포함)"""
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    url = reverse('job-recommend')
+
+    def call(params):
+        response = client.get(url, params, HTTP_HOST='localhost')
+        if response.status_code != 200:
+            raise RuntimeError(f"{url} 응답 오류: {response.status_code}")
+
+    # 뷰가 사용하는 전역 인스턴스를 측정 대상 카탈로그로 교체
+    previous = job_recommender._recommender_holder
+    job_recommender._recommender_holder = SnapshotHolder(
+        loader=lambda: recommender, sources=[], check_interval=0
+    )
+    try:
+        params = [
+            ({param: user_scores[dim] for param, dim in zip(VIEW_PARAMS, DIMENSIONS)},)
+            for user_scores in queries
+        ]
+        return {'JobRecommendView.get': measure(call, params)}
+    finally:
+        job_recommender._recommender_holder = previous
+
+
+# ----------------------
+#   실행
+# ----------------------
+def environment_info():
+    """결과 비교용 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def run(sizes, n_queries, include_real=True, include_view=True):
+    queries = make_queries(n_queries)
+    if include_view:
+        setup_django()
+
+    catalogs = ([None] if include_real else []) + list(sizes)
+    report = {'environment': environment_info(), 'queries': n_queries, 'catalogs': []}
+
+    for size in catalogs:
+        name, recommender, load = build_catalog(size)
+        print(f"[{name}] N={len(recommender.occupations)}  로드 {load['load_ms']:.0f}ms", file=sys.stderr)
+
+        results = bench_recommender(recommender, queries)
+        if include_view:
+            results.update(bench_view(recommender, queries))
+        for target, stats in results.items():
+            latency = stats['latency_ms']
+            print(f"  {target:<26} p50={latency['p50']:.3f}ms  p99={latency['p99']:.3f}ms  "
+                  f"{stats['throughput_per_s']:.0f}/s  peak={stats['peak_alloc_kb']:.0f}KB", file=sys.stderr)
+
+        report['catalogs'].append({
+            'name': name,
+            'size': len(recommender.occupations),
+            **load,
+            'results': results,
+        })
+        del recommender
+
+    # 프로세스 최대 RSS (Linux: KB, macOS: 바이트)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report['max_rss_mb'] = max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="직업 추천 벤치마크 (JSON 출력)")
+    parser.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES)
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES)
+    parser.add_argument('--no-real', action='store_true', help="실제 O*NET 데이터 측정 생략")
+    parser.add_argument('--no-view', action='store_true', help="JobRecommendView 측정 생략 (Django 설정 불필요)")
+    parser.add_argument('--output', help="결과 JSON 파일 경로 (없으면 표준 출력)")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.queries, include_real=not args.no_real, include_view=not args.no_view)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"결과 저장 완료: {args.output}", file=sys.stderr)
+    else:
+        print(output)
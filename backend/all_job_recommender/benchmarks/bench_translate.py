@@ -0,0 +1,220 @@
+"""
+직업명 번역 성능 비교 (순차 호출 vs 동시 호출 + RPM/TPM 제한 vs 배치 요청)
+
+실제 OpenAI API 대신 로컬 스텁 서버(OpenAI 호환 /v1/chat/completions)를 띄워 측정하므로 비용이 들지 않습니다.
+스텁 서버는 요청마다 latency만큼 지연한 뒤 "KO:<직업명>"을 응답하고 (배치 요청이면 JSON 배열),
+일부 직업명은 첫 요청에 429(Retry-After 포함)를 반환하여 재시도 경로도 함께 확인합니다.
+배치 응답은 일부 항목을 빈 번역으로 보내고, 일부 배치는 JSON이 아닌 응답을 보내 한 건씩 다시 요청하는 경로도 확인합니다.
+
+- 이전 방식: 한 건씩 순차 호출 + 50건마다 2초 대기
+- 동시 호출: translate_titles(batch_size=1) (스레드 동시 호출, 토큰 버킷 RPM/TPM 제한, 429 재시도)
+  버스트(BURST_SECONDS 분량, 기본 450회 기준 75건)를 넘는 직업명 수에서는 RPM 한도가 병목이라 순차 호출과 비슷해짐
+  (이전 방식은 한도를 지키지 않아 스텁 서버에서만 빠름)
+- 배치 요청: translate_titles(batch_size=40) (요청 1건에 직업명 여러 개)
+
+모든 방식의 출력 순서가 입력 순서와 같은지 확인하고, 소요 시간, 요청 수, 프롬프트 토큰 추정치(4글자당 1토큰),
+스텁 서버가 받은 분당 요청 수를 출력합니다.
+
+실행:
+    cd backend
+    python -m all_job_recommender.benchmarks.bench_translate [--titles 100] [--latency 0.5] [--concurrency 8]
+        [--batch-size 40]
+"""
+
+import argparse
+import csv
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from all_job_recommender import translate_with_openai as translator
+
+SCORES_CSV = Path(translator.__file__).resolve().parent / "occupation_scores.csv"
+USER_PROMPT_PREFIX = translator.TRANSLATION_USER_PROMPT.split('{title}')[0]
+
+# 이전 방식의 배치 대기
+LEGACY_BATCH_SIZE = 50
+LEGACY_PAUSE_SECONDS = 2
+
+# 첫 요청에 429를 받을 직업명 비율 (N개 중 1개)
+RATE_LIMIT_EVERY = 20
+RETRY_AFTER_SECONDS = 0.2
+
+# 배치 응답에서 빈 번역으로 보낼 항목 비율, JSON이 아닌 응답을 보낼 배치 비율 (N개 중 1개)
+BATCH_DROP_EVERY = 25
+BATCH_GARBLE_EVERY = 8
+BATCH_USER_PROMPT_PREFIX = translator.TRANSLATION_BATCH_USER_PROMPT.split('{titles}')[0]
+
+
+class StubServer:
+    """OpenAI 호환 채팅 완성 스텁 서버"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.request_times = []
+        self.limited = set()
+        self.rate_limited = 0
+        self.batches = 0
+        self.prompt_chars = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(self):
+        with self.lock:
+            self.request_times = []
+            self.limited = set()
+            self.rate_limited = 0
+            self.batches = 0
+            self.prompt_chars = 0
+
+    def peak_rpm(self):
+        """가장 많은 요청을 받은 60초 구간의 요청 수"""
+        times = sorted(self.request_times)
+        peak, start = 0, 0
+        for end, t in enumerate(times):
+            while t - times[start] >= 60:
+                start += 1
+            peak = max(peak, end - start + 1)
+        return peak
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                batch = request['messages'][0]['content'] == translator.TRANSLATION_BATCH_SYSTEM_PROMPT
+                user_content = request['messages'][-1]['content']
+                if batch:
+                    title = user_content[len(BATCH_USER_PROMPT_PREFIX):]
+                else:
+                    title = user_content[len(USER_PROMPT_PREFIX):]
+                with stub.lock:
+                    stub.request_times.append(time.monotonic())
+                    stub.prompt_chars += sum(len(message['content']) for message in request['messages'])
+                    first_try = title not in stub.limited
+                    stub.limited.add(title)
+                    limit = first_try and zlib.crc32(title.encode('utf-8')) % RATE_LIMIT_EVERY == 0
+                    if limit:
+                        stub.rate_limited += 1
+                if limit:
+                    self._send(429, {'error': {'message': 'Rate limit reached', 'type': 'requests',
+                                               'code': 'rate_limit_exceeded'}},
+                               {'retry-after': str(RETRY_AFTER_SECONDS)})
+                    return
+
+                time.sleep(stub.latency)
+                content = stub.batch_content(json.loads(title)) if batch else f"KO:{title}"
+                self._send(200, {
+                    'id': 'chatcmpl-stub',
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': request['model'],
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': content},
+                        'finish_reason': 'stop',
+                    }],
+                    'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+                })
+
+        return Handler
+
+    def batch_content(self, items):
+        """배치 요청 응답 (JSON 배열, 일부 항목은 빈 번역이고 일부 배치는 JSON이 아님)"""
+        with self.lock:
+            self.batches += 1
+            garble = self.batches % BATCH_GARBLE_EVERY == 0
+        if garble:
+            return "Sorry, here are the translations: ..."
+        translations = [
+            {'id': item['id'],
+             'korean': '' if zlib.crc32(item['title'].encode('utf-8')) % BATCH_DROP_EVERY == 0
+             else f"KO:{item['title']}"}
+            for item in items
+        ]
+        return "```json\n" + json.dumps(translations, ensure_ascii=False) + "\n```"
+
+
+def translate_legacy(titles, client):
+    """이전 방식: 순차 호출 + 배치마다 대기"""
+    results = []
+    for i, title in enumerate(titles, 1):
+        results.append(translator.translate_with_openai(title, client))
+        if i % LEGACY_BATCH_SIZE == 0:
+            time.sleep(LEGACY_PAUSE_SECONDS)
+    return results
+
+
+def run(n_titles, latency, concurrency, rpm, tpm, batch_size):
+    with open(SCORES_CSV, 'r', encoding='utf-8') as f:
+        titles = [row['title'] for row in csv.DictReader(f)][:n_titles]
+
+    expected = [f"KO:{title}" for title in titles]
+    with StubServer(latency) as stub:
+        client = translator.create_client(api_key='stub', base_url=stub.base_url)
+        cases = [
+            ('이전 (순차 + 배치 대기)', lambda: translate_legacy(titles, client)),
+            (f"동시 {concurrency}",
+             lambda: translator.translate_titles(titles, client, concurrency, rpm, tpm, batch_size=1)),
+            (f"동시 {concurrency} + 배치 {batch_size}",
+             lambda: translator.translate_titles(titles, client, concurrency, rpm, tpm, batch_size=batch_size)),
+        ]
+        timings = []
+        for name, func in cases:
+            stub.reset()
+            start = time.perf_counter()
+            output = func()
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+            print(f"{name:<24} {elapsed:7.2f}s  순서/결과 일치: {output == expected}  "
+                  f"요청 {len(stub.request_times)}건 (429 {stub.rate_limited}건)  "
+                  f"프롬프트 약 {stub.prompt_chars // 4} 토큰  최대 분당 요청: {stub.peak_rpm()}")
+
+    print(f"\n속도 향상: 동시 x{timings[0] / timings[1]:.1f}, 동시 + 배치 x{timings[0] / timings[2]:.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="직업명 번역 성능 비교 (로컬 스텁 서버)")
+    parser.add_argument('--titles', type=int, default=100, help="번역할 직업명 수 (최대 895)")
+    parser.add_argument('--latency', type=float, default=0.5, help="스텁 서버 응답 지연 (초, gpt-4o-mini 단건 번역 응답 시간 수준)")
+    parser.add_argument('--concurrency', type=int, default=translator.DEFAULT_CONCURRENCY)
+    parser.add_argument('--rpm', type=int, default=translator.DEFAULT_RPM)
+    parser.add_argument('--tpm', type=int, default=translator.DEFAULT_TPM)
+    parser.add_argument('--batch-size', type=int, default=translator.DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("직업명 번역: 순차 호출 vs 동시 호출 vs 배치 요청 (로컬 스텁 서버)")
+    print("=" * 60)
+    run(args.titles, args.latency, args.concurrency, args.rpm, args.tpm, args.batch_size)
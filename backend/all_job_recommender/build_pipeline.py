@@ -0,0 +1,317 @@
+"""
+추천 데이터 빌드 파이프라인 (O*NET 파싱 -> 직업명 번역 -> 아티팩트 빌드)
+
+onet_parser.py와 translate_with_openai.py를 차례로 직접 실행하던 과정을 한 번에 수행합니다.
+각 단계의 키는 입력과 설정의 내용 해시(SHA-256)로 만들고, 키가 이전 빌드와 같으면 단계를 건너뜁니다.
+
+    parse     : O*NET 원본 파일, 매핑 표, 파서 코드   -> occupation_scores.json / .csv
+    translate : parse 결과, 번역 모델/프롬프트 버전   -> occupation_scores_kr.csv
+    artifact  : parse 결과, 번역 결과, 아티팩트 코드  -> occupation_artifact/
+
+- 같은 키의 parse 결과가 캐시에 있으면 다시 파싱하지 않고 캐시에서 복원합니다.
+- 번역은 (직업명, 모델, 프롬프트 버전) 단위로 번역 메모리(translation_memo.py)에 저장하므로,
+  새로 추가되거나 이름이 바뀐 직업만 API를 호출합니다.
+- 앞 단계를 다시 실행해도 결과가 같으면 (출력 해시가 같으면) 뒤 단계의 키도 같아 건너뜁니다.
+- 빌드 상태와 캐시는 .build_cache/ 에 저장합니다. (manifest.json: 단계별 마지막 키와 출력 해시)
+
+실행:
+    cd backend
+    python -m all_job_recommender.build_pipeline [--jobs 4] [--data-dir ../db_30_0_text] [--force parse]
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+
+try:
+    from . import onet_parser
+    from .occupation_artifact import ARTIFACT_DIR, ARTIFACT_VERSION, read_korean_titles, write_artifact
+    from .related_jobs import RELATED_TOP_K
+    from .translation_memo import MEMO_FILE, SOURCE_TITLE_FIELD, TranslationMemo
+except ImportError:  # 스크립트로 직접 실행하는 경우 (python build_pipeline.py)
+    import onet_parser
+    from occupation_artifact import ARTIFACT_DIR, ARTIFACT_VERSION, read_korean_titles, write_artifact
+    from related_jobs import RELATED_TOP_K
+    from translation_memo import MEMO_FILE, SOURCE_TITLE_FIELD, TranslationMemo
+
+BASE_DIR = Path(__file__).resolve().parent
+BUILD_CACHE_DIR = BASE_DIR / ".build_cache"
+
+SCORES_JSON_FILE = 'occupation_scores.json'
+SCORES_CSV_FILE = 'occupation_scores.csv'
+SCORES_KR_CSV_FILE = 'occupation_scores_kr.csv'
+
+# 단계 순서 (각 단계는 바로 앞 단계의 출력을 입력으로 사용)
+STAGES = ('parse', 'translate', 'artifact')
+
+# 단계 키에 포함할 코드 파일 (코드가 바뀌면 해당 단계부터 다시 빌드)
+STAGE_CODE_FILES = {
+    'parse': ['onet_parser.py'],
+    'translate': ['translate_with_openai.py'],
+    'artifact': ['occupation_artifact.py', 'related_jobs.py'],
+}
+
+# 번역 CSV: title은 한국어 직업명, 마지막 열은 번역한 영어 직업명 (다음 빌드에서 번역 메모리로 가져올 때 확인용)
+FIELDNAMES = ['soc_code', 'title'] + onet_parser.DIMENSIONS + [SOURCE_TITLE_FIELD]
+
+
+# ----------------------
+#   해시
+# ----------------------
+def file_digest(path):
+    """파일 내용의 SHA-256 (1MB 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def data_digest(data):
+    """JSON으로 표현 가능한 값의 SHA-256 (키 순서와 무관)"""
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def code_digest(stage):
+    """단계 코드 파일들의 해시"""
+    return {name: file_digest(BASE_DIR / name) for name in STAGE_CODE_FILES[stage]}
+
+
+# ----------------------
+#   빌드 캐시
+# ----------------------
+class BuildCache:
+    """단계별 마지막 키/출력 해시(manifest.json)와 캐시 파일 관리"""
+
+    def __init__(self, cache_dir=BUILD_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+
+    def is_current(self, stage, key):
+        """마지막으로 완료한 빌드의 키와 같은지"""
+        return self.manifest.get(stage, {}).get('key') == key
+
+    def output_hash(self, stage):
+        return self.manifest.get(stage, {}).get('output_hash')
+
+    def record(self, stage, key, output_hash):
+        """단계 완료 기록 (단계마다 바로 저장하므로 중간에 중단되어도 완료한 단계는 유지)"""
+        self.manifest[stage] = {'key': key, 'output_hash': output_hash}
+        self.write_json(self.manifest_path, self.manifest)
+
+    def path(self, *parts):
+        return self.cache_dir.joinpath(*parts)
+
+    def read_json(self, path, default=None):
+        if not Path(path).exists():
+            return default
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_json(self, path, data):
+        """임시 파일에 쓴 뒤 교체 (중단되어도 이전 파일 유지)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+# ----------------------
+#   단계: parse
+# ----------------------
+def parse_stage(cache, data_dir, mapping_file, jobs, force=False):
+    """
+    O*NET 원본 파일을 파싱하여 직업별 성향 점수 계산
+    원본 파일이 없으면 기존 occupation_scores.json을 parse 결과로 사용합니다.
+    Returns:
+        (직업 점수 리스트, 출력 해시)
+    """
+    data_dir = Path(data_dir)
+    mapping = onet_parser.load_element_mapping(mapping_file)
+    source_names = [onet_parser.OCCUPATION_DATA_FILE] + list(mapping)
+    sources = {name: file_digest(data_dir / name) for name in source_names if (data_dir / name).exists()}
+
+    if not sources:
+        print(f"[parse] 경고: {data_dir}에 O*NET 파일이 없어 기존 {SCORES_JSON_FILE}을 사용합니다.")
+        results = cache.read_json(BASE_DIR / SCORES_JSON_FILE, default=[])
+        return results, data_digest(results)
+
+    key = data_digest({
+        'sources': sources,
+        'mapping': file_digest(mapping_file),
+        'code': code_digest('parse'),
+    })
+    cached_path = cache.path('parse', f"{key}.json")
+    outputs_exist = (BASE_DIR / SCORES_JSON_FILE).exists() and (BASE_DIR / SCORES_CSV_FILE).exists()
+
+    if not force and cache.is_current('parse', key) and cached_path.exists() and outputs_exist:
+        print("[parse] 변경 없음, 건너뜀")
+        return cache.read_json(cached_path), cache.output_hash('parse')
+
+    if not force and cached_path.exists():
+        print("[parse] 같은 입력의 이전 결과를 캐시에서 복원")
+        results = cache.read_json(cached_path)
+    else:
+        print("[parse] O*NET 파싱 실행")
+        results = onet_parser.calculate_occupation_scores(jobs=jobs, mapping_file=mapping_file, data_dir=data_dir)
+        cache.write_json(cached_path, results)
+
+    onet_parser.save_to_json(results, SCORES_JSON_FILE)
+    onet_parser.save_to_csv(results, SCORES_CSV_FILE)
+    output_hash = data_digest(results)
+    cache.record('parse', key, output_hash)
+    return results, output_hash
+
+
+# ----------------------
+#   단계: translate
+# ----------------------
+def translation_config():
+    """번역 결과에 영향을 주는 설정 (번역 메모리 키)"""
+    try:
+        from . import translate_with_openai as translator
+    except ImportError:
+        import translate_with_openai as translator
+    config = {
+        'model': translator.TRANSLATION_MODEL,
+        'prompt_version': translator.TRANSLATION_PROMPT_VERSION,
+    }
+    return translator, config
+
+
+def translate_stage(cache, results, parse_hash, force=False):
+    """
+    직업명을 한국어로 번역하여 occupation_scores_kr.csv 저장
+    번역 메모리(translation_memo)에 없는 직업명만 OpenAI API로 번역하고,
+    API 키가 없거나 번역에 실패한 직업은 영어 직업명을 사용합니다. (저장하지 않으므로 다음 빌드에서 재시도)
+    Returns:
+        (soc_code -> 한국어 직업명, 출력 해시)
+    """
+    translator, config = translation_config()
+    key = data_digest({'parse': parse_hash, 'config': config, 'code': code_digest('translate')})
+    kr_csv_path = BASE_DIR / SCORES_KR_CSV_FILE
+
+    if not force and cache.is_current('translate', key) and kr_csv_path.exists():
+        print("[translate] 변경 없음, 건너뜀")
+        return read_korean_titles(kr_csv_path), cache.output_hash('translate')
+
+    with TranslationMemo(config['model'], config['prompt_version'], cache.path(MEMO_FILE.name)) as memo:
+        # 첫 빌드: 기존 번역 CSV(같은 번역 설정으로 만든 결과) 중 영어 직업명이 그대로인 번역만 번역 메모리로 가져옴
+        seeded = memo.seed_from_csv(results, kr_csv_path)
+        if seeded:
+            print(f"[translate] 기존 번역 {seeded}개를 번역 메모리로 가져옴")
+
+        titles = [job['title'] for job in results]
+        known = memo.get_many(titles)
+        missing = [title for title in dict.fromkeys(titles) if title not in known]
+        if missing:
+            print(f"[translate] 새로 번역할 직업명: {len(missing)}개")
+            api_key = os.getenv('OPENAI_API_KEY')
+            if api_key:
+                def on_result(i, korean):
+                    print(f"  {missing[i]} → {korean}")
+                    # translate_with_openai는 오류 시 원문을 반환하므로 원문과 같으면 저장하지 않음
+                    if korean != missing[i]:
+                        memo.put(missing[i], korean)
+
+                translator.translate_titles(missing, translator.create_client(api_key), on_result=on_result)
+            else:
+                print("[translate] 경고: OPENAI_API_KEY가 없어 새 직업명은 영어로 저장합니다.")
+        else:
+            print("[translate] 모든 직업명이 번역 메모리에 있음")
+        known = memo.get_many(titles)
+    untranslated = sum(title not in known for title in missing)
+
+    titles_ko = {job['soc_code']: known.get(job['title'], job['title']) for job in results}
+
+    with open(kr_csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(
+            {**job, 'title': titles_ko[job['soc_code']], SOURCE_TITLE_FIELD: job['title']} for job in results
+        )
+    print(f"[translate] 저장 완료: {kr_csv_path}")
+
+    output_hash = data_digest(titles_ko)
+    if not untranslated:
+        cache.record('translate', key, output_hash)
+    else:
+        print(f"[translate] 번역하지 못한 직업명 {untranslated}개는 다음 빌드에서 재시도합니다.")
+    return titles_ko, output_hash
+
+
+# ----------------------
+#   단계: artifact
+# ----------------------
+def artifact_stage(cache, results, titles_ko, parse_hash, translate_hash, output_dir=ARTIFACT_DIR, force=False):
+    """memory-map 아티팩트(점수 행렬, 문자열 테이블, 관련 직업 테이블) 빌드"""
+    output_dir = Path(output_dir)
+    key = data_digest({
+        'parse': parse_hash,
+        'translate': translate_hash,
+        'code': code_digest('artifact'),
+        'version': ARTIFACT_VERSION,
+        'related_top_k': RELATED_TOP_K,
+    })
+
+    if not force and cache.is_current('artifact', key) and (output_dir / "meta.json").exists():
+        print("[artifact] 변경 없음, 건너뜀")
+        return output_dir
+
+    print("[artifact] 아티팩트 빌드 실행")
+    write_artifact(results, titles_ko, output_dir)
+    cache.record('artifact', key, key)
+    print(f"[artifact] 저장 완료: {output_dir}")
+    return output_dir
+
+
+# ----------------------
+#   실행
+# ----------------------
+def build(
+    data_dir=onet_parser.ONET_DATA_DIR,
+    mapping_file=onet_parser.ELEMENT_MAPPING_FILE,
+    jobs=1,
+    force=(),
+    cache_dir=BUILD_CACHE_DIR
+):
+    """
+    전체 파이프라인 실행
+    Args:
+        force: 캐시와 관계없이 다시 실행할 단계 이름들 (결과가 같으면 뒤 단계는 그대로 건너뜀)
+    """
+    unknown = set(force) - set(STAGES)
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {sorted(unknown)} (사용 가능: {', '.join(STAGES)})")
+
+    cache = BuildCache(cache_dir)
+    results, parse_hash = parse_stage(cache, data_dir, mapping_file, jobs, force='parse' in force)
+    if not results:
+        raise RuntimeError("직업 점수 데이터가 없어 빌드를 계속할 수 없습니다.")
+    titles_ko, translate_hash = translate_stage(cache, results, parse_hash, force='translate' in force)
+    return artifact_stage(cache, results, titles_ko, parse_hash, translate_hash, force='artifact' in force)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="추천 데이터 빌드 (O*NET 파싱 -> 번역 -> 아티팩트)")
+    parser.add_argument('--data-dir', default=str(onet_parser.ONET_DATA_DIR), help="O*NET 텍스트 파일 디렉토리")
+    parser.add_argument('--mapping', default=str(onet_parser.ELEMENT_MAPPING_FILE), help="O*NET 항목 -> 성향 매핑 표 (JSON)")
+    parser.add_argument('--jobs', type=int, default=1, help="파싱에 사용할 프로세스 수 (기본값: 1)")
+    parser.add_argument('--force', nargs='*', default=[], choices=STAGES, help="캐시와 관계없이 다시 실행할 단계")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("추천 데이터 빌드 파이프라인")
+    print("=" * 60)
+    build(args.data_dir, args.mapping, args.jobs, args.force)
+    print("\n✅ 빌드 완료")
@@ -0,0 +1,64 @@
+"""
+고정소수점(1/100 단위) 직업 점수 저장
+
+직업 점수는 모두 0~5 범위의 소수 2자리 값이므로 100을 곱한 정수(uint16)로 저장하면
+float32 행렬의 절반, float64(pandas/파이썬 float)의 1/4 메모리로 같은 값을 그대로 표현할 수 있습니다.
+사용자 점수도 소수 2자리면 유클리드 거리 제곱을 정수 연산으로 오차 없이 계산할 수 있어,
+정수 거리로 고른 후보의 순위는 float 계산과 같습니다.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+SCALE = 100
+DTYPE = np.uint16
+
+# 표현 가능한 최대 점수
+# 차이의 제곱 6개 합이 int32를 넘지 않도록 (6 x 10000^2 < 2^31) uint16 범위보다 작게 제한
+MAX_VALUE = 100.0
+
+
+def quantize(matrix: np.ndarray) -> np.ndarray:
+    """
+    float 점수 행렬을 1/100 단위 uint16 행렬로 변환
+    범위를 벗어나거나 소수 2자리로 표현되지 않는 점수가 있으면 ValueError
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.size and (matrix.min() < 0 or matrix.max() > MAX_VALUE):
+        raise ValueError(f"고정소수점 저장은 0~{MAX_VALUE} 범위의 점수만 지원합니다.")
+    scaled = np.rint(matrix * SCALE)
+    # float32로 저장된 값의 오차(1e-5 수준)는 허용
+    if matrix.size and np.abs(matrix * SCALE - scaled).max() > 1e-3:
+        raise ValueError("고정소수점 저장은 소수 2자리 점수만 지원합니다.")
+    return np.ascontiguousarray(scaled.astype(DTYPE))
+
+
+def dequantize(matrix: np.ndarray) -> np.ndarray:
+    """uint16 행렬을 float32 점수 행렬로 변환"""
+    return np.asarray(matrix, dtype=np.float32) / np.float32(SCALE)
+
+
+def to_fixed_vector(values: Iterable[float]) -> Optional[np.ndarray]:
+    """
+    사용자 점수를 1/100 단위 정수 벡터로 변환
+    모든 값이 소수 2자리로 정확히 표현되지 않으면 None (정수 커널을 쓸 수 없음)
+    """
+    values = [float(v) for v in values]
+    if any(round(v, 2) != v or not 0 <= v <= MAX_VALUE for v in values):
+        return None
+    return np.array([round(v * SCALE) for v in values], dtype=np.int32)
+
+
+def squared_euclidean(matrix: np.ndarray, user_fixed: np.ndarray) -> np.ndarray:
+    """정수 유클리드 거리 제곱 (1/100 단위의 제곱, int32)"""
+    diff = np.subtract(matrix, user_fixed, dtype=np.int32)
+    return np.einsum('ij,ij->i', diff, diff)
+
+
+def squared_limit(kth_squared, tolerance: float):
+    """
+    정수 거리 제곱 kth_squared에 해당하는 거리에 tolerance(점수 단위)를 더한 거리의 제곱 (1/100 단위의 제곱)
+    정수 거리 제곱은 거리보다 SCALE^2배 크고 간격도 균일하지 않으므로 허용 오차를 키에 그대로 더하면 안 됩니다.
+    """
+    return (np.sqrt(kth_squared) + tolerance * SCALE) ** 2
@@ -6,26 +6,235 @@
 
 import json
 import math
+import os
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from . import fixed_point
+    from .ann_index import DEFAULT_PROBES, IVFIndex
+    from .metrics import METRICS, MetricContext, inverse_covariance_factor
+    from .occupation_artifact import ARTIFACT_DIR, ArtifactOccupations, artifact_exists, load_artifact
+    from .recommendation_cache import DEFAULT_MAXSIZE, RecommendationCache, make_key
+    from .related_jobs import RELATED_TOP_K, compute_related
+    from .snapshot import DEFAULT_CHECK_INTERVAL, SnapshotHolder
+except ImportError:  # 스크립트로 직접 실행하는 경우 (python job_recommender.py)
+    import fixed_point
+    from ann_index import DEFAULT_PROBES, IVFIndex
+    from metrics import METRICS, MetricContext, inverse_covariance_factor
+    from occupation_artifact import ARTIFACT_DIR, ArtifactOccupations, artifact_exists, load_artifact
+    from recommendation_cache import DEFAULT_MAXSIZE, RecommendationCache, make_key
+    from related_jobs import RELATED_TOP_K, compute_related
+    from snapshot import DEFAULT_CHECK_INTERVAL, SnapshotHolder
+
+try:
+    from sklearn.neighbors import BallTree, KDTree
+except ImportError:  # scikit-learn 미설치 환경에서는 brute force만 사용
+    BallTree = KDTree = None
 
 BASE_DIR = Path(__file__).resolve().parent
 OCCUPATION_SCORES_FILE = BASE_DIR / "occupation_scores.json"
 
+# 6개 성향 차원 (행렬의 열 순서)
+DIMENSIONS = ['COMM', 'RESP', 'PROB', 'GROW', 'STRE', 'ADAP']
+
+# 유클리드 검색 방식
+# - 'brute': 전체 행렬 스캔
+# - 'kd_tree' / 'ball_tree': 로드 시 트리 인덱스를 만들어 k-최근접/반경 검색
+# - 'auto': 직업 수가 INDEX_AUTO_THRESHOLD 이상이면 kd_tree, 아니면 brute
+# - 'ivf': k-means 군집 중 가까운 n_probe개만 계산하는 근사 검색 (euclidean, cosine / ann_index.py 참고)
+INDEX_TYPES = ('brute', 'kd_tree', 'ball_tree', 'auto', 'ivf')
+ANN_METHODS = ('euclidean', 'cosine')
+
+# 점수 행렬 저장 방식
+# - 'float32': float32 행렬
+# - 'fixed_point': 1/100 단위 uint16 행렬 (fixed_point.py 참고, 유클리드 거리는 정수 연산)
+STORAGE_TYPES = ('float32', 'fixed_point')
+INDEX_AUTO_THRESHOLD = 20000
+INDEX_LEAF_SIZE = 40
+
+# SOC 대분류 코드 자릿수 (예: '11-1011.00' -> '11' 관리직, '15' 컴퓨터/수학)
+SOC_GROUP_DIGITS = 2
+
+# 결과 점수 반올림 자릿수
+SCORE_DECIMALS = 4
+
+# 순위 정렬 기준
+# - 'rounded': 반올림한 값으로 정렬하고 동점이면 원본 순서 (기존 JobRecommender.recommend_jobs)
+# - 'exact': 반올림 전 float64 값으로 정렬 (기존 JobRecommendView의 pandas 정렬), 반올림은 결과 값에만 적용
+TIE_BREAKS = ('rounded', 'exact')
+
+# 순위 비교 시 허용 오차
+# 반올림 후 k번째와 동점이 될 수 있는 후보(반올림 단위 1e-4 이내 + float32 오차)는 모두 다시 계산
+RANK_TOLERANCE = 2e-4
+
+# 배치 추천에서 행마다 상위 k개와 함께 가져오는 후보 수
+# k번째 값과 허용 오차 이내인 직업이 k + 이 값보다 많은 행만 한 행씩 다시 계산
+BATCH_EXTRA_CANDIDATES = 16
+
+
+def _rank_limit(kth_key):
+    """
+    k번째 순위 키와 허용 오차 이내인 후보의 최대 키 (이 값 이하인 직업은 모두 다시 계산)
+    정수 키는 fixed_point 유클리드 거리 제곱(1/100 단위의 제곱)이므로 허용 오차를 거리 단위로 더한 뒤 다시 제곱
+    """
+    if np.issubdtype(np.asarray(kth_key).dtype, np.integer):
+        return fixed_point.squared_limit(kth_key, RANK_TOLERANCE)
+    return kth_key + RANK_TOLERANCE
+
+
+def _round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    배열의 각 값을 round(x, SCORE_DECIMALS)와 같은 값으로 반올림
+    10^SCORE_DECIMALS를 곱한 값이 .5에 아주 가까우면 곱셈 오차로 결과가 달라질 수 있어 그 값만 round()로 계산합니다.
+    """
+    scaled = values * 10.0 ** SCORE_DECIMALS
+    rounded = np.rint(scaled) / 10.0 ** SCORE_DECIMALS
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in zip(*np.nonzero(near_half)):
+        rounded[index] = round(float(values[index]), SCORE_DECIMALS)
+    return rounded
+
+
+def _exact_scores(method: str, jobs: np.ndarray, users: np.ndarray, ctx: MetricContext) -> np.ndarray:
+    """
+    후보 직업 점수(..., k, 6)와 사용자 점수(..., 6)의 float64 거리/유사도 (..., k)
+    차원 순서대로 한 번씩 더하므로 (기존 JobRecommender 루프와 같은 연산 순서)
+    한 명씩 계산해도, 배치로 한 번에 계산해도 같은 값이 나옵니다.
+    """
+    users = users[..., None, :]
+    if method == 'cosine':
+        dot = user_sq = job_sq = 0.0
+        for d in range(len(DIMENSIONS)):
+            u, v = users[..., d], jobs[..., d]
+            dot = dot + u * v
+            user_sq = user_sq + u * u
+            job_sq = job_sq + v * v
+        sims = np.zeros_like(dot)
+        np.divide(dot, np.sqrt(user_sq) * np.sqrt(job_sq), out=sims, where=(user_sq > 0) & (job_sq > 0))
+        return sims
+    if method in ('euclidean', 'weighted'):
+        total = 0.0
+        for d in range(len(DIMENSIONS)):
+            diff = users[..., d] - jobs[..., d]
+            total = total + (diff * diff * ctx.weights[d] if method == 'weighted' else diff * diff)
+        return np.sqrt(total)
+    if method == 'mahalanobis':
+        diff = jobs - users
+        total = 0.0
+        for j in range(ctx.inv_cov_factor.shape[1]):
+            projected = 0.0
+            for d in range(len(DIMENSIONS)):
+                projected = projected + diff[..., d] * ctx.inv_cov_factor[d, j]
+            total = total + projected * projected
+        return np.sqrt(total)
+    # 그 밖에 METRICS에 등록된 방식은 사용자별로 커널 적용
+    kernel = METRICS[method].kernel
+    flat_users = users.reshape(-1, len(DIMENSIONS))
+    flat_jobs = np.broadcast_to(jobs, np.broadcast_shapes(jobs.shape, users.shape)).reshape(
+        len(flat_users), -1, len(DIMENSIONS))
+    scores = [kernel(job_rows, user, ctx._replace(norms=None)) for job_rows, user in zip(flat_jobs, flat_users)]
+    return np.array(scores, dtype=np.float64).reshape(jobs.shape[:-1])
+
 
 class JobRecommender:
     """직업 추천 클래스"""
     
-    def __init__(self, occupation_scores_file=None):
+    def __init__(
+        self,
+        occupation_scores_file=None,
+        index_type: str = 'brute',
+        cache_size: int = DEFAULT_MAXSIZE,
+        n_probe: int = DEFAULT_PROBES,
+        storage: str = 'float32'
+    ):
         """
         초기화
         Args:
-            occupation_scores_file: 직업 점수 JSON 파일 경로 (기본값: occupation_scores.json)
+            occupation_scores_file: 직업 점수 JSON 파일 또는 아티팩트 디렉토리 경로
+                (기본값: occupation_artifact/가 있으면 아티팩트, 없으면 occupation_scores.json)
+            index_type: 검색 방식 ('brute', 'kd_tree', 'ball_tree', 'auto', 'ivf')
+            cache_size: 추천 결과 LRU 캐시 최대 개수 (0이면 캐시 사용 안 함)
+            n_probe: 'ivf' 검색 시 기본 탐색 군집 수
+            storage: 점수 행렬 저장 방식 ('float32', 'fixed_point')
         """
         if occupation_scores_file is None:
-            occupation_scores_file = OCCUPATION_SCORES_FILE
+            occupation_scores_file = ARTIFACT_DIR if artifact_exists(ARTIFACT_DIR) else OCCUPATION_SCORES_FILE
         
-        self.occupations = self._load_occupations(occupation_scores_file)
+        if Path(occupation_scores_file).is_dir():
+            # 바이너리 아티팩트: 점수 행렬은 mmap 그대로 사용 (JSON 파싱 없음)
+            artifact = load_artifact(occupation_scores_file)
+            self._initialize(ArtifactOccupations(artifact), index_type, cache_size,
+                             score_matrix=artifact.scores, n_probe=n_probe, storage=storage)
+            if artifact.related_indices is not None:  # 빌드 시 계산된 관련 직업 테이블
+                self._related = artifact.related_indices
+        else:
+            self._initialize(self._load_occupations(occupation_scores_file), index_type, cache_size,
+                             n_probe=n_probe, storage=storage)
+    
+    @classmethod
+    def from_occupations(
+        cls,
+        occupations: List[Dict],
+        index_type: str = 'brute',
+        cache_size: int = DEFAULT_MAXSIZE,
+        n_probe: int = DEFAULT_PROBES,
+        storage: str = 'float32'
+    ) -> 'JobRecommender':
+        """파일 대신 메모리의 직업 목록으로 생성 (벤치마크, 합성 데이터용)"""
+        recommender = cls.__new__(cls)
+        recommender._initialize(occupations, index_type, cache_size, n_probe=n_probe, storage=storage)
+        return recommender
+    
+    def _initialize(
+        self,
+        occupations: Sequence[Dict],
+        index_type: str,
+        cache_size: int,
+        score_matrix: np.ndarray = None,
+        n_probe: int = DEFAULT_PROBES,
+        storage: str = 'float32'
+    ):
+        """직업 목록으로부터 점수 행렬과 검색 인덱스 구성"""
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"지원하지 않는 index_type입니다: {index_type}")
+        if storage not in STORAGE_TYPES:
+            raise ValueError(f"지원하지 않는 storage입니다: {storage}")
+        
+        self.occupations = occupations
+        self.cache = RecommendationCache(maxsize=cache_size)
+        # soc_code -> 직업 인덱스 (중복 코드는 처음 나온 레코드 사용)
+        if isinstance(occupations, ArtifactOccupations):
+            soc_codes = list(occupations.soc_codes)
+        else:
+            soc_codes = [job['soc_code'] for job in occupations]
+        self.soc_index = {}
+        for i, code in enumerate(soc_codes):
+            self.soc_index.setdefault(code, i)
+        # 점수 행렬 (N x 6, float32)과 행 노름을 로드 시 1회만 계산
+        if score_matrix is None:
+            self.score_matrix, self.score_norms = self._build_matrix(self.occupations)
+        else:
+            self.score_matrix = score_matrix
+            self.score_norms = np.linalg.norm(score_matrix, axis=1)
+        # 마할라노비스 거리용 공분산 역행렬 인자 (6 x 6)
+        self.inv_cov_factor = inverse_covariance_factor(self.score_matrix)
+        self.index_type = self._resolve_index_type(index_type)
+        self.tree = self._build_tree(self.index_type)
+        # 스캔용 행렬 (fixed_point면 uint16으로 변환하고 float 행렬은 보관하지 않음)
+        self.storage = storage
+        float_matrix = self.score_matrix
+        if storage == 'fixed_point':
+            self.score_matrix = fixed_point.quantize(float_matrix)
+        self.n_probe = n_probe
+        self.ann = None
+        if self.index_type == 'ivf' and len(occupations):
+            self.ann = IVFIndex(float_matrix, stored_matrix=self.score_matrix)
+        self._build_partitions(soc_codes)
+        # 관련 직업 테이블 (아티팩트에 없으면 처음 조회할 때 계산)
+        self._related = None
     
     def _load_occupations(self, filepath: Path) -> List[Dict]:
         """직업 점수 데이터 로드"""
@@ -86,11 +295,208 @@ class JobRecommender:
         
         return dot_product / (math.sqrt(user_norm) * math.sqrt(job_norm))
     
+    def _build_matrix(self, occupations: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """직업 점수를 연속 메모리 행렬(N x 6)과 행 노름 벡터로 변환"""
+        matrix = np.array(
+            [[float(job.get(dim, 0.0)) for dim in DIMENSIONS] for job in occupations],
+            dtype=np.float32,
+        ).reshape(-1, len(DIMENSIONS))
+        matrix = np.ascontiguousarray(matrix)
+        norms = np.linalg.norm(matrix, axis=1)
+        return matrix, norms
+    
+    def _build_partitions(self, soc_codes: Sequence[str]):
+        """
+        SOC 대분류별로 행이 연속되도록 정렬한 점수 행렬과 대분류별 구간 생성
+        groups 필터가 있으면 선택된 구간만 계산합니다. (대분류 안에서는 원본 순서 유지)
+        """
+        group_codes = np.array([code[:SOC_GROUP_DIGITS] for code in soc_codes], dtype=object)
+        order = np.argsort(group_codes, kind='stable') if len(group_codes) else np.empty(0, dtype=np.intp)
+        
+        if np.array_equal(order, np.arange(len(order))):
+            # 이미 대분류 순서로 정렬된 경우 복사 없이 원본 행렬 사용
+            self.partition_matrix = self.score_matrix
+            self.partition_norms = self.score_norms
+        else:
+            self.partition_matrix = np.ascontiguousarray(self.score_matrix[order])
+            self.partition_norms = self.score_norms[order]
+        # 정렬된 행 -> 원본 직업 인덱스
+        self.partition_rows = order
+        
+        # 대분류 -> (시작, 끝) 구간
+        self.partitions = {}
+        sorted_groups = group_codes[order].tolist()
+        start = 0
+        for i in range(1, len(sorted_groups) + 1):
+            if i == len(sorted_groups) or sorted_groups[i] != sorted_groups[start]:
+                self.partitions[sorted_groups[start]] = (start, i)
+                start = i
+    
+    @property
+    def groups(self) -> List[str]:
+        """직업이 있는 SOC 대분류 코드 목록"""
+        return list(self.partitions)
+    
+    def _normalize_groups(self, groups) -> Tuple[str, ...]:
+        """groups 필터를 정렬된 대분류 코드 튜플로 변환 (형식이 잘못되면 ValueError)"""
+        normalized = set()
+        for group in groups:
+            group = str(group).strip()
+            if len(group) != SOC_GROUP_DIGITS or not group.isdigit():
+                raise ValueError(f"SOC 대분류는 {SOC_GROUP_DIGITS}자리 숫자여야 합니다: {group}")
+            normalized.add(group)
+        return tuple(sorted(normalized))
+    
+    def _select_partitions(self, groups: Tuple[str, ...]):
+        """
+        선택된 대분류 구간의 (점수 행렬, 행 노름, 원본 인덱스) 반환
+        인접한 구간은 하나로 합쳐 복사 없이 슬라이스로 사용합니다.
+        """
+        ranges = []
+        for group in groups:
+            if group not in self.partitions:
+                continue
+            start, end = self.partitions[group]
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            return (self.partition_matrix[start:end], self.partition_norms[start:end],
+                    self.partition_rows[start:end])
+        
+        rows = np.concatenate([np.arange(start, end) for start, end in ranges]) if ranges \
+            else np.empty(0, dtype=np.intp)
+        return self.partition_matrix[rows], self.partition_norms[rows], self.partition_rows[rows]
+    
+    def _resolve_index_type(self, index_type: str) -> str:
+        """'auto'를 실제 검색 방식으로 변환하고, 트리를 쓸 수 없으면 brute로 대체"""
+        if index_type == 'auto':
+            index_type = 'kd_tree' if len(self.occupations) >= INDEX_AUTO_THRESHOLD else 'brute'
+        if index_type in ('kd_tree', 'ball_tree') and KDTree is None:
+            print("경고: scikit-learn이 설치되지 않아 brute force 검색을 사용합니다.")
+            return 'brute'
+        return index_type
+    
+    def _build_tree(self, index_type: str):
+        """유클리드 검색용 트리 인덱스 생성 (트리 방식이 아니면 None)"""
+        if index_type not in ('kd_tree', 'ball_tree') or len(self.occupations) == 0:
+            return None
+        tree_cls = KDTree if index_type == 'kd_tree' else BallTree
+        return tree_cls(self.score_matrix.astype(np.float64), leaf_size=INDEX_LEAF_SIZE)
+    
+    def _user_vector(self, user_scores: Dict[str, float]) -> np.ndarray:
+        """사용자 점수 dict를 행렬 열 순서의 벡터로 변환"""
+        return np.array(
+            [float(user_scores.get(dim, 0.0)) for dim in DIMENSIONS],
+            dtype=np.float32,
+        )
+    
+    def _float_matrix(self) -> np.ndarray:
+        """float 점수 행렬 (fixed_point 저장이면 변환한 복사본)"""
+        if self.storage == 'fixed_point':
+            return fixed_point.dequantize(self.score_matrix)
+        return self.score_matrix
+    
+    def _user_fixed(self, values) -> np.ndarray:
+        """fixed_point 저장일 때 사용자 점수의 1/100 단위 정수 벡터 (정수 커널을 쓸 수 없으면 None)"""
+        if self.storage != 'fixed_point':
+            return None
+        return fixed_point.to_fixed_vector(values)
+    
+    def _scan_scores(
+        self,
+        method: str,
+        matrix: np.ndarray,
+        user_vec: np.ndarray,
+        ctx: MetricContext,
+        user_fixed: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        스캔 행렬 전체에 대한 거리/유사도 계산
+        fixed_point 행렬의 유클리드 거리는 정수 거리 제곱으로 계산하고 (순위 동일),
+        그 밖의 방식은 float로 변환하여 커널을 적용합니다.
+        """
+        if matrix.dtype == fixed_point.DTYPE:
+            if method == 'euclidean' and user_fixed is not None:
+                return fixed_point.squared_euclidean(matrix, user_fixed)
+            matrix = fixed_point.dequantize(matrix)
+        return METRICS[method].kernel(matrix, user_vec, ctx)
+    
+    def _metric_context(self, weights: Dict[str, float] = None) -> MetricContext:
+        """커널에 넘길 로드 시 계산값과 요청 파라미터"""
+        weight_vec = None
+        if weights is not None:
+            weight_vec = np.array([float(weights.get(dim, 1.0)) for dim in DIMENSIONS])
+            if np.any(weight_vec < 0) or not np.all(np.isfinite(weight_vec)):
+                raise ValueError("weights는 0 이상의 숫자여야 합니다.")
+        return MetricContext(
+            norms=self.score_norms,
+            weights=weight_vec,
+            inv_cov_factor=self.inv_cov_factor,
+        )
+    
+    def _get_metric(self, method: str):
+        """method 이름에 해당하는 거리/유사도 정의"""
+        try:
+            metric = METRICS[method]
+        except KeyError:
+            raise ValueError(f"지원하지 않는 method입니다: {method} (가능: {', '.join(METRICS)})")
+        if method == 'mahalanobis' and self.inv_cov_factor is None:
+            raise ValueError("직업 수가 부족하여 mahalanobis 거리를 계산할 수 없습니다.")
+        return metric
+    
+    def _check_tie_break(self, tie_break: str):
+        """순위 정렬 기준 확인 (지원하지 않으면 ValueError)"""
+        if tie_break not in TIE_BREAKS:
+            raise ValueError(f"지원하지 않는 tie_break입니다: {tie_break} (가능: {', '.join(TIE_BREAKS)})")
+    
+    def _top_k(self, scores: np.ndarray, top_n: int, descending: bool) -> np.ndarray:
+        """
+        argpartition으로 상위 k개 후보 인덱스를 선택
+        float32 오차로 순위가 바뀌지 않도록 k번째 값과 소수 4자리 이내로 가까운 직업도 후보에 포함합니다.
+        """
+        n = len(scores)
+        k = min(max(int(top_n), 0), n)
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        if k == n:
+            return np.arange(n)
+        keys = -scores if descending else scores
+        kth_key = keys[np.argpartition(keys, k - 1)[k - 1]]
+        return np.flatnonzero(keys <= _rank_limit(kth_key))
+    
+    def _top_k_rows(self, scores: np.ndarray, top_n: int, descending: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 사용자의 점수 행렬(M x N)에서 행마다 상위 k + BATCH_EXTRA_CANDIDATES개 후보를 argpartition 한 번으로 선택
+        k번째 값과 허용 오차 이내인 직업은 모두 후보에 들어가고, 나머지 후보는 정확한 값으로 정렬하면 뒤로 밀려납니다.
+        Returns:
+            (후보 인덱스 M x width, 허용 오차 이내 직업이 width개보다 많은 행 표시 M)
+            표시된 행은 _top_k로 후보를 다시 골라야 합니다.
+        """
+        m, n = scores.shape
+        k = min(max(int(top_n), 0), n)
+        width = min(k + BATCH_EXTRA_CANDIDATES, n)
+        if k == 0 or width == n:
+            return np.broadcast_to(np.arange(width if k else 0), (m, width if k else 0)), np.zeros(m, dtype=bool)
+        keys = -scores if descending else scores
+        # k번째와 width번째 위치의 값이 정렬된 위치에 오도록 분할 (앞의 width개가 상위 width개)
+        part = np.argpartition(keys, (k - 1, width - 1), axis=1)[:, :width]
+        kth_key = keys[np.arange(m), part[:, k - 1]]
+        overflow = np.count_nonzero(keys <= _rank_limit(kth_key)[:, None], axis=1) > width
+        return part, overflow
+    
     def recommend_jobs(
         self,
         user_scores: Dict[str, float],
         top_n: int = 10,
-        method: str = 'euclidean'
+        method: str = 'euclidean',
+        weights: Dict[str, float] = None,
+        groups: Sequence[str] = None,
+        n_probe: int = None,
+        tie_break: str = 'rounded'
     ) -> List[Dict]:
         """
         사용자 점수에 기반하여 직업 추천
@@ -98,82 +504,343 @@ class JobRecommender:
             user_scores: 사용자의 6개 성향 점수
                 예: {'COMM': 4.5, 'RESP': 3.8, 'PROB': 4.2, 'GROW': 3.9, 'STRE': 4.1, 'ADAP': 4.3}
             top_n: 추천할 직업 개수 (기본값: 10)
-            method: 거리 계산 방법 ('euclidean' 또는 'cosine')
+            method: 거리 계산 방법 ('euclidean', 'cosine', 'weighted', 'mahalanobis')
+            weights: 'weighted' 방식의 차원별 가중치 (없는 차원은 1.0)
+            groups: 추천 대상 SOC 대분류 코드 리스트 (예: ['11', '15'], 없으면 전체 직업)
+            n_probe: 'ivf' 검색 시 탐색할 군집 수 (없으면 생성 시 지정한 값)
+            tie_break: 순위 정렬 기준 ('rounded', 'exact')
         Returns:
             추천 직업 리스트 (거리/유사도 순으로 정렬)
         """
         if not self.occupations:
             return []
         
+        metric = self._get_metric(method)
+        self._check_tie_break(tie_break)
+        ctx = self._metric_context((weights or {}) if method == 'weighted' else None)
+        if groups is not None:
+            groups = self._normalize_groups(groups)
+        # 근사 검색은 대분류 필터가 없을 때 euclidean/cosine에만 사용
+        use_ann = self.ann is not None and groups is None and method in ANN_METHODS
+        if use_ann:
+            n_probe = int(n_probe or self.n_probe)
+        
+        # 같은 점수 벡터로 요청된 적이 있으면 캐시된 결과 반환
+        cache_key = make_key((user_scores.get(dim, 0.0) for dim in DIMENSIONS), method, top_n)
+        if ctx.weights is not None:
+            cache_key += (tuple(ctx.weights.tolist()),)
+        if groups is not None:
+            cache_key += (('groups',) + groups,)
+        if use_ann:
+            cache_key += (('n_probe', n_probe),)
+        if tie_break != 'rounded':
+            cache_key += (('tie_break', tie_break),)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._copy_results(cached)
+        
         # 사용자 점수 벡터 생성
-        user_vector = {
-            'COMM': float(user_scores.get('COMM', 0.0)),
-            'RESP': float(user_scores.get('RESP', 0.0)),
-            'PROB': float(user_scores.get('PROB', 0.0)),
-            'GROW': float(user_scores.get('GROW', 0.0)),
-            'STRE': float(user_scores.get('STRE', 0.0)),
-            'ADAP': float(user_scores.get('ADAP', 0.0))
-        }
+        user_vec = self._user_vector(user_scores)
+        user_fixed = self._user_fixed(user_scores.get(dim, 0.0) for dim in DIMENSIONS)
         
-        # 각 직업과의 거리/유사도 계산
-        scored_jobs = []
-        
-        for job in self.occupations:
-            job_vector = {
-                'COMM': float(job.get('COMM', 0.0)),
-                'RESP': float(job.get('RESP', 0.0)),
-                'PROB': float(job.get('PROB', 0.0)),
-                'GROW': float(job.get('GROW', 0.0)),
-                'STRE': float(job.get('STRE', 0.0)),
-                'ADAP': float(job.get('ADAP', 0.0))
-            }
-            
+        # 전체 직업과의 거리/유사도를 한 번의 벡터 연산으로 계산
+        if groups is not None:  # 선택된 대분류 구간만 계산
+            matrix, norms, rows = self._select_partitions(groups)
+            scores = self._scan_scores(method, matrix, user_vec, ctx._replace(norms=norms), user_fixed)
+            candidates = rows[self._top_k(scores, top_n, descending=metric.descending)]
+        elif use_ann:  # 가까운 군집의 직업만 계산
+            matrix, norms, rows = self.ann.candidates(user_vec, n_probe, method)
+            scores = self._scan_scores(method, matrix, user_vec, ctx._replace(norms=norms), user_fixed)
+            candidates = rows[self._top_k(scores, top_n, descending=metric.descending)]
+        elif method == 'euclidean' and self.tree is not None:  # 트리 인덱스
+            candidates = self._tree_top_k(user_vec, top_n)
+        else:
+            scores = self._scan_scores(method, self.score_matrix, user_vec, ctx, user_fixed)
+            candidates = self._top_k(scores, top_n, descending=metric.descending)
+        
+        results = self._rank_candidates(user_scores, candidates, method, ctx, top_n, tie_break)
+        self.cache.put(cache_key, results)
+        return self._copy_results(results)
+    
+    def recommend_batch(
+        self,
+        user_matrix: np.ndarray,
+        top_n: int = 10,
+        method: str = 'cosine',
+        weights: Dict[str, float] = None,
+        chunk_size: int = 1024,
+        groups: Sequence[str] = None,
+        tie_break: str = 'rounded'
+    ):
+        """
+        여러 사용자의 점수 벡터(M x 6, 열 순서는 DIMENSIONS)에 대한 추천을 순서대로 생성
+        cosine은 chunk_size 행씩 행렬-행렬 곱 한 번으로 계산하므로
+        메모리는 chunk_size x 직업 수로 제한됩니다. 다른 방식은 행마다 커널을 적용합니다.
+        행별 상위 후보 선택과 후보의 정확한 값 계산도 chunk 단위로 한 번에 하고,
+        k번째 값 근처에 후보가 많은 행만 한 행씩 다시 계산합니다.
+        groups가 있으면 선택된 SOC 대분류 구간만 계산합니다.
+        tie_break는 recommend_jobs와 같습니다.
+        Yields:
+            사용자별 추천 직업 리스트 (recommend_jobs와 같은 형식)
+        """
+        metric = self._get_metric(method)
+        self._check_tie_break(tie_break)
+        ctx = self._metric_context((weights or {}) if method == 'weighted' else None)
+        # 전체 스캔은 float32 행렬로, 후보 재계산은 원래 입력값(float64)으로 수행
+        user_matrix = np.asarray(user_matrix, dtype=np.float64).reshape(-1, len(DIMENSIONS))
+        if groups is not None:
+            matrix, norms, rows = self._select_partitions(self._normalize_groups(groups))
+            ctx = ctx._replace(norms=norms)
+        else:
+            matrix, norms, rows = self.score_matrix, self.score_norms, None
+        if method == 'cosine' and matrix.dtype == fixed_point.DTYPE:
+            matrix = fixed_point.dequantize(matrix)
+        
+        for start in range(0, len(user_matrix), chunk_size):
+            exact_chunk = user_matrix[start:start + chunk_size]
+            chunk = exact_chunk.astype(np.float32)
             if method == 'cosine':
-                similarity = self.cosine_similarity(user_vector, job_vector)
-                scored_jobs.append({
-                    'soc_code': job['soc_code'],
-                    'title': job['title'],
-                    'scores': job_vector,
-                    'similarity': round(similarity, 4),
-                    'distance': None
-                })
-            else:  # euclidean
-                distance = self.euclidean_distance(user_vector, job_vector)
-                scored_jobs.append({
-                    'soc_code': job['soc_code'],
-                    'title': job['title'],
-                    'scores': job_vector,
-                    'distance': round(distance, 4),
-                    'similarity': None
-                })
-        
-        # 정렬
-        if method == 'cosine':
-            scored_jobs.sort(key=lambda x: x['similarity'], reverse=True)
+                user_norms = np.linalg.norm(chunk, axis=1)
+                denom = user_norms[:, None] * norms[None, :]
+                scores = np.zeros((len(chunk), len(matrix)), dtype=np.float32)
+                np.divide(chunk @ matrix.T, denom, out=scores, where=denom > 0)
+            else:
+                # 정수 거리 제곱과 float 거리가 한 행렬에 섞이지 않도록 모든 행이 정수로 표현될 때만 정수 커널 사용
+                user_fixed = [self._user_fixed(exact_row) for exact_row in exact_chunk]
+                if any(fixed is None for fixed in user_fixed):
+                    user_fixed = [None] * len(chunk)
+                scores = np.stack([
+                    self._scan_scores(method, matrix, row, ctx, fixed)
+                    for row, fixed in zip(chunk, user_fixed)
+                ])
+            
+            candidates, overflow = self._top_k_rows(scores, top_n, descending=metric.descending)
+            if rows is not None:
+                candidates = rows[candidates]
+            exact_rows = self._exact_rows(candidates)
+            exact_scores = _exact_scores(method, exact_rows, exact_chunk, ctx)
+            order = self._order_rows(candidates, exact_scores, metric.descending, top_n, tie_break)
+            width = order.shape[1]
+            picked = (np.arange(len(order))[:, None], order)
+            results = self._build_results(
+                candidates[picked].ravel(), _round_scores(exact_scores[picked]).ravel(),
+                exact_rows[picked].reshape(-1, len(DIMENSIONS)), metric.result_key
+            )
+            
+            for i, row in enumerate(exact_chunk):
+                if not overflow[i]:
+                    yield results[i * width:(i + 1) * width]
+                    continue
+                row_candidates = self._top_k(scores[i], top_n, descending=metric.descending)
+                if rows is not None:
+                    row_candidates = rows[row_candidates]
+                user_scores = dict(zip(DIMENSIONS, row.tolist()))
+                yield self._rank_candidates(user_scores, row_candidates, method, ctx, top_n, tie_break)
+    
+    def _copy_results(self, results: List[Dict]) -> List[Dict]:
+        """캐시에 저장된 결과가 호출자에 의해 변경되지 않도록 복사본 반환"""
+        return [dict(job, scores=dict(job['scores'])) for job in results]
+    
+    def find_jobs_within(self, user_scores: Dict[str, float], radius: float) -> List[Dict]:
+        """
+        유클리드 거리 radius 이내의 모든 직업 반환
+        Args:
+            user_scores: 사용자의 6개 성향 점수
+            radius: 최대 유클리드 거리
+        Returns:
+            반경 내 직업 리스트 (거리 순으로 정렬)
+        """
+        if not self.occupations:
+            return []
+        
+        user_vec = self._user_vector(user_scores)
+        ctx = self._metric_context()
+        if self.tree is not None:
+            candidates = self.tree.query_radius(
+                user_vec.astype(np.float64)[None, :], r=radius + RANK_TOLERANCE
+            )[0]
         else:
-            scored_jobs.sort(key=lambda x: x['distance'])
+            distances = self._scan_scores('euclidean', self.score_matrix, user_vec, ctx)
+            candidates = np.flatnonzero(distances <= radius + RANK_TOLERANCE)
+        
+        results = self._rank_candidates(user_scores, candidates, 'euclidean', ctx, len(candidates))
+        return [job for job in results if job['distance'] <= radius]
+    
+    def _tree_top_k(self, user_vec: np.ndarray, top_n: int) -> np.ndarray:
+        """트리 인덱스로 k-최근접 후보 선택 (k번째 거리 + 허용 오차 반경 내 직업 포함)"""
+        k = min(max(int(top_n), 0), len(self.occupations))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        query = user_vec.astype(np.float64)[None, :]
+        distances, _ = self.tree.query(query, k=k)
+        return self.tree.query_radius(query, r=distances[0, -1] + RANK_TOLERANCE)[0]
+    
+    def _rank_candidates(
+        self,
+        user_scores: Dict[str, float],
+        candidates: np.ndarray,
+        method: str,
+        ctx: MetricContext,
+        top_n: int,
+        tie_break: str = 'rounded'
+    ) -> List[Dict]:
+        """
+        후보 직업에 대해서만 원본 점수로 정확한 값(float64)을 다시 계산하여 정렬 후 Top N 반환
+        tie_break='rounded'면 반올림한 값, 'exact'면 반올림 전 값으로 정렬 (동점이면 원본 순서)
+        """
+        if len(candidates) == 0:
+            return []
         
-        # Top N 반환
-        return scored_jobs[:top_n]
+        metric = METRICS[method]
+        user_vec = np.array([float(user_scores.get(dim, 0.0)) for dim in DIMENSIONS])
+        exact_rows = self._exact_rows(candidates)
+        exact_scores = _exact_scores(method, exact_rows, user_vec, ctx)
+        order = self._order_rows(candidates[None, :], exact_scores[None, :], metric.descending, top_n, tie_break)[0]
+        return self._build_results(
+            candidates[order], _round_scores(exact_scores[order]), exact_rows[order], metric.result_key
+        )
+    
+    def _exact_rows(self, candidates: np.ndarray) -> np.ndarray:
+        """후보 직업(인덱스 배열)의 float64 점수 (..., 6), 결과 dict의 scores와 같은 값"""
+        if isinstance(self.occupations, ArtifactOccupations):
+            return self.occupations.score_rows(candidates)
+        values = [
+            [float(self.occupations[i].get(dim, 0.0)) for dim in DIMENSIONS]
+            for i in np.ravel(candidates).tolist()
+        ]
+        return np.array(values, dtype=np.float64).reshape(np.shape(candidates) + (len(DIMENSIONS),))
+    
+    def _order_rows(
+        self,
+        candidates: np.ndarray,
+        exact_scores: np.ndarray,
+        descending: bool,
+        top_n: int,
+        tie_break: str
+    ) -> np.ndarray:
+        """
+        행마다 후보(M x C)를 정확한 값으로 정렬하여 Top N의 후보 위치(M x n) 반환
+        tie_break='rounded'면 반올림한 값, 'exact'면 반올림 전 값 기준 (동점이면 원본 순서)
+        """
+        rank_values = _round_scores(exact_scores) if tie_break == 'rounded' else exact_scores
+        return np.lexsort((candidates, -rank_values if descending else rank_values))[:, :max(int(top_n), 0)]
+    
+    def _build_results(
+        self,
+        indices: np.ndarray,
+        values: np.ndarray,
+        score_rows: np.ndarray,
+        result_key: str
+    ) -> List[Dict]:
+        """직업 인덱스, 반올림한 값, 점수 행(float64)으로 추천 결과 dict 리스트 생성"""
+        if isinstance(self.occupations, ArtifactOccupations):
+            jobs = self.occupations.records(indices, score_rows)
+        else:
+            jobs = [self.occupations[i] for i in indices.tolist()]
+        return [self._build_result(job, value, result_key) for job, value in zip(jobs, values.tolist())]
+    
+    def _build_result(self, job: Dict, score: float, result_key: str) -> Dict:
+        """추천 결과 dict 생성"""
+        result = {
+            'soc_code': job['soc_code'],
+            'title': job['title'],
+            'scores': {dim: float(job.get(dim, 0.0)) for dim in DIMENSIONS},
+            'distance': None,
+            'similarity': None,
+        }
+        if 'title_ko' in job:
+            result['title_ko'] = job['title_ko']
+        result[result_key] = score
+        return result
     
     def get_job_details(self, soc_code: str) -> Dict:
         """특정 직업의 상세 정보 반환"""
-        for job in self.occupations:
-            if job['soc_code'] == soc_code:
-                return job
-        return None
+        index = self.soc_index.get(soc_code)
+        return None if index is None else self.occupations[index]
+    
+    @property
+    def related_table(self) -> np.ndarray:
+        """관련 직업 이웃 인덱스 (N x k)"""
+        if self._related is None:
+            self._related = compute_related(self._float_matrix())
+        return self._related
+    
+    def get_related_jobs(self, soc_code: str, top_n: int = RELATED_TOP_K) -> List[Dict]:
+        """
+        특정 직업과 비슷한 직업 반환 (미리 계산된 테이블의 한 행만 읽음)
+        Args:
+            soc_code: 직업 코드
+            top_n: 반환할 개수 (테이블에 저장된 개수까지)
+        Returns:
+            코사인 유사도 순 관련 직업 리스트 (없는 코드면 None)
+        """
+        index = self.soc_index.get(soc_code)
+        if index is None:
+            return None
+        
+        rows = np.asarray(self.related_table[index][:max(int(top_n), 0)], dtype=np.intp)
+        similarities = self._cosine_rows(index, rows)
+        return [
+            self._build_result(self.occupations[int(i)], round(float(similarity), SCORE_DECIMALS), 'similarity')
+            for i, similarity in zip(rows, similarities)
+        ]
+    
+    def _cosine_rows(self, index: int, rows: np.ndarray) -> np.ndarray:
+        """
+        직업 index와 rows 직업들의 코사인 유사도 (float32)
+        관련 직업 테이블에는 인덱스만 저장하므로 표시할 값은 점수 행렬로 계산
+        """
+        vectors = self.score_matrix[np.append(rows, index)]
+        if self.storage == 'fixed_point':
+            vectors = fixed_point.dequantize(vectors)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        neighbors, target = vectors[:-1], vectors[-1]
+        norms = np.linalg.norm(neighbors, axis=1) * np.linalg.norm(target)
+        return np.divide(neighbors @ target, norms, out=np.zeros(len(rows), dtype=np.float32), where=norms > 0)
+    
+    def get_jobs_details(self, soc_codes: List[str]) -> List[Dict]:
+        """
+        여러 직업의 상세 정보를 한 번에 반환
+        Args:
+            soc_codes: 직업 코드 리스트
+        Returns:
+            요청 순서와 같은 순서의 상세 정보 리스트 (없는 코드는 None)
+        """
+        return [self.get_job_details(code) for code in soc_codes]
 
 
 # 전역 인스턴스 (싱글톤 패턴)
-_recommender_instance = None
+# 데이터 파일이 바뀌면 백그라운드에서 새 JobRecommender를 만들어 교체합니다. (snapshot.py 참고)
+_recommender_holder = None
+
+
+def _default_source() -> Path:
+    """기본 데이터 원본 (아티팩트가 있으면 아티팩트 디렉토리, 없으면 JSON 파일)"""
+    return ARTIFACT_DIR if artifact_exists(ARTIFACT_DIR) else OCCUPATION_SCORES_FILE
+
+
+def get_recommender_holder() -> SnapshotHolder:
+    """JobRecommender 스냅샷 보관소 반환"""
+    global _recommender_holder
+    if _recommender_holder is None:
+        source = _default_source()
+        index_type = os.getenv('JOB_RECOMMENDER_INDEX', 'brute')
+        n_probe = int(os.getenv('JOB_RECOMMENDER_PROBES', DEFAULT_PROBES))
+        storage = os.getenv('JOB_RECOMMENDER_STORAGE', 'float32')
+        _recommender_holder = SnapshotHolder(
+            loader=lambda: JobRecommender(source, index_type=index_type, n_probe=n_probe, storage=storage),
+            sources=[source],
+            check_interval=float(os.getenv('JOB_RECOMMENDER_RELOAD_INTERVAL', DEFAULT_CHECK_INTERVAL)),
+        )
+    return _recommender_holder
 
 
 def get_recommender() -> JobRecommender:
-    """JobRecommender 싱글톤 인스턴스 반환"""
-    global _recommender_instance
-    if _recommender_instance is None:
-        _recommender_instance = JobRecommender()
-    return _recommender_instance
+    """
+    현재 JobRecommender 인스턴스 반환
+    요청 하나를 처리하는 동안에는 반환받은 인스턴스를 계속 사용해야 같은 데이터로 끝납니다.
+    """
+    return get_recommender_holder().get()
 
 
 # 테스트 코드
@@ -0,0 +1,79 @@
+"""
+직업 추천 거리/유사도 커널
+
+모든 커널은 직업 점수 행렬 전체(N x 6)와 사용자 벡터 하나를 받아
+직업별 점수 배열(N,)을 한 번의 벡터 연산으로 계산합니다.
+JobRecommender는 method 이름으로 METRICS에서 커널을 찾아 사용하므로,
+새 방식은 커널 함수를 만들고 METRICS에 등록하기만 하면 됩니다.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+
+class MetricContext(NamedTuple):
+    """커널이 사용하는 로드 시 계산값과 요청별 파라미터"""
+    norms: Optional[np.ndarray] = None           # 직업 행렬의 행 노름 (cosine)
+    weights: Optional[np.ndarray] = None         # 차원별 가중치 (weighted)
+    inv_cov_factor: Optional[np.ndarray] = None  # 공분산 역행렬의 Cholesky 인자 (mahalanobis)
+
+
+class Metric(NamedTuple):
+    """거리/유사도 방식 정의"""
+    kernel: Callable[[np.ndarray, np.ndarray, MetricContext], np.ndarray]
+    descending: bool   # True면 값이 클수록 유사 (유사도), False면 작을수록 유사 (거리)
+    result_key: str    # 추천 결과 dict에서 값을 담는 키 ('distance' 또는 'similarity')
+
+
+def euclidean(matrix: np.ndarray, user_vec: np.ndarray, ctx: MetricContext) -> np.ndarray:
+    """유클리드 거리"""
+    diff = matrix - user_vec
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+
+def cosine(matrix: np.ndarray, user_vec: np.ndarray, ctx: MetricContext) -> np.ndarray:
+    """코사인 유사도 (사용자 또는 직업 벡터의 노름이 0이면 0.0)"""
+    norms = ctx.norms if ctx.norms is not None else np.linalg.norm(matrix, axis=1)
+    user_norm = float(np.linalg.norm(user_vec))
+    if user_norm == 0.0:
+        return np.zeros(len(matrix), dtype=matrix.dtype)
+    dots = matrix @ user_vec
+    denom = norms * user_norm
+    sims = np.zeros_like(dots)
+    np.divide(dots, denom, out=sims, where=denom > 0)
+    return sims
+
+
+def weighted_euclidean(matrix: np.ndarray, user_vec: np.ndarray, ctx: MetricContext) -> np.ndarray:
+    """차원별 가중치를 곱한 유클리드 거리 sqrt(sum(w * (x - u)^2))"""
+    diff = matrix - user_vec
+    return np.sqrt(np.einsum('ij,ij,j->i', diff, diff, ctx.weights.astype(matrix.dtype)))
+
+
+def mahalanobis(matrix: np.ndarray, user_vec: np.ndarray, ctx: MetricContext) -> np.ndarray:
+    """
+    마할라노비스 거리 sqrt((x - u)^T S^-1 (x - u))
+    S^-1 = L L^T 일 때 ||(x - u) L|| 과 같으므로 한 번의 행렬 곱으로 계산합니다.
+    """
+    projected = (matrix - user_vec) @ ctx.inv_cov_factor.astype(matrix.dtype)
+    return np.sqrt(np.einsum('ij,ij->i', projected, projected))
+
+
+def inverse_covariance_factor(matrix: np.ndarray) -> Optional[np.ndarray]:
+    """직업 점수 공분산 역행렬의 Cholesky 인자 (직업이 2개 미만이면 None)"""
+    if len(matrix) < 2:
+        return None
+    cov = np.cov(np.asarray(matrix, dtype=np.float64), rowvar=False)
+    # 공분산이 특이행렬인 경우를 대비해 유사 역행렬 사용 후 대각 보정
+    inv_cov = np.linalg.pinv(cov)
+    inv_cov += np.eye(len(inv_cov)) * 1e-9
+    return np.linalg.cholesky(inv_cov)
+
+
+METRICS: Dict[str, Metric] = {
+    'euclidean': Metric(euclidean, descending=False, result_key='distance'),
+    'cosine': Metric(cosine, descending=True, result_key='similarity'),
+    'weighted': Metric(weighted_euclidean, descending=False, result_key='distance'),
+    'mahalanobis': Metric(mahalanobis, descending=False, result_key='distance'),
+}
@@ -0,0 +1,248 @@
+"""
+직업 점수 바이너리 아티팩트 (memory-map 전용)
+
+occupation_scores.json은 워커마다 JSON 파싱 후 dict 리스트로 메모리에 올라갑니다.
+이 모듈은 같은 데이터를 mmap으로 바로 열 수 있는 형태로 저장/로드합니다.
+여러 gunicorn 워커가 같은 파일을 열면 OS 페이지 캐시를 공유하므로 추가 복사가 없고,
+시작 시 JSON 파싱도 하지 않습니다.
+
+디렉토리 구성 (occupation_artifact/):
+- meta.json               : 버전, 직업 수, 차원 순서
+- scores.npy              : 점수 행렬 (N x 6, float32)
+- soc_codes.bin/.idx.npy  : UTF-8 문자열을 이어붙인 blob + 시작 위치(offset) 배열 (N+1, int64)
+- titles_en.bin/.idx.npy  : 영어 직업명
+- titles_ko.bin/.idx.npy  : 한국어 직업명 (번역이 없으면 영어 직업명)
+- related_indices.npy     : 직업별 관련 직업 인덱스 (N x k, int32, related_jobs.py 참고)
+"""
+
+import csv
+import json
+import mmap
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    from .related_jobs import RELATED_TOP_K, compute_related
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from related_jobs import RELATED_TOP_K, compute_related
+
+BASE_DIR = Path(__file__).resolve().parent
+ARTIFACT_DIR = BASE_DIR / "occupation_artifact"
+
+ARTIFACT_VERSION = 1
+DIMENSIONS = ['COMM', 'RESP', 'PROB', 'GROW', 'STRE', 'ADAP']
+
+# onet_parser가 점수를 소수 2자리로 반올림하여 저장하므로,
+# float32로 저장된 값을 같은 자릿수로 반올림하면 원래 값이 그대로 복원됩니다.
+SCORE_DECIMALS = 2
+
+STRING_TABLES = ('soc_codes', 'titles_en', 'titles_ko')
+
+
+# ----------------------
+#   저장
+# ----------------------
+def _replace_file(path: Path, write):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체
+    기존 파일을 mmap으로 열고 있는 워커는 이전 inode를 계속 보므로 (truncate로 인한 SIGBUS 없음)
+    다시 로드하기 전까지 안전하게 이전 데이터를 사용할 수 있습니다.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _write_string_table(output_dir: Path, name: str, values: List[str]):
+    """문자열 리스트를 blob + offset 배열로 저장"""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    _replace_file(output_dir / f"{name}.bin", lambda f: f.write(b''.join(encoded)))
+    _replace_file(output_dir / f"{name}.idx.npy", lambda f: np.save(f, offsets))
+
+
+def write_artifact(
+    results: List[Dict],
+    titles_ko: Optional[Dict[str, str]] = None,
+    output_dir: Path = ARTIFACT_DIR,
+    related_top_k: int = RELATED_TOP_K
+) -> Path:
+    """
+    직업 점수 결과를 아티팩트 디렉토리로 저장
+    Args:
+        results: onet_parser.calculate_occupation_scores() 결과 (또는 occupation_scores.json 내용)
+        titles_ko: soc_code -> 한국어 직업명
+        output_dir: 저장할 디렉토리
+        related_top_k: 직업별로 미리 계산해 둘 관련 직업 개수
+    Returns:
+        저장된 디렉토리 경로
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    titles_ko = titles_ko or {}
+
+    scores = np.array(
+        [[float(job.get(dim, 0.0)) for dim in DIMENSIONS] for job in results],
+        dtype=np.float32,
+    ).reshape(-1, len(DIMENSIONS))
+    _replace_file(output_dir / "scores.npy", lambda f: np.save(f, np.ascontiguousarray(scores)))
+
+    _write_string_table(output_dir, 'soc_codes', [job['soc_code'] for job in results])
+    _write_string_table(output_dir, 'titles_en', [job['title'] for job in results])
+    _write_string_table(
+        output_dir, 'titles_ko',
+        [titles_ko.get(job['soc_code'], job['title']) for job in results]
+    )
+
+    # 관련 직업 이웃 테이블 (직업 간 코사인 유사도 상위 k개)
+    related_indices = compute_related(scores, related_top_k)
+    _replace_file(output_dir / "related_indices.npy", lambda f: np.save(f, related_indices))
+
+    # meta.json은 마지막에 기록 (이 파일이 있으면 아티팩트가 완성된 것으로 간주)
+    meta = {
+        'version': ARTIFACT_VERSION,
+        'count': len(results),
+        'dimensions': DIMENSIONS,
+        'score_decimals': SCORE_DECIMALS,
+        'related_top_k': int(related_indices.shape[1]),
+    }
+    _replace_file(
+        output_dir / "meta.json",
+        lambda f: f.write(json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'))
+    )
+
+    return output_dir
+
+
+def read_korean_titles(kr_csv_path: Path) -> Dict[str, str]:
+    """번역된 CSV(occupation_scores_kr.csv)에서 soc_code -> 한국어 직업명 읽기"""
+    titles = {}
+    if not Path(kr_csv_path).exists():
+        return titles
+    with open(kr_csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            titles[row['soc_code']] = row['title']
+    return titles
+
+
+# ----------------------
+#   로드
+# ----------------------
+class StringTable(Sequence):
+    """mmap된 blob에서 offset으로 문자열을 꺼내는 읽기 전용 시퀀스"""
+
+    def __init__(self, blob_path: Path, offsets_path: Path):
+        # memmap 원소 접근은 파이썬 수준 오버헤드가 있어서 같은 메모리를 보는 ndarray로 사용
+        self.offsets = np.load(offsets_path, mmap_mode='r').view(np.ndarray)
+        with open(blob_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._blob = b''
+            else:
+                self._blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        count = len(self.offsets) - 1
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(index)
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self._blob[start:end].decode('utf-8')
+
+    def __iter__(self):
+        # 전체 순회 시에는 offset 배열을 한 번에 변환하여 원소별 numpy 접근을 피함
+        offsets = self.offsets.tolist()
+        blob = self._blob
+        for start, end in zip(offsets, offsets[1:]):
+            yield blob[start:end].decode('utf-8')
+
+
+class OccupationArtifact:
+    """아티팩트 디렉토리를 mmap으로 연 결과"""
+
+    def __init__(self, artifact_dir: Path = ARTIFACT_DIR):
+        artifact_dir = Path(artifact_dir)
+        with open(artifact_dir / "meta.json", 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != ARTIFACT_VERSION:
+            raise ValueError(f"지원하지 않는 아티팩트 버전입니다: {self.meta.get('version')}")
+
+        # 읽기 전용 memory-map (워커 간 페이지 공유)
+        self.scores = np.load(artifact_dir / "scores.npy", mmap_mode='r')
+        for name in STRING_TABLES:
+            setattr(self, name, StringTable(
+                artifact_dir / f"{name}.bin", artifact_dir / f"{name}.idx.npy"
+            ))
+
+        # 관련 직업 테이블 (이전 빌드의 아티팩트에는 없을 수 있음)
+        self.related_indices = None
+        if (artifact_dir / "related_indices.npy").exists():
+            self.related_indices = np.load(artifact_dir / "related_indices.npy", mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+class ArtifactOccupations(Sequence):
+    """
+    아티팩트를 occupation_scores.json과 같은 dict 리스트처럼 사용하기 위한 시퀀스
+    레코드 dict는 접근할 때만 만들어지므로 전체 직업 목록을 메모리에 올리지 않습니다.
+    """
+
+    def __init__(self, artifact: OccupationArtifact):
+        self.artifact = artifact
+        self.soc_codes = artifact.soc_codes
+        self._scores = artifact.scores.view(np.ndarray)  # mmap 메모리를 그대로 보는 ndarray
+
+    def __len__(self) -> int:
+        return len(self.artifact)
+
+    def __getitem__(self, index: int) -> Dict:
+        return self._record(index, self.score_rows(index).tolist())
+
+    def records(self, indices: np.ndarray, score_rows: Optional[np.ndarray] = None) -> List[Dict]:
+        """여러 직업의 레코드 dict (점수는 한 번에 변환, 이미 읽은 score_rows가 있으면 그대로 사용)"""
+        if score_rows is None:
+            score_rows = self.score_rows(indices)
+        return [self._record(i, row) for i, row in zip(indices.tolist(), score_rows.tolist())]
+
+    def _record(self, index: int, scores: List[float]) -> Dict:
+        job = {
+            'soc_code': self.artifact.soc_codes[index],
+            'title': self.artifact.titles_en[index],
+            'title_ko': self.artifact.titles_ko[index],
+        }
+        job.update(zip(DIMENSIONS, scores))
+        return job
+
+    def score_rows(self, indices) -> np.ndarray:
+        """indices 직업의 점수 (float64, 저장 시 자릿수로 반올림하여 원래 값 복원, 레코드 dict와 같은 값)"""
+        return np.round(self._scores[indices].astype(np.float64), SCORE_DECIMALS)
+
+
+def artifact_exists(artifact_dir: Path = ARTIFACT_DIR) -> bool:
+    """완성된 아티팩트가 있는지 확인"""
+    return (Path(artifact_dir) / "meta.json").exists()
+
+
+def load_artifact(artifact_dir: Path = ARTIFACT_DIR) -> OccupationArtifact:
+    """아티팩트를 mmap으로 열기"""
+    return OccupationArtifact(artifact_dir)
+
+
+# 현재 JSON/CSV 파일로 아티팩트 다시 만들기
+if __name__ == '__main__':
+    with open(BASE_DIR / "occupation_scores.json", 'r', encoding='utf-8') as f:
+        results = json.load(f)
+
+    output_dir = write_artifact(results, read_korean_titles(BASE_DIR / "occupation_scores_kr.csv"))
+    print(f"아티팩트 저장 완료: {output_dir} ({len(results)}개 직업)")
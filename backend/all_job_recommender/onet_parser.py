@@ -11,24 +11,72 @@ O*NET 데이터 파싱 및 직업별 6개 성향 점수 계산 스크립트
 """
 
 import os
+import io
 import csv
 import json
-from collections import defaultdict
+import argparse
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    from .occupation_artifact import read_korean_titles, write_artifact
+except ImportError:  # 스크립트로 직접 실행하는 경우 (python onet_parser.py)
+    from occupation_artifact import read_korean_titles, write_artifact
+
 # 프로젝트 루트 경로
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 ONET_DATA_DIR = BASE_DIR / "db_30_0_text"
+OCCUPATION_DATA_FILE = "Occupation Data.txt"
+
+DIMENSIONS = ['COMM', 'RESP', 'PROB', 'GROW', 'STRE', 'ADAP']
+
+# O*NET 항목 -> 성향 매핑 표
+ELEMENT_MAPPING_FILE = Path(__file__).resolve().parent / "element_mapping.json"
+
+# 병렬 파싱 시 파일을 나누는 구간 크기 (바이트)
+CHUNK_BYTES = 4 * 1024 * 1024
+# 병렬 파싱 시 프로세스당 동시에 맡기는 구간 수 (완료된 구간 결과가 쌓이지 않도록 제한)
+PENDING_CHUNKS_PER_JOB = 2
+
+
+def iter_tsv_rows(filepath):
+    """TSV 파일을 한 행씩 딕셔너리로 반환 (파일 전체를 메모리에 올리지 않음)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f, delimiter='\t')
 
 
 def parse_tsv_file(filepath):
     """TSV 파일을 파싱하여 딕셔너리 리스트로 반환"""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        for row in reader:
-            data.append(row)
-    return data
+    return list(iter_tsv_rows(filepath))
+
+
+def new_accumulator():
+    """성향 점수 누적값 [합계, 개수]"""
+    return [0.0, 0]
+
+
+def accumulate(acc, score):
+    """
+    점수를 누적
+    파일 순서대로 한 값씩 더하므로, 기존처럼 점수 목록을 모아 sum()한 값과 같음 (Python 3.11 이하의 왼쪽부터 더하는 sum())
+    """
+    acc[0] += score
+    acc[1] += 1
+
+
+def merge_scores(acc, scores):
+    """구간에서 읽은 점수 목록을 순서대로 누적 (구간을 파일 순서대로 합치면 한 번에 읽은 것과 같은 합계)"""
+    for score in scores:
+        accumulate(acc, score)
+
+
+def accumulated_mean(acc):
+    """누적된 점수의 평균 (점수가 없으면 0.0)"""
+    total, count = acc
+    if not count:
+        return 0.0
+    return total / count
 
 
 def normalize_score(value_str, scale_id='IM'):
@@ -49,18 +97,135 @@ def normalize_score(value_str, scale_id='IM'):
         return None
 
 
-def calculate_occupation_scores():
+def load_element_mapping(path=ELEMENT_MAPPING_FILE):
+    """
+    O*NET 항목 -> 성향 매핑 표 로드
+    표는 (파일, Domain Source, Element Name) -> 성향 목록이며, 코드 수정 없이 JSON 파일만 바꾸면 됩니다.
+    Returns:
+        {파일명: {(Domain Source, Element Name): (성향, ...)}} (파일 순서대로 점수가 누적됩니다)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    
+    mapping = {}
+    for filename, domains in raw.items():
+        routes = {}
+        for domain_source, elements in domains.items():
+            for element_name, dimensions in elements.items():
+                unknown = [dim for dim in dimensions if dim not in DIMENSIONS]
+                if unknown:
+                    raise ValueError(f"{path}: 알 수 없는 성향입니다: {filename} / {element_name} -> {unknown}")
+                routes[(domain_source, element_name)] = tuple(dimensions)
+        mapping[filename] = routes
+    return mapping
+
+
+def read_tsv_header(filepath):
+    """TSV 파일의 헤더(컬럼명 목록)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return next(csv.reader(f, delimiter='\t'), [])
+
+
+def split_tsv_file(filepath, chunk_bytes=CHUNK_BYTES):
+    """
+    TSV 파일의 데이터 행을 행 경계 기준 바이트 구간으로 나눔 (헤더 제외)
+    Returns:
+        [(시작, 끝), ...] 파일 순서
+    """
+    size = os.path.getsize(filepath)
+    chunks = []
+    with open(filepath, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()  # 행 끝까지 이동
+            end = min(f.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def collect_chunk_scores(task):
+    """
+    파일 한 구간의 행을 읽어 직업별·성향별 점수를 누적 (워커 프로세스에서 실행)
+    Args:
+        task: (파일명, 파일 경로, 헤더, 시작, 끝, 해당 파일의 매핑 표)
+    Returns:
+        {soc_code: {성향: 점수 목록}} (구간 안의 행 순서, 메모리는 구간 크기로 제한)
+    """
+    _, filepath, header, start, end, routes = task
+    
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # open(..., 'r')과 같은 줄바꿈 처리로 읽음
+    text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')
+    
+    chunk_scores = {}
+    for row in csv.DictReader(text, fieldnames=header, delimiter='\t'):
+        # (Domain Source, Element Name) 한 번의 조회로 반영할 성향 결정 (표에 없으면 건너뜀)
+        dimensions = routes.get((row.get('Domain Source', '').strip(), row.get('Element Name', '').strip()))
+        if dimensions is None:
+            continue
+        
+        soc_code = row.get('O*NET-SOC Code', '').strip()
+        scale_id = row.get('Scale ID', '').strip()
+        data_value = row.get('Data Value', '').strip()
+        
+        score = normalize_score(data_value, scale_id)
+        if score is None:
+            continue
+        
+        for dim in dimensions:
+            chunk_scores.setdefault(soc_code, {}).setdefault(dim, []).append(score)
+    
+    return chunk_scores
+
+
+def _iter_chunk_results(executor, tasks, max_pending):
+    """
+    구간을 워커에 맡기고 결과를 작업 순서대로 반환
+    동시에 맡기는 구간은 max_pending개까지만 유지하여, 합치는 쪽이 느려도 완료된 결과가 메모리에 쌓이지 않음
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(collect_chunk_scores, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _merge_chunks(occupation_data, tasks, chunk_results):
+    """구간별 점수 목록을 작업 순서대로 누적하고, 파일의 마지막 구간이 끝나면 완료 메시지 출력"""
+    last_task = {filename: i for i, (filename, *_) in enumerate(tasks)}
+    for i, (task, chunk_scores) in enumerate(zip(tasks, chunk_results)):
+        for soc_code, dims in chunk_scores.items():
+            scores = occupation_data[soc_code]
+            for dim, values in dims.items():
+                merge_scores(scores[dim], values)
+        
+        if last_task[task[0]] == i:
+            print(f"{Path(task[0]).stem} 파싱 완료: {len(occupation_data)}개 직업")
+
+
+def calculate_occupation_scores(jobs=1, mapping_file=ELEMENT_MAPPING_FILE, data_dir=ONET_DATA_DIR):
     """
     O*NET 데이터를 읽어서 각 직업의 6개 성향 점수를 계산
+    Args:
+        jobs: 파일 파싱에 사용할 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+        mapping_file: O*NET 항목 -> 성향 매핑 표 (JSON)
+        data_dir: O*NET 텍스트 파일 디렉토리
     """
+    data_dir = Path(data_dir)
     print("O*NET 데이터 파싱 시작...")
     
     # 1. 직업 정보 로드
-    occupation_file = ONET_DATA_DIR / "Occupation Data.txt"
+    occupation_file = data_dir / OCCUPATION_DATA_FILE
     occupations = {}
     if occupation_file.exists():
-        occ_data = parse_tsv_file(occupation_file)
-        for row in occ_data:
+        for row in iter_tsv_rows(occupation_file):
             soc_code = row.get('O*NET-SOC Code', '').strip()
             title = row.get('Title', '').strip()
             if soc_code:
@@ -69,149 +234,47 @@ def calculate_occupation_scores():
     else:
         print(f"경고: {occupation_file} 파일을 찾을 수 없습니다.")
     
-    # 2. 각 직업별로 데이터 수집
-    occupation_data = defaultdict(lambda: {
-        'COMM': [],
-        'RESP': [],
-        'PROB': [],
-        'GROW': [],
-        'STRE': [],
-        'ADAP': []
-    })
-    
-    # 3. Work Styles 파일 파싱
-    work_styles_file = ONET_DATA_DIR / "Work Styles.txt"
-    if work_styles_file.exists():
-        print("Work Styles 파일 파싱 중...")
-        ws_data = parse_tsv_file(work_styles_file)
-        
-        for row in ws_data:
-            soc_code = row.get('O*NET-SOC Code', '').strip()
-            element_name = row.get('Element Name', '').strip()
-            scale_id = row.get('Scale ID', '').strip()
-            data_value = row.get('Data Value', '').strip()
-            domain_source = row.get('Domain Source', '').strip()
-            
-            # Incumbent 데이터만 사용 (더 정확함)
-            if domain_source != 'Incumbent':
-                continue
-            
-            score = normalize_score(data_value, scale_id)
-            if score is None:
-                continue
-            
-            # COMM: 커뮤니케이션·협업
-            if element_name in ['Cooperation', 'Social Orientation']:
-                occupation_data[soc_code]['COMM'].append(score)
-            
-            # RESP: 책임감·성실성
-            if element_name in ['Integrity', 'Dependability', 'Attention to Detail', 'Persistence']:
-                occupation_data[soc_code]['RESP'].append(score)
-            
-            # STRE: 스트레스·정서안정
-            if element_name in ['Stress Tolerance', 'Self-Control']:
-                occupation_data[soc_code]['STRE'].append(score)
-            
-            # ADAP: 조직적응·대인관계
-            if element_name in ['Adaptability/Flexibility']:
-                occupation_data[soc_code]['ADAP'].append(score)
-        
-        print(f"Work Styles 파싱 완료: {len(occupation_data)}개 직업")
-    else:
-        print(f"경고: {work_styles_file} 파일을 찾을 수 없습니다.")
+    # 2. 각 직업별로 데이터 수집 (점수 목록 대신 성향별 합계와 개수만 유지)
+    occupation_data = defaultdict(lambda: {dim: new_accumulator() for dim in DIMENSIONS})
     
-    # 4. Skills 파일 파싱
-    skills_file = ONET_DATA_DIR / "Skills.txt"
-    if skills_file.exists():
-        print("Skills 파일 파싱 중...")
-        skills_data = parse_tsv_file(skills_file)
-        
-        for row in skills_data:
-            soc_code = row.get('O*NET-SOC Code', '').strip()
-            element_name = row.get('Element Name', '').strip()
-            scale_id = row.get('Scale ID', '').strip()
-            data_value = row.get('Data Value', '').strip()
-            domain_source = row.get('Domain Source', '').strip()
-            
-            # Analyst 데이터 사용
-            if domain_source != 'Analyst':
-                continue
-            
-            score = normalize_score(data_value, scale_id)
-            if score is None:
-                continue
-            
-            # COMM: 커뮤니케이션·협업
-            if element_name in ['Speaking', 'Active Listening', 'Coordination', 'Oral Expression']:
-                occupation_data[soc_code]['COMM'].append(score)
-            
-            # PROB: 문제해결·논리
-            if element_name in ['Critical Thinking', 'Complex Problem Solving']:
-                occupation_data[soc_code]['PROB'].append(score)
-            
-            # GROW: 성장지향·학습의지
-            if element_name in ['Learning Strategies', 'Active Learning']:
-                occupation_data[soc_code]['GROW'].append(score)
-            
-            # ADAP: 조직적응·대인관계
-            if element_name in ['Social Perceptiveness', 'Service Orientation', 'Persuasion']:
-                occupation_data[soc_code]['ADAP'].append(score)
-        
-        print(f"Skills 파싱 완료")
-    else:
-        print(f"경고: {skills_file} 파일을 찾을 수 없습니다.")
+    # 3. 매핑 표의 파일(Work Styles / Skills / Abilities)을 구간별로 나누어 파싱 (jobs > 1이면 워커 프로세스에서)
+    mapping = load_element_mapping(mapping_file)
+    tasks = []
+    for filename, routes in mapping.items():
+        filepath = data_dir / filename
+        if not filepath.exists():
+            print(f"경고: {filepath} 파일을 찾을 수 없습니다.")
+            continue
+        print(f"{Path(filename).stem} 파일 파싱 중...")
+        header = read_tsv_header(filepath)
+        tasks.extend(
+            (filename, str(filepath), header, start, end, routes)
+            for start, end in split_tsv_file(filepath)
+        )
     
-    # 5. Abilities 파일 파싱
-    abilities_file = ONET_DATA_DIR / "Abilities.txt"
-    if abilities_file.exists():
-        print("Abilities 파일 파싱 중...")
-        abilities_data = parse_tsv_file(abilities_file)
-        
-        for row in abilities_data:
-            soc_code = row.get('O*NET-SOC Code', '').strip()
-            element_name = row.get('Element Name', '').strip()
-            scale_id = row.get('Scale ID', '').strip()
-            data_value = row.get('Data Value', '').strip()
-            domain_source = row.get('Domain Source', '').strip()
-            
-            # Analyst 데이터 사용
-            if domain_source != 'Analyst':
-                continue
-            
-            score = normalize_score(data_value, scale_id)
-            if score is None:
-                continue
-            
-            # PROB: 문제해결·논리
-            if element_name in ['Problem Sensitivity', 'Inductive Reasoning', 'Deductive Reasoning']:
-                occupation_data[soc_code]['PROB'].append(score)
-        
-        print(f"Abilities 파싱 완료")
+    # 4. 구간별 점수를 파일 순서, 구간 순서대로 누적 (더하는 순서가 같으므로 jobs와 무관하게 결과 동일)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunk_results = _iter_chunk_results(executor, tasks, jobs * PENDING_CHUNKS_PER_JOB)
+            _merge_chunks(occupation_data, tasks, chunk_results)
     else:
-        print(f"경고: {abilities_file} 파일을 찾을 수 없습니다.")
+        _merge_chunks(occupation_data, tasks, map(collect_chunk_scores, tasks))
     
-    # 6. 각 직업별로 평균 점수 계산
+    # 5. 각 직업별로 평균 점수 계산
     print("\n직업별 6개 성향 점수 계산 중...")
     results = []
     
     for soc_code, scores in occupation_data.items():
         # 각 성향별 평균 계산
-        comm_score = sum(scores['COMM']) / len(scores['COMM']) if scores['COMM'] else 0.0
-        resp_score = sum(scores['RESP']) / len(scores['RESP']) if scores['RESP'] else 0.0
-        prob_score = sum(scores['PROB']) / len(scores['PROB']) if scores['PROB'] else 0.0
-        grow_score = sum(scores['GROW']) / len(scores['GROW']) if scores['GROW'] else 0.0
-        stre_score = sum(scores['STRE']) / len(scores['STRE']) if scores['STRE'] else 0.0
-        adap_score = sum(scores['ADAP']) / len(scores['ADAP']) if scores['ADAP'] else 0.0
+        comm_score = accumulated_mean(scores['COMM'])
+        resp_score = accumulated_mean(scores['RESP'])
+        prob_score = accumulated_mean(scores['PROB'])
+        grow_score = accumulated_mean(scores['GROW'])
+        stre_score = accumulated_mean(scores['STRE'])
+        adap_score = accumulated_mean(scores['ADAP'])
         
         # 최소 3개 이상의 성향 점수가 있어야 유효한 직업으로 간주
-        valid_scores = sum([
-            len(scores['COMM']) > 0,
-            len(scores['RESP']) > 0,
-            len(scores['PROB']) > 0,
-            len(scores['GROW']) > 0,
-            len(scores['STRE']) > 0,
-            len(scores['ADAP']) > 0
-        ])
+        valid_scores = sum(scores[dim][1] > 0 for dim in DIMENSIONS)
         
         if valid_scores >= 3:
             results.append({
@@ -252,16 +315,35 @@ def save_to_csv(results, output_file='occupation_scores.csv'):
     return output_path
 
 
+def save_to_artifact(results, output_dir='occupation_artifact', kr_csv_file='occupation_scores_kr.csv'):
+    """
+    결과를 memory-map 가능한 바이너리 아티팩트로 저장 (JobRecommender가 기본으로 사용)
+    한국어 직업명은 기존 번역 CSV에서 soc_code로 찾아 넣고, 없으면 영어 직업명을 사용합니다.
+    """
+    base_dir = Path(__file__).resolve().parent
+    titles_ko = read_korean_titles(base_dir / kr_csv_file)
+    output_path = write_artifact(results, titles_ko, base_dir / output_dir)
+    print(f"아티팩트 저장 완료: {output_path}")
+    return output_path
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="O*NET 데이터 파싱 및 직업별 성향 점수 계산")
+    parser.add_argument('--jobs', type=int, default=1, help="파일 파싱에 사용할 프로세스 수 (기본값: 1)")
+    parser.add_argument('--mapping', default=str(ELEMENT_MAPPING_FILE), help="O*NET 항목 -> 성향 매핑 표 (JSON)")
+    parser.add_argument('--data-dir', default=str(ONET_DATA_DIR), help="O*NET 텍스트 파일 디렉토리")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("O*NET 데이터 파싱 및 직업별 성향 점수 계산")
     print("=" * 60)
     
-    results = calculate_occupation_scores()
+    results = calculate_occupation_scores(jobs=args.jobs, mapping_file=args.mapping, data_dir=args.data_dir)
     
     if results:
         save_to_json(results)
         save_to_csv(results)
+        save_to_artifact(results)
         print(f"\n✅ 총 {len(results)}개 직업의 성향 점수 계산 완료!")
     else:
         print("\n❌ 오류: 데이터를 계산할 수 없습니다.")
@@ -0,0 +1,81 @@
+"""
+직업 추천 결과 캐시
+
+인적성검사 점수는 1~5점 응답의 평균을 소수 2자리로 반올림한 값이라
+서로 다른 사용자도 같은 6차원 점수 벡터를 갖는 경우가 많습니다.
+(반올림된 점수 벡터, 계산 방법, 추천 개수)를 키로 결과를 저장하여
+같은 요청이 다시 들어오면 점수 계산을 건너뜁니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+# 기본 최대 저장 개수
+DEFAULT_MAXSIZE = 4096
+
+# 키 생성 시 점수 반올림 자릿수 (Assessment.calculate_result와 동일)
+SCORE_DECIMALS = 2
+
+
+def make_key(scores: Iterable[float], method: str, top_n: int) -> Tuple[Hashable, ...]:
+    """반올림된 점수 벡터, 계산 방법, 추천 개수로 캐시 키 생성"""
+    vector = tuple(round(float(v), SCORE_DECIMALS) for v in scores)
+    return (vector, method, int(top_n))
+
+
+class RecommendationCache:
+    """개수 제한이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Args:
+            maxsize: 최대 저장 개수 (0이면 캐시 비활성화)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """저장된 결과 반환 (없으면 None). 조회된 항목은 가장 최근 사용으로 이동"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """결과 저장. 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """저장된 결과와 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """적중/실패 횟수와 현재 저장 개수"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
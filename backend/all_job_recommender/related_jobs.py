@@ -0,0 +1,64 @@
+"""
+직업 간 "관련 직업" 이웃 테이블
+
+추천 결과의 직업마다 비슷한 직업 목록을 보여주기 위해, 빌드 단계에서
+모든 직업 쌍의 코사인 유사도(N x N) 중 직업별 상위 k개를 한 번만 계산해 둡니다.
+- N x N 행렬 전체를 만들지 않고 block_bytes 이내의 행 블록 단위로 계산합니다.
+- 결과는 이웃 인덱스(N x k, int32)만 저장합니다.
+  (순서는 float64로 정하며, 응답에 표시할 유사도는 조회 시 점수 행렬로 다시 계산합니다.)
+- 조회는 테이블의 한 행을 읽는 O(k) 연산입니다.
+"""
+
+import numpy as np
+
+# 직업별 저장할 관련 직업 개수
+RELATED_TOP_K = 10
+
+# 블록 하나의 유사도 행렬 최대 크기 (바이트)
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+# 저장 형식
+INDEX_DTYPE = np.int32
+
+
+def compute_related(
+    matrix: np.ndarray,
+    top_k: int = RELATED_TOP_K,
+    block_bytes: int = DEFAULT_BLOCK_BYTES
+) -> np.ndarray:
+    """
+    직업별 코사인 유사도 상위 top_k개 이웃 계산 (자기 자신 제외)
+    Args:
+        matrix: 직업 점수 행렬 (N x 6)
+        top_k: 직업별 이웃 개수 (직업 수 - 1보다 크면 줄어듦)
+        block_bytes: 한 번에 계산할 유사도 블록의 최대 크기
+    Returns:
+        이웃 인덱스 (N x k, int32), 유사도 내림차순 (동점이면 인덱스 순)
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n = len(matrix)
+    k = max(min(int(top_k), n - 1), 0)
+    indices = np.zeros((n, k), dtype=INDEX_DTYPE)
+    if k == 0:
+        return indices
+
+    norms = np.linalg.norm(matrix, axis=1)
+    safe_norms = np.where(norms > 0, norms, 1.0)
+    unit = matrix / safe_norms[:, None]
+    unit[norms == 0] = 0.0  # 노름이 0인 직업과의 유사도는 0
+
+    block_rows = max(1, block_bytes // (n * unit.itemsize))
+    for start in range(0, n, block_rows):
+        end = min(start + block_rows, n)
+        sims = unit[start:end] @ unit.T
+        # 자기 자신은 후보에서 제외
+        sims[np.arange(end - start), np.arange(start, end)] = -np.inf
+
+        # 블록 전체에서 상위 k개 후보를 한 번에 고른 뒤, k번째 값과 같은 동점 직업까지 포함하여 정렬
+        kth = -np.partition(-sims, k - 1, axis=1)[:, k - 1]
+        for row, (row_sims, kth_value) in enumerate(zip(sims, kth)):
+            candidates = np.flatnonzero(row_sims >= kth_value)
+            order = np.lexsort((candidates, -row_sims[candidates]))[:k]
+            indices[start + row] = candidates[order]
+
+    return indices
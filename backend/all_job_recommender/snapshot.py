@@ -0,0 +1,178 @@
+"""
+직업 데이터 스냅샷 핫 리로드
+
+직업 데이터 파일(O*NET 점수, 번역 CSV, 아티팩트)이 교체되면 워커 재시작 없이 새 데이터로 바꿉니다.
+- 요청 처리 중에는 get()으로 현재 스냅샷 참조만 가져옵니다. (파일 확인/로드 없음)
+- check_interval초마다 백그라운드 스레드가 원본 파일의 mtime/크기를 확인하고,
+  바뀐 경우에만 내용 해시를 계산합니다.
+- 해시가 바뀌면 같은 해시가 다음 확인에서도 유지될 때(파일 쓰기가 끝났을 때) 새 스냅샷을 만들고
+  참조를 한 번에 교체합니다. 이미 이전 스냅샷을 받은 요청은 그대로 이전 데이터로 끝납니다.
+"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+# 기본 파일 확인 주기 (초)
+DEFAULT_CHECK_INTERVAL = 30.0
+
+
+class Snapshot(NamedTuple):
+    """한 번 로드된 데이터와 그 버전 정보"""
+    version: int
+    value: Any
+    fingerprint: str
+    loaded_at: float
+
+
+def _source_files(sources: List[Path]) -> List[Path]:
+    """감시 대상 파일 목록 (디렉토리는 그 안의 파일 전체)"""
+    files = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            files.extend(sorted(p for p in source.iterdir() if p.is_file()))
+        else:
+            files.append(source)
+    return files
+
+
+def stat_signature(sources: List[Path]) -> Tuple:
+    """파일별 (경로, mtime, 크기). 해시 계산 전에 변경 여부를 싸게 확인하는 용도"""
+    signature = []
+    for path in _source_files(sources):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def content_hash(sources: List[Path]) -> str:
+    """감시 대상 파일 내용 전체의 sha256"""
+    digest = hashlib.sha256()
+    for path in _source_files(sources):
+        try:
+            with open(path, 'rb') as f:
+                digest.update(path.name.encode('utf-8'))
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            continue
+    return digest.hexdigest()
+
+
+class SnapshotHolder:
+    """원본 파일이 바뀌면 백그라운드에서 다시 로드하여 교체하는 스냅샷 보관소"""
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        sources: List[Path],
+        check_interval: float = DEFAULT_CHECK_INTERVAL
+    ):
+        """
+        Args:
+            loader: 데이터를 새로 만들어 반환하는 함수 (인덱스 생성 포함)
+            sources: 감시할 파일 또는 디렉토리 목록
+            check_interval: 파일 확인 주기 (초, 0 이하면 자동 확인 안 함)
+        """
+        self.loader = loader
+        self.sources = [Path(source) for source in sources]
+        self.check_interval = check_interval
+
+        self._current: Optional[Snapshot] = None
+        self._init_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._last_check = 0.0
+        self._signature = None
+        self._pending_fingerprint = None
+
+    # ----------------------
+    #   조회 (요청 경로)
+    # ----------------------
+    def get(self) -> Any:
+        """현재 데이터 반환 (확인 주기가 지났으면 백그라운드 확인만 시작)"""
+        return self.snapshot().value
+
+    def snapshot(self) -> Snapshot:
+        """현재 스냅샷 반환 (버전 정보 포함)"""
+        current = self._current
+        if current is None:
+            return self._load_initial()
+
+        if self.check_interval > 0 and time.monotonic() - self._last_check >= self.check_interval:
+            self._start_background_check()
+        return current
+
+    def _load_initial(self) -> Snapshot:
+        """첫 요청 시 1회 동기 로드"""
+        with self._init_lock:
+            if self._current is None:
+                self._signature = stat_signature(self.sources)
+                self._swap(self.loader(), content_hash(self.sources))
+                self._last_check = time.monotonic()
+        return self._current
+
+    # ----------------------
+    #   확인 및 교체 (백그라운드)
+    # ----------------------
+    def _start_background_check(self):
+        """확인 스레드가 이미 돌고 있지 않을 때만 새로 시작"""
+        if not self._check_lock.acquire(blocking=False):
+            return
+        self._last_check = time.monotonic()
+        thread = threading.Thread(target=self._background_check, daemon=True)
+        thread.start()
+
+    def _background_check(self):
+        try:
+            self.check_for_updates()
+        except Exception as e:
+            print(f"경고: 직업 데이터 다시 로드 실패 (이전 데이터 유지): {e}")
+        finally:
+            self._check_lock.release()
+
+    def check_for_updates(self) -> bool:
+        """
+        원본 파일 변경을 확인하고 필요하면 새 스냅샷으로 교체
+        Returns:
+            교체했으면 True
+        """
+        signature = stat_signature(self.sources)
+        if signature == self._signature and self._pending_fingerprint is None:
+            return False
+        self._signature = signature
+
+        fingerprint = content_hash(self.sources)
+        if fingerprint == self._current.fingerprint:
+            # mtime만 바뀌고 내용은 같음 (touch, 같은 내용으로 다시 저장 등)
+            self._pending_fingerprint = None
+            return False
+
+        if fingerprint != self._pending_fingerprint:
+            # 파일을 쓰는 중일 수 있으므로 다음 확인에서 같은 내용이면 교체
+            self._pending_fingerprint = fingerprint
+            return False
+
+        self._pending_fingerprint = None
+        self._swap(self.loader(), fingerprint)
+        print(f"직업 데이터 다시 로드 완료 (version {self._current.version})")
+        return True
+
+    def reload(self) -> Snapshot:
+        """파일 변경 여부와 관계없이 즉시 다시 로드"""
+        with self._check_lock:
+            self._signature = stat_signature(self.sources)
+            self._pending_fingerprint = None
+            self._swap(self.loader(), content_hash(self.sources))
+            self._last_check = time.monotonic()
+        return self._current
+
+    def _swap(self, value: Any, fingerprint: str):
+        """새 스냅샷으로 참조 교체 (참조 대입은 원자적)"""
+        version = self._current.version + 1 if self._current is not None else 1
+        self._current = Snapshot(version, value, fingerprint, time.time())
@@ -0,0 +1,402 @@
+"""
+all_job_recommender 테스트
+- 추천 결과가 이전 구현(직업마다 dict를 만들어 전체를 정렬하는 루프)과 같은지
+- 배치 추천이 사용자마다 recommend_jobs를 호출한 결과와 같은지
+- fixed_point 저장(정수 거리 제곱)의 유클리드 추천이 float32 저장과 같은지
+- 관련 직업 테이블이 전체 코사인 유사도 순위와 같은지
+- O*NET 파서의 스트리밍 누적/구간 병렬 파싱 결과가 점수 목록을 모아 sum()으로 평균한 결과와 같은지
+
+실행:
+    cd backend
+    python manage.py test all_job_recommender
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from all_job_recommender import onet_parser
+from all_job_recommender.job_recommender import DIMENSIONS, OCCUPATION_SCORES_FILE, JobRecommender
+from all_job_recommender.occupation_artifact import ARTIFACT_DIR, artifact_exists
+from all_job_recommender.related_jobs import compute_related
+
+# 무작위 사용자 점수 개수 (질의마다 cosine/euclidean 모두 비교)
+PARITY_QUERIES = 300
+# 배치 비교 행 수 (chunk 경계가 여러 번 생기도록 BATCH_CHUNK보다 크게)
+BATCH_ROWS = 2000
+BATCH_CHUNK = 256
+# fixed_point/float32 비교 질의 수 (반올림 후 동점 후보가 누락되는 경우는 수천 개 중 몇 개라 많이 비교)
+FIXED_POINT_QUERIES = 3000
+
+
+def reference_recommend(occupations, user_scores, top_n, method, tie_break='rounded'):
+    """
+    이전 JobRecommender.recommend_jobs 루프 (직업마다 점수 계산 후 반올림한 값으로 안정 정렬)
+    tie_break='exact'면 반올림 전 값으로 안정 정렬 (이전 JobRecommendView의 순서)
+    """
+    user = [float(user_scores.get(dim, 0.0)) for dim in DIMENSIONS]
+    scored = []
+    for job in occupations:
+        values = [float(job.get(dim, 0.0)) for dim in DIMENSIONS]
+        if method == 'cosine':
+            dot = user_norm = job_norm = 0.0
+            for u, v in zip(user, values):
+                dot += u * v
+                user_norm += u ** 2
+                job_norm += v ** 2
+            similarity = 0.0 if user_norm == 0.0 or job_norm == 0.0 else dot / (math.sqrt(user_norm) * math.sqrt(job_norm))
+            scored.append((job['soc_code'], round(similarity, 4), None, -similarity))
+        else:
+            sum_squared_diff = 0.0
+            for u, v in zip(user, values):
+                sum_squared_diff += (u - v) ** 2
+            distance = math.sqrt(sum_squared_diff)
+            scored.append((job['soc_code'], None, round(distance, 4), distance))
+    if tie_break == 'exact':
+        scored.sort(key=lambda item: item[3])
+    elif method == 'cosine':
+        scored.sort(key=lambda item: item[1], reverse=True)
+    else:
+        scored.sort(key=lambda item: item[2])
+    return [item[:3] for item in scored[:top_n]]
+
+
+def random_user_scores(rng):
+    """소수 0~2자리의 무작위 점수 (정수 점수는 동점 직업이 많이 나옴)"""
+    return {dim: round(rng.uniform(1, 5), rng.choice([0, 1, 2])) for dim in DIMENSIONS}
+
+
+def sum_in_order(values):
+    """왼쪽부터 한 값씩 더한 합계 (이전 구현의 sum(): Python 3.12부터 sum()은 보정 합산이라 직접 더함)"""
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
+
+def summarize(jobs):
+    return [(job['soc_code'], job['similarity'], job['distance']) for job in jobs]
+
+
+class RecommendParityTests(unittest.TestCase):
+    """벡터 연산 추천 엔진이 이전 루프 구현과 같은 순위/값을 반환하는지"""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(OCCUPATION_SCORES_FILE, 'r', encoding='utf-8') as f:
+            cls.occupations = json.load(f)
+        cls.recommender = JobRecommender(OCCUPATION_SCORES_FILE, cache_size=0)
+
+    def test_matches_reference_loop(self):
+        rng = random.Random(0)
+        for _ in range(PARITY_QUERIES):
+            user_scores = random_user_scores(rng)
+            for method in ('cosine', 'euclidean'):
+                with self.subTest(user_scores=user_scores, method=method):
+                    self.assertEqual(
+                        summarize(self.recommender.recommend_jobs(user_scores, 10, method)),
+                        reference_recommend(self.occupations, user_scores, 10, method),
+                    )
+
+    def test_tree_indexes_match_brute_force(self):
+        """kd_tree/ball_tree 유클리드 검색이 전체 스캔과 같은 순위/거리 (반올림 후 동점 후보 포함)"""
+        variants = [
+            JobRecommender(OCCUPATION_SCORES_FILE, cache_size=0, index_type=index_type)
+            for index_type in ('kd_tree', 'ball_tree')
+        ]
+        rng = random.Random(1)
+        for _ in range(PARITY_QUERIES):
+            user_scores = random_user_scores(rng)
+            expected = summarize(self.recommender.recommend_jobs(user_scores, 10, 'euclidean'))
+            for variant in variants:
+                with self.subTest(user_scores=user_scores, index_type=variant.index_type):
+                    self.assertEqual(summarize(variant.recommend_jobs(user_scores, 10, 'euclidean')), expected)
+
+    def test_cached_results_are_copies(self):
+        """캐시된 결과를 호출자가 바꿔도 다음 응답에 영향 없음"""
+        recommender = JobRecommender(OCCUPATION_SCORES_FILE)
+        user_scores = dict(zip(DIMENSIONS, [4.5, 3.8, 4.2, 3.9, 4.1, 4.3]))
+        first = recommender.recommend_jobs(user_scores, 5, 'cosine')
+        first[0]['scores']['COMM'] = -1
+        first[0]['similarity'] = -1
+        self.assertEqual(recommender.recommend_jobs(dict(user_scores), 5, 'cosine'),
+                         self.recommender.recommend_jobs(user_scores, 5, 'cosine'))
+
+    @unittest.skipUnless(artifact_exists(ARTIFACT_DIR), "occupation_artifact가 없음")
+    def test_artifact_matches_json(self):
+        """mmap 아티팩트로 만든 엔진이 JSON으로 만든 엔진과 같은 결과/상세 정보 (아티팩트에만 있는 title_ko 제외)"""
+        def without_title_ko(job):
+            return {key: value for key, value in job.items() if key != 'title_ko'}
+
+        artifact_recommender = JobRecommender(ARTIFACT_DIR, cache_size=0)
+        self.assertEqual([without_title_ko(job) for job in artifact_recommender.occupations], self.occupations)
+        rng = random.Random(2)
+        for _ in range(PARITY_QUERIES):
+            user_scores = random_user_scores(rng)
+            for method in ('cosine', 'euclidean'):
+                with self.subTest(user_scores=user_scores, method=method):
+                    self.assertEqual(
+                        [without_title_ko(job) for job in artifact_recommender.recommend_jobs(user_scores, 10, method)],
+                        self.recommender.recommend_jobs(user_scores, 10, method),
+                    )
+
+    def test_exact_tie_break_matches_unrounded_order(self):
+        rng = random.Random(3)
+        reordered = 0
+        for _ in range(PARITY_QUERIES):
+            user_scores = random_user_scores(rng)
+            for method in ('cosine', 'euclidean'):
+                exact = summarize(self.recommender.recommend_jobs(user_scores, 10, method, tie_break='exact'))
+                with self.subTest(user_scores=user_scores, method=method):
+                    self.assertEqual(exact, reference_recommend(self.occupations, user_scores, 10, method, 'exact'))
+                reordered += exact != summarize(self.recommender.recommend_jobs(user_scores, 10, method))
+        # 반올림 후 동점인 직업이 있는 질의는 두 기준의 순서가 다름
+        self.assertGreater(reordered, 0)
+
+    def test_tie_break_is_part_of_cache_key(self):
+        recommender = JobRecommender(OCCUPATION_SCORES_FILE)
+        rng = random.Random(4)
+        for _ in range(PARITY_QUERIES):
+            user_scores = random_user_scores(rng)
+            rounded = recommender.recommend_jobs(user_scores, 10, 'cosine')
+            if rounded != recommender.recommend_jobs(user_scores, 10, 'cosine', tie_break='exact'):
+                self.assertEqual(recommender.recommend_jobs(user_scores, 10, 'cosine'), rounded)
+                return
+        self.fail("반올림 후 동점으로 순서가 달라지는 질의가 없음")
+
+    def test_rejects_unknown_tie_break(self):
+        with self.assertRaises(ValueError):
+            self.recommender.recommend_jobs(dict.fromkeys(DIMENSIONS, 3.0), 3, 'cosine', tie_break='random')
+
+
+class RecommendBatchTests(unittest.TestCase):
+    """행별 argpartition + 후보 재계산으로 만든 배치 결과가 한 명씩 추천한 결과와 같은지"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recommender = JobRecommender(OCCUPATION_SCORES_FILE, cache_size=0)
+        rng = random.Random(5)
+        cls.user_rows = [[random_user_scores(rng)[dim] for dim in DIMENSIONS] for _ in range(BATCH_ROWS)]
+
+    def assert_batch_matches_single(self, top_n, method, groups=None, tie_break='rounded'):
+        batch = self.recommender.recommend_batch(
+            np.array(self.user_rows), top_n, method, chunk_size=BATCH_CHUNK, groups=groups, tie_break=tie_break
+        )
+        for row, jobs in zip(self.user_rows, batch):
+            user_scores = dict(zip(DIMENSIONS, row))
+            with self.subTest(user_scores=user_scores, top_n=top_n, method=method, groups=groups, tie_break=tie_break):
+                self.assertEqual(
+                    jobs, self.recommender.recommend_jobs(user_scores, top_n, method, groups=groups, tie_break=tie_break)
+                )
+
+    def test_matches_single_requests(self):
+        for tie_break in ('rounded', 'exact'):
+            for method in ('cosine', 'euclidean'):
+                self.assert_batch_matches_single(3, method, tie_break=tie_break)
+        self.assert_batch_matches_single(20, 'cosine')
+
+    def test_matches_single_requests_with_groups(self):
+        for tie_break in ('rounded', 'exact'):
+            self.assert_batch_matches_single(3, 'cosine', groups=['11', '15'], tie_break=tie_break)
+
+    def test_many_ties_at_boundary(self):
+        """k번째 값과 같은 직업이 후보 폭보다 많은 행은 한 행씩 다시 계산 (점수가 같은 직업 40개)"""
+        with open(OCCUPATION_SCORES_FILE, 'r', encoding='utf-8') as f:
+            occupations = json.load(f)
+        occupations += [dict(occupations[0], soc_code=f"99-{i:04d}.00") for i in range(40)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'occupation_scores.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(occupations, f)
+            recommender = JobRecommender(path, cache_size=0)
+        user_rows = [[occupations[0][dim] for dim in DIMENSIONS], [3] * len(DIMENSIONS), [1, 2, 3, 4, 5, 1]]
+        for method in ('cosine', 'euclidean'):
+            batch = recommender.recommend_batch(np.array(user_rows, dtype=np.float64), 3, method)
+            for row, jobs in zip(user_rows, batch):
+                with self.subTest(scores=row, method=method):
+                    self.assertEqual(jobs, recommender.recommend_jobs(dict(zip(DIMENSIONS, row)), 3, method))
+
+
+class FixedPointParityTests(unittest.TestCase):
+    """정수 거리 제곱 키에서도 k번째와 반올림 후 동점인 후보가 빠지지 않는지 (brute, ivf)"""
+
+    def assert_storage_parity(self, index_type):
+        float_recommender = JobRecommender(OCCUPATION_SCORES_FILE, index_type=index_type, cache_size=0)
+        fixed_recommender = JobRecommender(
+            OCCUPATION_SCORES_FILE, index_type=index_type, cache_size=0, storage='fixed_point'
+        )
+        rng = random.Random(6)
+        user_rows = []
+        for _ in range(FIXED_POINT_QUERIES):
+            user_scores = random_user_scores(rng)
+            user_rows.append([user_scores[dim] for dim in DIMENSIONS])
+            for top_n in (1, 2, 3):
+                with self.subTest(user_scores=user_scores, top_n=top_n, index_type=index_type):
+                    self.assertEqual(
+                        fixed_recommender.recommend_jobs(user_scores, top_n, 'euclidean'),
+                        float_recommender.recommend_jobs(user_scores, top_n, 'euclidean'),
+                    )
+        # 소수 3자리 점수가 섞인 행렬은 정수 커널 대신 float 커널로 계산
+        user_rows.append([3.125, 2.5, 4.0, 1.75, 3.0, 4.5])
+        user_matrix = np.array(user_rows)
+        for top_n in (1, 2, 3):
+            self.assertEqual(
+                list(fixed_recommender.recommend_batch(user_matrix, top_n, 'euclidean')),
+                list(float_recommender.recommend_batch(user_matrix, top_n, 'euclidean')),
+            )
+
+    def test_brute_matches_float_storage(self):
+        self.assert_storage_parity('brute')
+
+    def test_ivf_matches_float_storage(self):
+        self.assert_storage_parity('ivf')
+
+
+class RelatedJobsTests(unittest.TestCase):
+    """관련 직업 테이블 순서(float64 기준)와 표시 유사도(점수 행렬로 다시 계산)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recommender = JobRecommender(OCCUPATION_SCORES_FILE, cache_size=0)
+        cls.matrix = np.array([[job[dim] for dim in DIMENSIONS] for job in cls.recommender.occupations], dtype=np.float64)
+        unit = cls.matrix / np.linalg.norm(cls.matrix, axis=1)[:, None]
+        cls.exact = unit @ unit.T
+
+    def test_table_matches_brute_force(self):
+        indices = compute_related(self.matrix, top_k=10, block_bytes=64 * 1024)
+        self.assertEqual(indices.shape, (len(self.matrix), 10))
+        for row, neighbors in enumerate(indices):
+            sims = self.exact[row].copy()
+            sims[row] = -np.inf
+            expected = np.lexsort((np.arange(len(sims)), -sims))[:10]
+            np.testing.assert_array_equal(neighbors, expected)
+
+    def test_artifact_table_matches_computed(self):
+        artifact_recommender = JobRecommender(ARTIFACT_DIR, cache_size=0)
+        np.testing.assert_array_equal(
+            artifact_recommender.related_table, compute_related(artifact_recommender.score_matrix)
+        )
+
+    def test_reported_similarity_matches_score_matrix(self):
+        ones = 0
+        for soc_code, index in self.recommender.soc_index.items():
+            jobs = self.recommender.get_related_jobs(soc_code, top_n=5)
+            values = [job['similarity'] for job in jobs]
+            self.assertEqual(values, sorted(values, reverse=True))
+            for job in jobs:
+                exact = self.exact[index, self.recommender.soc_index[job['soc_code']]]
+                self.assertAlmostEqual(job['similarity'], exact, delta=1e-4)
+            ones += values.count(1.0)
+        # float16 값이라면 상위 이웃 대부분이 1.0으로 표시됨
+        self.assertLess(ones, len(self.recommender.soc_index))
+
+    def test_unknown_code(self):
+        self.assertIsNone(self.recommender.get_related_jobs('00-0000.00'))
+
+
+class OnetParserTests(unittest.TestCase):
+    """스트리밍 누적이 점수 목록을 모아 평균한 이전 결과와 같은지 (합성 O*NET 파일)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = Path(tempfile.mkdtemp())
+        cls.mapping = onet_parser.load_element_mapping()
+        rng = random.Random(0)
+        socs = [f"{11 + 2 * (i % 22)}-{i:04d}.00" for i in range(60)]
+        with open(cls.data_dir / onet_parser.OCCUPATION_DATA_FILE, 'w', encoding='utf-8') as f:
+            f.write("O*NET-SOC Code\tTitle\tDescription\n")
+            for soc in socs:
+                f.write(f"{soc}\tJob {soc}\t-\n")
+        for filename, routes in cls.mapping.items():
+            # 매핑되지 않은 항목, 잘못된 점수도 섞음
+            keys = list(routes) + [('Analyst', 'Unmapped Element')]
+            with open(cls.data_dir / filename, 'w', encoding='utf-8') as f:
+                f.write("O*NET-SOC Code\tElement ID\tElement Name\tScale ID\tData Value\tN\tDomain Source\n")
+                for soc in socs[:-1]:  # 마지막 직업은 점수 없음
+                    for domain, element in keys:
+                        for scale_id in ('IM', 'LV'):
+                            value = 'n/a' if rng.random() < 0.01 else f"{rng.uniform(0, 7 if scale_id == 'LV' else 5):.2f}"
+                            f.write(f"{soc}\t1.A\t{element}\t{scale_id}\t{value}\t8\t{domain}\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.data_dir)
+
+    def reference_scores(self):
+        """이전 구현처럼 점수를 파일 순서대로 직업·성향별 리스트에 모음"""
+        collected = {}
+        for filename, routes in self.mapping.items():
+            for row in onet_parser.parse_tsv_file(self.data_dir / filename):
+                dimensions = routes.get((row['Domain Source'].strip(), row['Element Name'].strip()))
+                score = onet_parser.normalize_score(row['Data Value'].strip(), row['Scale ID'].strip())
+                if dimensions is None or score is None:
+                    continue
+                for dim in dimensions:
+                    collected.setdefault(row['O*NET-SOC Code'].strip(), {}).setdefault(dim, []).append(score)
+        return collected
+
+    def calculate(self, jobs, chunk_bytes=None):
+        split = onet_parser.split_tsv_file
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            if chunk_bytes is not None:
+                stack.enter_context(mock.patch.object(
+                    onet_parser, 'split_tsv_file', lambda path: split(path, chunk_bytes)
+                ))
+            return onet_parser.calculate_occupation_scores(jobs=jobs, data_dir=self.data_dir)
+
+    def test_matches_score_lists(self):
+        """이전 구현의 sum(점수 목록) / len(점수 목록)과 같은 평균"""
+        expected = {}
+        for soc, dims in self.reference_scores().items():
+            expected[soc] = {}
+            for dim, values in dims.items():
+                expected[soc][dim] = round(sum_in_order(values) / len(values), 2)
+        results = self.calculate(jobs=1)
+        self.assertEqual({job['soc_code'] for job in results}, set(expected))
+        for job in results:
+            for dim in DIMENSIONS:
+                self.assertEqual(job[dim], expected[job['soc_code']].get(dim, 0.0), (job['soc_code'], dim))
+
+    def test_parallel_chunks_match_sequential(self):
+        sequential = self.calculate(jobs=1)
+        self.assertEqual(self.calculate(jobs=1, chunk_bytes=4096), sequential)
+        self.assertEqual(self.calculate(jobs=3, chunk_bytes=4096), sequential)
+
+    def test_chunk_scores_merge_in_file_order(self):
+        """구간을 어떻게 나누어도 한 값씩 파일 순서대로 더한 합계이므로 반올림 전 평균까지 같음"""
+        reference = self.reference_scores()
+        for chunk_bytes in (1 << 20, 3000, 500):
+            merged = {}
+            for filename, routes in self.mapping.items():
+                path = self.data_dir / filename
+                header = onet_parser.read_tsv_header(path)
+                for start, end in onet_parser.split_tsv_file(path, chunk_bytes):
+                    task = (filename, str(path), header, start, end, routes)
+                    for soc, dims in onet_parser.collect_chunk_scores(task).items():
+                        for dim, values in dims.items():
+                            onet_parser.merge_scores(merged.setdefault((soc, dim), onet_parser.new_accumulator()), values)
+            for soc, dims in reference.items():
+                for dim, values in dims.items():
+                    self.assertEqual(merged[(soc, dim)][0], sum_in_order(values), (chunk_bytes, soc, dim))
+                    self.assertEqual(merged[(soc, dim)][1], len(values), (chunk_bytes, soc, dim))
+
+    def test_split_covers_file_on_row_boundaries(self):
+        path = self.data_dir / next(iter(self.mapping))
+        data = path.read_bytes()
+        chunks = onet_parser.split_tsv_file(path, 777)
+        self.assertEqual(chunks[0][0], data.index(b'\n') + 1)
+        self.assertEqual(chunks[-1][1], len(data))
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b'\n')
@@ -1,92 +1,367 @@
 import csv
+import json
 import os
 import sys
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import openai
 from openai import OpenAI
 from dotenv import load_dotenv
 import time
 
+try:
+    from .translation_memo import MEMO_FILE, SOURCE_TITLE_FIELD, TranslationMemo
+except ImportError:  # 스크립트로 직접 실행하는 경우 (python translate_with_openai.py)
+    from translation_memo import MEMO_FILE, SOURCE_TITLE_FIELD, TranslationMemo
+
 # 환경 변수 로드 (backend 디렉토리의 .env 파일)
 script_dir = os.path.dirname(os.path.abspath(__file__))
 backend_dir = os.path.dirname(script_dir)
 env_path = os.path.join(backend_dir, '.env')
 load_dotenv(env_path)
 
-def translate_with_openai(title, client):
+# 번역 설정 (모델과 프롬프트 버전이 번역 메모리의 키)
+TRANSLATION_MODEL = "gpt-4o-mini"  # 비용 효율적인 모델 사용
+# 프롬프트나 temperature를 바꾸면 올려서 전체를 다시 번역
+TRANSLATION_PROMPT_VERSION = 1
+TRANSLATION_TEMPERATURE = 0.3  # 일관성 있는 번역을 위해 낮은 temperature
+TRANSLATION_SYSTEM_PROMPT = "You are a professional translator specializing in job titles. Translate English job titles to Korean naturally and accurately. Return only the Korean translation without any explanation or additional text."
+TRANSLATION_USER_PROMPT = "Translate this job title to Korean: {title}"
+TRANSLATION_MAX_TOKENS = 100
+
+# 배치 번역: 직업명 여러 개를 JSON 배열로 보내고 같은 순서의 JSON 배열로 받음
+DEFAULT_BATCH_SIZE = 40
+TRANSLATION_BATCH_SYSTEM_PROMPT = "You are a professional translator specializing in job titles. Translate English job titles to Korean naturally and accurately. The input is a JSON array of objects with \"id\" and \"title\". Return only a JSON array with exactly one object per input, in the same order, each of the form {\"id\": <same id>, \"korean\": \"<Korean translation>\"}, without any explanation or additional text."
+TRANSLATION_BATCH_USER_PROMPT = "Translate these job titles to Korean:\n{titles}"
+# 배치 응답 최대 토큰 (직업명당 분량 + 여유분 TRANSLATION_MAX_TOKENS)
+TRANSLATION_BATCH_TOKENS_PER_TITLE = 40
+
+# 동시 요청 수와 분당 요청/토큰 한도 (OpenAI 계정 등급의 한도보다 조금 낮게 설정)
+# 버스트를 다 쓴 뒤에는 RPM 한도가 속도를 정하므로(450회면 초당 약 6건), 직업명이 많으면 동시 요청보다 배치 요청이 빠름
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RPM = 450
+DEFAULT_TPM = 180000
+# 한도 안에서 한 번에 몰아서 보낼 수 있는 양 (한도의 초 단위 분량, 60초 미만)
+# 버스트만큼 채우는 속도를 낮추므로 어느 60초 구간에서도 분당 한도를 넘지 않음
+BURST_SECONDS = 10.0
+
+# 429/일시적 오류 재시도 (지수 백오프 + jitter, Retry-After 헤더가 있으면 우선)
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+class TokenBucket:
+    """
+    분당 한도(rate_per_minute)를 넘지 않는 토큰 버킷 (스레드 안전)
+    burst_seconds 분량을 한 번에 보낼 수 있고, 나머지 (한도 - 버스트)를 1분에 걸쳐 채움
+    """
+
+    def __init__(self, rate_per_minute, burst_seconds=BURST_SECONDS):
+        self.capacity = max(1.0, rate_per_minute * burst_seconds / 60.0)
+        # 버스트 용량 + 1분 동안 채우는 양 = 분당 한도 (한도가 아주 작으면 최소 분당 1)
+        self.rate = max(1.0, rate_per_minute - self.capacity) / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, amount):
+        """
+        amount만큼 미리 차감하고, 그만큼 채워질 때까지 기다려야 하는 시간(초)을 반환
+        (용량보다 큰 요청도 전부 차감하므로, 잔량이 음수가 되면 그만큼 더 기다림)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return max(0.0, -self.tokens / self.rate)
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한"""
+
+    def __init__(self, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+
+    def acquire(self, tokens):
+        """요청 1건(예상 토큰 tokens개)을 보낼 수 있을 때까지 대기"""
+        wait = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+def estimate_tokens(messages, max_tokens):
+    """요청 1건의 예상 토큰 수 (프롬프트는 약 4글자당 1토큰, 응답은 max_tokens로 계산)"""
+    return sum(len(message["content"]) for message in messages) // 4 + max_tokens
+
+def retry_delay(error, attempt):
+    """재시도 전 대기 시간 (Retry-After 헤더 우선, 없으면 지수 백오프 + jitter)"""
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+    backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return backoff * random.uniform(0.5, 1.0)
+
+def create_client(api_key=None, base_url=None):
+    """
+    번역용 OpenAI 클라이언트 (재시도는 request_completion에서 직접 처리)
+    base_url을 지정하면 로컬 스텁 서버 등 OpenAI 호환 엔드포인트로 요청합니다.
+    """
+    return OpenAI(
+        api_key=api_key or os.getenv('OPENAI_API_KEY'),
+        base_url=base_url,
+        max_retries=0,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    )
+
+def request_completion(client, messages, max_tokens, limiter=None, label=""):
+    """
+    채팅 완성 요청 (429/일시적 오류는 재시도)
+    Returns:
+        응답 텍스트 (재시도 초과 등으로 실패하면 None)
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter is not None:
+            limiter.acquire(estimate_tokens(messages, max_tokens))
+        try:
+            response = client.chat.completions.create(
+                model=TRANSLATION_MODEL,
+                messages=messages,
+                temperature=TRANSLATION_TEMPERATURE,
+                max_tokens=max_tokens
+            )
+            return response.choices[0].message.content
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_RETRIES:
+                print(f"번역 오류 ({label}): 재시도 {MAX_RETRIES}회 초과: {e}")
+                return None
+            delay = retry_delay(e, attempt)
+            print(f"  재시도 대기 ({label}): {delay:.1f}초 ({type(e).__name__})")
+            time.sleep(delay)
+        except Exception as e:
+            print(f"번역 오류 ({label}): {e}")
+            return None
+
+def translate_with_openai(title, client, limiter=None):
     """OpenAI API를 사용하여 영어 직업명을 한국어로 번역"""
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # 비용 효율적인 모델 사용
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional translator specializing in job titles. Translate English job titles to Korean naturally and accurately. Return only the Korean translation without any explanation or additional text."
-                },
-                {
-                    "role": "user",
-                    "content": f"Translate this job title to Korean: {title}"
-                }
-            ],
-            temperature=0.3,  # 일관성 있는 번역을 위해 낮은 temperature
-            max_tokens=100
-        )
-        translated = response.choices[0].message.content.strip()
-        return translated
-    except Exception as e:
-        print(f"번역 오류 ({title}): {e}")
+    messages = [
+        {
+            "role": "system",
+            "content": TRANSLATION_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": TRANSLATION_USER_PROMPT.format(title=title)
+        }
+    ]
+    translated = request_completion(client, messages, TRANSLATION_MAX_TOKENS, limiter, label=title)
+    if translated is None:
         return title  # 오류 시 원문 반환
+    return translated.strip()
 
-def translate_csv_with_openai(input_file, output_file, batch_size=50):
-    """CSV 파일의 직업명을 OpenAI API로 한국어 번역"""
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        print("오류: OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-        print(".env 파일에 OPENAI_API_KEY를 설정해주세요.")
-        return
-    
-    client = OpenAI(api_key=api_key)
-    
+def parse_batch_response(content, count):
+    """
+    배치 응답(JSON 배열)에서 항목별 번역 추출
+    위치 i의 항목이 {"id": i, "korean": "<번역>"} 형식일 때만 사용하고, 나머지 항목은 None
+    (응답 전체가 JSON 배열이 아니면 모두 None)
+    """
+    translations = [None] * count
+    if content is None:
+        return translations
+    content = content.strip()
+    # ```json ... ``` 코드 블록으로 감싼 응답 허용
+    if content.startswith("```"):
+        content = content.strip("`")
+        content = content[content.find("\n") + 1:] if "\n" in content else ""
+    try:
+        items = json.loads(content)
+    except ValueError:
+        return translations
+    if not isinstance(items, list):
+        return translations
+    if len(items) != count:
+        print(f"  배치 응답 항목 수 불일치: 요청 {count}개, 응답 {len(items)}개")
+    for i, item in enumerate(items[:count]):
+        if not isinstance(item, dict) or item.get("id") != i:
+            continue
+        korean = item.get("korean")
+        if isinstance(korean, str) and korean.strip():
+            translations[i] = korean.strip()
+    return translations
+
+def translate_batch(titles, client, limiter=None):
+    """
+    여러 직업명을 요청 1건으로 번역 (시스템 프롬프트를 직업명마다 반복해서 보내지 않음)
+    Returns:
+        입력 순서대로 번역 결과 (응답에서 찾지 못한 항목은 None)
+    """
+    payload = json.dumps([{"id": i, "title": title} for i, title in enumerate(titles)], ensure_ascii=False)
+    messages = [
+        {
+            "role": "system",
+            "content": TRANSLATION_BATCH_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": TRANSLATION_BATCH_USER_PROMPT.format(titles=payload)
+        }
+    ]
+    max_tokens = TRANSLATION_BATCH_TOKENS_PER_TITLE * len(titles) + TRANSLATION_MAX_TOKENS
+    content = request_completion(client, messages, max_tokens, limiter, label=f"{titles[0]} 외 {len(titles) - 1}개")
+    return parse_batch_response(content, len(titles))
+
+def translate_titles(titles, client, concurrency=DEFAULT_CONCURRENCY, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM,
+                     batch_size=DEFAULT_BATCH_SIZE, on_result=None):
+    """
+    직업명 목록을 동시에 번역 (결과는 입력 순서와 같은 리스트)
+    동시 요청은 concurrency개까지, 요청 속도는 RPM/TPM 한도 안으로 제한합니다.
+    batch_size > 1이면 batch_size개씩 묶어 요청하고, 응답에서 번역을 찾지 못한 직업명만 한 건씩 다시 요청합니다.
+    on_result(i, 번역)는 i번째 직업명의 번역이 끝날 때마다 작업 스레드에서 호출됩니다. (완료 순서, 실패 시 원문)
+    """
+    titles = list(titles)
+    results = [None] * len(titles)
+    limiter = RateLimiter(rpm, tpm)
+
+    def finish(i, korean):
+        results[i] = korean
+        if on_result is not None:
+            on_result(i, korean)
+
+    def translate_one(i):
+        finish(i, translate_with_openai(titles[i], client, limiter))
+
+    def translate_chunk(start):
+        """start부터 batch_size개를 배치로 번역하고, 응답에서 찾지 못한 인덱스 반환"""
+        failed = []
+        for i, korean in enumerate(translate_batch(titles[start:start + batch_size], client, limiter), start):
+            if korean is None:
+                failed.append(i)
+            else:
+                finish(i, korean)
+        return failed
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        if batch_size <= 1:
+            list(executor.map(translate_one, range(len(titles))))
+            return results
+
+        failed = [i for chunk in executor.map(translate_chunk, range(0, len(titles), batch_size)) for i in chunk]
+        if failed:
+            print(f"배치 응답에서 찾지 못한 직업명 {len(failed)}개를 한 건씩 다시 번역합니다.")
+            list(executor.map(translate_one, failed))
+    return results
+
+def translate_csv_with_openai(input_file, output_file, concurrency=DEFAULT_CONCURRENCY,
+                              rpm=DEFAULT_RPM, tpm=DEFAULT_TPM, batch_size=DEFAULT_BATCH_SIZE, client=None,
+                              memo_path=MEMO_FILE):
+    """
+    CSV 파일의 직업명을 OpenAI API로 한국어 번역
+    번역 메모리에 있는 직업명은 다시 번역하지 않고, 새로 번역한 직업명은 끝나는 대로 메모리에 저장합니다.
+    결과 행은 원래 순서대로 완성되는 즉시 <output_file>.partial에 기록하고, 모두 끝나면 output_file로 교체합니다.
+    """
     # 파일 읽기
     with open(input_file, 'r', encoding='utf-8') as f_in:
         reader = csv.DictReader(f_in)
         rows = list(reader)
-    
+    if 'title' not in (reader.fieldnames or []):
+        print(f"오류: {input_file}에 title 열이 없습니다.")
+        return
+
     total = len(rows)
-    print(f"총 {total}개의 직업명을 번역합니다.")
-    print("OpenAI API를 사용하여 정확하고 자연스러운 번역을 수행합니다.\n")
-    
-    # 번역 수행
-    translated_count = 0
-    for i, row in enumerate(rows, 1):
-        if 'title' in row:
-            original = row['title'].strip('"')
-            print(f"[{i}/{total}] 번역 중: {original}")
-            
-            translated = translate_with_openai(original, client)
-            row['title'] = translated
-            translated_count += 1
-            
-            print(f"  → {translated}\n")
-            
-            # API 호출 제한을 고려한 딜레이 (필요시)
-            if i % batch_size == 0:
-                print(f"진행 상황: {i}/{total} 완료 (일시 정지 2초)\n")
-                time.sleep(2)
-    
-    # 번역된 데이터를 새 파일에 저장
-    with open(output_file, 'w', encoding='utf-8', newline='') as f_out:
-        if rows:
-            writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames)
+    originals = [row['title'].strip('"') for row in rows]
+
+    with TranslationMemo(TRANSLATION_MODEL, TRANSLATION_PROMPT_VERSION, memo_path) as memo:
+        if 'soc_code' in reader.fieldnames:
+            seeded = memo.seed_from_csv([{**row, 'title': title} for row, title in zip(rows, originals)], output_file)
+            if seeded:
+                print(f"기존 번역 파일에서 {seeded}개를 번역 메모리로 가져왔습니다.")
+        known = memo.get_many(originals)
+        missing = [title for title in dict.fromkeys(originals) if title not in known]
+
+        print(f"총 {total}개의 직업명 중 {total - len(missing)}개는 번역 메모리에 있고, {len(missing)}개를 새로 번역합니다.")
+        if missing and client is None:
+            if not os.getenv('OPENAI_API_KEY'):
+                print("오류: OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
+                print(".env 파일에 OPENAI_API_KEY를 설정해주세요.")
+                return
+            client = create_client()
+        if missing:
+            print("OpenAI API를 사용하여 정확하고 자연스러운 번역을 수행합니다.")
+            print(f"동시 요청 {concurrency}개, 분당 {rpm}회 / {tpm} 토큰 이내로 요청합니다.")
+            if batch_size > 1:
+                print(f"요청 1건에 직업명 {batch_size}개씩 묶어서 번역합니다.")
+        print()
+
+        # 번역 수행 (동시에 요청하되 결과 파일에는 원래 행 순서대로 기록)
+        partial_file = f"{output_file}.partial"
+        lock = threading.Lock()
+        written = 0
+        translated_count = 0
+        start = time.perf_counter()
+        with open(partial_file, 'w', encoding='utf-8', newline='') as f_out:
+            # 번역한 영어 직업명도 함께 기록 (다음 실행에서 번역 메모리로 가져올 때 직업명이 바뀌었는지 확인)
+            fieldnames = [name for name in reader.fieldnames if name != SOURCE_TITLE_FIELD] + [SOURCE_TITLE_FIELD]
+            writer = csv.DictWriter(f_out, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(rows)
-    
-    print(f"\n번역 완료: {translated_count}개 직업명이 번역되었습니다.")
+
+            def write_ready_rows():
+                """앞에서부터 번역이 끝난 행까지 기록"""
+                nonlocal written
+                while written < total and originals[written] in known:
+                    writer.writerow({**rows[written], 'title': known[originals[written]], SOURCE_TITLE_FIELD: originals[written]})
+                    written += 1
+                f_out.flush()
+
+            def on_result(i, translated):
+                nonlocal translated_count
+                title = missing[i]
+                with lock:
+                    # 오류 시 원문이 반환되므로 원문과 같으면 메모리에 저장하지 않음 (다음 실행에서 재시도)
+                    if translated != title:
+                        memo.put(title, translated)
+                    known[title] = translated
+                    translated_count += 1
+                    print(f"[{translated_count}/{len(missing)}] {title} → {translated}")
+                    write_ready_rows()
+
+            write_ready_rows()
+            if missing:
+                translate_titles(missing, client, concurrency, rpm, tpm, batch_size, on_result=on_result)
+
+        # 모든 행을 기록한 뒤 결과 파일 교체
+        os.replace(partial_file, output_file)
+
+    print(f"\n번역 완료: {translated_count}개 직업명을 새로 번역했습니다. ({time.perf_counter() - start:.1f}초)")
     print(f"결과 파일: {output_file}")
 
 if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, "occupation_scores.csv")
-    output_file = os.path.join(script_dir, "occupation_scores_kr.csv")  # 새 파일로 저장
-    
+
+    parser = argparse.ArgumentParser(description="OpenAI API를 사용한 직업명 번역")
+    parser.add_argument('--input', default=os.path.join(script_dir, "occupation_scores.csv"))
+    parser.add_argument('--output', default=os.path.join(script_dir, "occupation_scores_kr.csv"))  # 새 파일로 저장
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 수")
+    parser.add_argument('--rpm', type=int, default=DEFAULT_RPM, help="분당 최대 요청 수")
+    parser.add_argument('--tpm', type=int, default=DEFAULT_TPM, help="분당 최대 토큰 수")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="요청 1건에 묶을 직업명 수 (1이면 한 건씩)")
+    parser.add_argument('--base-url', help="OpenAI 호환 엔드포인트 (로컬 스텁 서버 테스트용)")
+    parser.add_argument('--memo', default=str(MEMO_FILE), help="번역 메모리 SQLite 파일")
+    args = parser.parse_args()
+    input_file = args.input
+    output_file = args.output
+
     # 원본 파일 백업 여부 확인
     print("=" * 60)
     print("OpenAI API를 사용한 직업명 번역 스크립트")
@@ -97,6 +372,7 @@ if __name__ == "__main__":
     print("gpt-4o-mini 모델 사용 시 약 $0.15/1M input tokens, $0.60/1M output tokens")
     print("895개 직업명 번역 시 예상 비용: 약 $0.01-0.05 정도")
     print("\n번역을 시작합니다...\n")
-    
-    translate_csv_with_openai(input_file, output_file)
 
+    client = create_client(base_url=args.base_url) if args.base_url else None
+    translate_csv_with_openai(input_file, output_file, args.concurrency, args.rpm, args.tpm, args.batch_size,
+                              client=client, memo_path=args.memo)
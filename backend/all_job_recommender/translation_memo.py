@@ -0,0 +1,128 @@
+"""
+직업명 번역 메모리 (SQLite)
+
+(영어 직업명, 모델, 프롬프트 버전)별 번역 결과를 로컬 SQLite 파일에 저장합니다.
+- translate_with_openai.py와 build_pipeline.py는 메모리에 없는 직업명만 API로 번역합니다.
+- 번역이 끝나는 대로 바로 저장(commit)하므로, 중간에 중단되어도 다시 실행하면 남은 직업명만 번역합니다.
+- 모델이나 프롬프트 버전이 바뀌면 다른 키가 되어 새로 번역합니다. (이전 번역은 그대로 남음)
+"""
+
+import csv
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent
+MEMO_FILE = BASE_DIR / ".build_cache" / "translation_memo.sqlite3"
+
+# 한 번에 조회할 직업명 수 (SQLite 바인딩 변수 개수 제한)
+LOOKUP_CHUNK_SIZE = 500
+
+# 번역 CSV에서 번역한 영어 직업명을 기록하는 열
+SOURCE_TITLE_FIELD = 'title_en'
+
+
+class TranslationMemo:
+    """
+    모델/프롬프트 버전 하나에 대한 번역 메모리
+    번역 작업 스레드에서 동시에 저장할 수 있도록 연결 하나를 잠금으로 보호합니다.
+    """
+
+    def __init__(self, model: str, prompt_version, path: Path = MEMO_FILE):
+        self.model = model
+        self.prompt_version = str(prompt_version)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # WAL: 저장 중에 중단되어도 이미 commit한 번역은 유지
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " title TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " prompt_version TEXT NOT NULL,"
+            " korean TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (title, model, prompt_version))"
+        )
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM translations WHERE model = ? AND prompt_version = ?",
+                (self.model, self.prompt_version),
+            ).fetchone()
+        return row[0]
+
+    def get_many(self, titles: Iterable[str]) -> Dict[str, str]:
+        """저장된 번역 조회 (영어 직업명 -> 한국어, 없는 직업명은 제외)"""
+        titles = list(dict.fromkeys(titles))
+        found = {}
+        with self.lock:
+            for start in range(0, len(titles), LOOKUP_CHUNK_SIZE):
+                chunk = titles[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT title, korean FROM translations"
+                    f" WHERE model = ? AND prompt_version = ? AND title IN ({placeholders})",
+                    (self.model, self.prompt_version, *chunk),
+                )
+                found.update(rows)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, str]]):
+        """번역 저장 후 바로 commit (같은 키가 있으면 덮어씀)"""
+        now = time.time()
+        rows = [(title, self.model, self.prompt_version, korean, now) for title, korean in items]
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations (title, model, prompt_version, korean, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+
+    def put(self, title: str, korean: str):
+        self.put_many([(title, korean)])
+
+    def seed_from_csv(self, english_rows: List[Dict], kr_csv_path: Path) -> int:
+        """
+        메모리가 비어 있으면 기존 번역 CSV(occupation_scores_kr.csv)를 soc_code로 맞춰 가져옴
+        (번역 메모리 도입 전에 같은 설정으로 번역한 결과 재사용)
+        CSV에 기록된 영어 직업명(SOURCE_TITLE_FIELD 열)이 현재 직업명과 같은 행만 가져오고,
+        이 열이 없는 CSV는 어떤 직업명을 번역했는지 알 수 없으므로 가져오지 않습니다. (직업명이 바뀐 직업에 이전 번역이 붙지 않도록)
+        영어 직업명과 같은 값은 번역되지 않은 것으로 보고 가져오지 않습니다.
+        Returns:
+            가져온 번역 수
+        """
+        kr_csv_path = Path(kr_csv_path)
+        if len(self) or not kr_csv_path.exists():
+            return 0
+        with open(kr_csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if SOURCE_TITLE_FIELD not in (reader.fieldnames or []):
+                return 0
+            existing = {row['soc_code']: (row[SOURCE_TITLE_FIELD], row['title']) for row in reader}
+        items = {}
+        for row in english_rows:
+            source_title, korean = existing.get(row['soc_code'], (None, None))
+            if korean and source_title == row['title'] and korean != row['title']:
+                items[row['title']] = korean
+        self.put_many(items.items())
+        return len(items)
@@ -8,7 +8,7 @@
 """
 
 from django.contrib import admin
-from .models import Assessment, AssessmentQuestion, AssessmentAnswer, AssessmentResult
+from .models import Assessment, AssessmentQuestion, AssessmentAnswer, AssessmentResult, PersonalityAnalysis
 
 # Django Admin 설정 작성
 # @admin.register(Assessment)
@@ -49,4 +49,11 @@ class AssessmentResultAdmin(admin.ModelAdmin):
         "exaggeration_flag",
         "type_label",
     )
-    list_filter = ("attention_check_pass", "exaggeration_flag")
\ No newline at end of file
+    list_filter = ("attention_check_pass", "exaggeration_flag")
+
+
+@admin.register(PersonalityAnalysis)
+class PersonalityAnalysisAdmin(admin.ModelAdmin):
+    list_display = ("key", "scores", "created_at")
+    search_fields = ("key",)
+    readonly_fields = ("key", "scores", "claimed_at", "created_at")
@@ -0,0 +1,163 @@
+"""
+앱: assessment (인적성검사)
+파일: analysis_cache.py
+역할: GPT 성향 분석 공용 캐시 (PersonalityAnalysis 테이블)
+설명:
+- 저장 자릿수(소수 둘째 자리)로 맞춘 6개 역량 점수로 만든 키(SHA-256)로 분석 결과를 저장하여, 점수 분포가 같은 검사 결과끼리 분석을 공유합니다.
+- 같은 키를 동시에 요청하면 GPT는 한 번만 호출합니다.
+  - 같은 프로세스의 스레드: 먼저 온 스레드의 Future를 함께 기다림 (다른 키 요청은 기다리지 않음)
+  - 다른 프로세스(gunicorn 워커): 키 행을 먼저 만든 요청만 생성하고, 나머지는 결과가 저장될 때까지 기다림
+- 기다리는 시간이 WAIT_SECONDS를 넘으면 GPT를 다시 호출하지 않고 AnalysisPending을 발생시킵니다.
+- 생성을 맡은 프로세스가 중간에 죽으면 CLAIM_LEASE_SECONDS 후 다른 요청이 이어서 생성합니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import PersonalityAnalysis
+
+# 생성을 맡은 요청이 이 시간 안에 결과를 저장하지 못하면 다른 요청이 이어서 생성
+CLAIM_LEASE_SECONDS = 180
+# 다른 요청의 생성 결과를 기다리는 최대 시간 (지나면 AnalysisPending)
+WAIT_SECONDS = 120
+POLL_SECONDS = 0.5
+
+# 같은 프로세스에서 생성 중인 키 -> Future (같은 키의 다른 스레드는 이 Future를 기다림)
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+class AnalysisPending(Exception):
+    """다른 요청이 같은 키의 분석을 아직 생성 중 (WAIT_SECONDS 안에 끝나지 않음)"""
+
+
+def make_key(scores: dict, **params) -> str:
+    """
+    점수와 분석 설정(모델, 프롬프트 버전 등)으로 캐시 키 생성
+    """
+    payload = json.dumps({"scores": scores, **params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(analysis) -> bool:
+    """JSON 파싱에 성공한 분석만 캐시 ({"raw": ...}는 다음 조회 때 다시 생성)"""
+    return isinstance(analysis, dict) and "raw" not in analysis
+
+
+def get_or_generate(key: str, scores: dict, generate):
+    """
+    캐시된 분석 반환, 없으면 generate()로 생성하여 저장
+    Args:
+        key: make_key로 만든 캐시 키
+        scores: 키에 사용한 점수 (확인용으로 함께 저장)
+        generate: 분석을 생성하는 함수 (GPT 호출)
+    Raises:
+        AnalysisPending: 다른 요청이 생성 중인 분석이 WAIT_SECONDS 안에 저장되지 않은 경우
+        generate()에서 발생한 예외 (다른 요청이 다시 생성할 수 있도록 생성 표시는 지움)
+    """
+    analysis = _cached(key)
+    if analysis is not None:
+        return analysis
+
+    # 잠금은 Future 등록/조회에만 사용 (GPT 호출이나 대기 중에는 잡지 않음)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+
+    if not leader:
+        try:
+            return future.result(timeout=WAIT_SECONDS)
+        except FutureTimeoutError:
+            raise AnalysisPending(key)
+
+    try:
+        analysis = _get_or_generate_shared(key, scores, generate)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(analysis)
+        return analysis
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _cached(key: str):
+    row = PersonalityAnalysis.objects.filter(key=key).only("analysis").first()
+    return row.analysis if row is not None else None
+
+
+def _get_or_generate_shared(key: str, scores: dict, generate):
+    """
+    프로세스 사이의 중복 생성 방지: 키 행을 먼저 만든(또는 만료된 행을 이어받은) 요청만 생성
+    """
+    deadline = time.monotonic() + WAIT_SECONDS
+
+    while True:
+        row = PersonalityAnalysis.objects.filter(key=key).first()
+        if row is not None and row.analysis is not None:
+            return row.analysis
+
+        if row is None:
+            claimed = _claim_new(key, scores)
+        else:
+            claimed = _claim_expired(key)
+
+        if claimed:
+            return _generate_and_store(key, generate)
+
+        if time.monotonic() > deadline:
+            raise AnalysisPending(key)
+
+        time.sleep(POLL_SECONDS)
+
+
+def _claim_new(key: str, scores: dict) -> bool:
+    """키 행을 만들어 생성을 맡음 (이미 다른 요청이 만들었으면 False)"""
+    try:
+        with transaction.atomic():
+            PersonalityAnalysis.objects.create(key=key, scores=scores)
+        return True
+    except IntegrityError:
+        return False
+
+
+def _claim_expired(key: str) -> bool:
+    """생성을 맡은 요청이 CLAIM_LEASE_SECONDS 안에 끝내지 못했으면 이어서 맡음"""
+    now = timezone.now()
+    return PersonalityAnalysis.objects.filter(
+        key=key,
+        analysis__isnull=True,
+        claimed_at__lt=now - timedelta(seconds=CLAIM_LEASE_SECONDS),
+    ).update(claimed_at=now) == 1
+
+
+def _generate_and_store(key: str, generate):
+    try:
+        analysis = generate()
+    except Exception:
+        _release(key)
+        raise
+
+    if not is_cacheable(analysis):
+        _release(key)
+        return analysis
+
+    PersonalityAnalysis.objects.filter(key=key).update(analysis=analysis)
+    return analysis
+
+
+def _release(key: str):
+    """생성 표시 삭제 (기다리던 요청이 다시 생성을 맡을 수 있음)"""
+    PersonalityAnalysis.objects.filter(key=key, analysis__isnull=True).delete()
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:38
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0003_alter_assessment_completed_at_alter_assessment_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersonalityAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('scores', models.JSONField()),
+                ('analysis', models.JSONField(blank=True, null=True)),
+                ('claimed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='assessmentresult',
+            name='analysis',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -99,6 +99,7 @@ class Assessment(models.Model):
                 "attention_check_pass": attention_check_pass,
                 "exaggeration_flag": exaggeration_flag,
                 "type_label": "기본 유형",
+                "analysis": None,  # 점수가 바뀌었으므로 GPT 성향 분석도 다시 조회
             },
         )
 
@@ -180,10 +181,33 @@ class AssessmentResult(models.Model):
 
     type_label = models.CharField(max_length=50, blank=True)
 
+    # GPT 성향 분석 (처음 생성/조회할 때 저장, 이후 결과 조회는 저장된 값 사용)
+    analysis = models.JSONField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Result for Assessment {self.assessment_id}"
 
 
+# ======================================================
+#  PersonalityAnalysis (GPT 성향 분석 공용 캐시)
+# ======================================================
+class PersonalityAnalysis(models.Model):
+    """
+    저장된 6개 역량 점수(소수 둘째 자리, + 모델/프롬프트 버전)의 해시를 키로 하는 GPT 성향 분석 캐시
+    점수 분포가 같은 검사 결과는 사용자가 달라도 같은 분석을 공유합니다.
+    analysis가 비어 있으면 다른 요청이 생성 중이라는 뜻입니다. (analysis_cache.py 참고)
+    """
+    key = models.CharField(max_length=64, unique=True)
+    scores = models.JSONField()  # 키에 사용한 점수 (확인용)
+    analysis = models.JSONField(null=True, blank=True)
+
+    claimed_at = models.DateTimeField(default=timezone.now)  # 생성을 맡은 시각
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"PersonalityAnalysis {self.key[:12]}"
+
+
 
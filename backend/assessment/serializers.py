@@ -27,4 +27,4 @@ class AssessmentQuestionSerializer(serializers.ModelSerializer):
 class AssessmentResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = AssessmentResult
-        fields = '__all__'
+        exclude = ['analysis']  # 성향 분석은 응답의 "analysis"로 따로 전달
@@ -0,0 +1,303 @@
+"""
+앱: assessment (인적성검사)
+파일: tests.py
+역할: 성향 분석 공용 캐시와 직업 추천 API 테스트
+설명:
+- 분석 캐시: 같은 키는 GPT를 한 번만 호출하는지 (같은 프로세스의 스레드 / 다른 프로세스의 키 행)
+- 다른 요청이 생성 중이면 기다렸다가 결과를 받거나 AnalysisPending, 만료된 생성 표시는 이어서 생성
+- 추천 API: 이전 구현(CSV를 pandas로 읽어 코사인 유사도 계산)과 같은 직업, 같은 순서, 같은 유사도
+- 배치 추천 API: 같은 점수로 단건 추천 API를 호출한 결과와 같음
+- 직업 상세 일괄 조회 API: 추천 결과의 soc_code로 한 번에 조회
+- 관련 직업 API: 미리 계산된 이웃과 점수 행렬로 계산한 유사도, 없는 코드는 404
+- 잘못된 입력은 400
+- 실행: python manage.py test assessment
+"""
+
+import math
+import threading
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from all_job_recommender.job_recommender import BASE_DIR as RECOMMENDER_DIR, DIMENSIONS, get_recommender
+from . import analysis_cache, views, views_recommend
+from .models import Assessment, AssessmentResult, PersonalityAnalysis
+
+KR_CSV_PATH = RECOMMENDER_DIR / "occupation_scores_kr.csv"
+
+# 이전 구현과 비교할 무작위 점수 개수 (소수 2자리, 고정 seed)
+BASELINE_QUERIES = 1000
+
+ANALYSIS = {"summary": "요약", "strengths": ["강점"], "weaknesses": ["보완점"], "work_style": "꼼꼼함"}
+SCORES = {
+    "communication": "3.25", "responsibility": "4.00", "problem_solving": "2.75",
+    "growth": "3.50", "stress": "3.00", "adaptation": "4.25",
+}
+
+
+def make_result(**scores):
+    values = {field: Decimal(value) for field, value in {**SCORES, **scores}.items()}
+    return AssessmentResult.objects.create(assessment=Assessment.objects.create(name="홍길동"), **values)
+
+
+class AnalysisCacheTests(TestCase):
+
+    def setUp(self):
+        self.key = analysis_cache.make_key(SCORES, model="gpt-test", prompt_version=1)
+
+    def test_generates_once_and_reuses(self):
+        generate = mock.Mock(return_value=ANALYSIS)
+
+        self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, generate), ANALYSIS)
+        self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, generate), ANALYSIS)
+        self.assertEqual(generate.call_count, 1)
+
+    def test_uncacheable_analysis_is_not_stored(self):
+        raw = {"raw": "JSON이 아닌 응답"}
+        generate = mock.Mock(return_value=raw)
+
+        self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, generate), raw)
+        self.assertFalse(PersonalityAnalysis.objects.filter(key=self.key).exists())
+        analysis_cache.get_or_generate(self.key, SCORES, generate)
+        self.assertEqual(generate.call_count, 2)
+
+    def test_generate_error_releases_claim(self):
+        with self.assertRaises(RuntimeError):
+            analysis_cache.get_or_generate(self.key, SCORES, mock.Mock(side_effect=RuntimeError("timeout")))
+        self.assertFalse(PersonalityAnalysis.objects.filter(key=self.key).exists())
+
+        self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, mock.Mock(return_value=ANALYSIS)), ANALYSIS)
+
+    def test_waits_for_other_process_result(self):
+        """다른 프로세스가 키 행을 만들고 생성 중이면 GPT를 호출하지 않고 저장될 때까지 기다림"""
+        PersonalityAnalysis.objects.create(key=self.key, scores=SCORES)
+        generate = mock.Mock(return_value={"summary": "중복 생성"})
+
+        def other_process_finishes(seconds):
+            PersonalityAnalysis.objects.filter(key=self.key).update(analysis=ANALYSIS)
+
+        with mock.patch.object(analysis_cache.time, "sleep", side_effect=other_process_finishes):
+            self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, generate), ANALYSIS)
+        generate.assert_not_called()
+
+    @mock.patch.object(analysis_cache, "WAIT_SECONDS", 0.05)
+    @mock.patch.object(analysis_cache, "POLL_SECONDS", 0.01)
+    def test_pending_after_wait_without_regenerating(self):
+        PersonalityAnalysis.objects.create(key=self.key, scores=SCORES)
+        generate = mock.Mock(return_value=ANALYSIS)
+
+        with self.assertRaises(analysis_cache.AnalysisPending):
+            analysis_cache.get_or_generate(self.key, SCORES, generate)
+        generate.assert_not_called()
+
+    def test_takes_over_expired_claim(self):
+        expired = timezone.now() - timedelta(seconds=analysis_cache.CLAIM_LEASE_SECONDS + 1)
+        PersonalityAnalysis.objects.create(key=self.key, scores=SCORES, claimed_at=expired)
+
+        self.assertEqual(analysis_cache.get_or_generate(self.key, SCORES, mock.Mock(return_value=ANALYSIS)), ANALYSIS)
+        self.assertEqual(PersonalityAnalysis.objects.get(key=self.key).analysis, ANALYSIS)
+
+
+class AnalysisSingleFlightTests(TransactionTestCase):
+    """같은 프로세스의 스레드끼리는 키별 Future로 GPT 호출을 한 번으로 합침"""
+
+    def run_in_thread(self, func, results, name):
+        def target():
+            try:
+                results[name] = func()
+            except Exception as e:
+                results[name] = e
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def test_same_key_generates_once(self):
+        key = analysis_cache.make_key(SCORES, model="gpt-test", prompt_version=1)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_generate():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ANALYSIS
+
+        results = {}
+        leader = self.run_in_thread(lambda: analysis_cache.get_or_generate(key, SCORES, slow_generate), results, "leader")
+        self.assertTrue(started.wait(5))
+        follower = self.run_in_thread(lambda: analysis_cache.get_or_generate(key, SCORES, slow_generate), results, "follower")
+        follower.join(0.2)
+        self.assertTrue(follower.is_alive())  # 먼저 온 요청의 결과를 기다리는 중
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(results, {"leader": ANALYSIS, "follower": ANALYSIS})
+        self.assertEqual(len(calls), 1)
+
+    def test_other_keys_do_not_wait(self):
+        slow_key = analysis_cache.make_key(SCORES, model="gpt-test", prompt_version=1)
+        other_scores = {**SCORES, "stress": "1.00"}
+        other_key = analysis_cache.make_key(other_scores, model="gpt-test", prompt_version=1)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_generate():
+            started.set()
+            release.wait(5)
+            return ANALYSIS
+
+        results = {}
+        slow = self.run_in_thread(lambda: analysis_cache.get_or_generate(slow_key, SCORES, slow_generate), results, "slow")
+        self.assertTrue(started.wait(5))
+        other = self.run_in_thread(
+            lambda: analysis_cache.get_or_generate(other_key, other_scores, lambda: ANALYSIS), results, "other"
+        )
+        other.join(5)
+        self.assertFalse(other.is_alive())  # 다른 키의 GPT 호출이 끝나기를 기다리지 않음
+        release.set()
+        slow.join(5)
+
+        self.assertEqual(results, {"slow": ANALYSIS, "other": ANALYSIS})
+
+
+class PersonalityAnalysisViewTests(TestCase):
+
+    def test_scores_use_stored_precision(self):
+        result = make_result()
+        result.communication = 3.245  # 제출 직후의 float 평균
+        scores = views.analysis_scores(result)
+        self.assertEqual(scores["communication"], "3.25")
+        self.assertEqual(views.analysis_scores(AssessmentResult.objects.get(id=result.id)), SCORES)
+
+    @mock.patch.object(views, "generate_personality_analysis", return_value=ANALYSIS)
+    def test_result_view_reuses_analysis(self, generate):
+        client = APIClient()
+        first = make_result()
+        second = make_result()  # 점수가 같은 다른 응시자
+
+        for result in (first, first, second):
+            response = client.get(f"/api/assessment/{result.assessment_id}/result/")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data["analysis"], ANALYSIS)
+            self.assertEqual(response.data["analysis_status"], "ready")
+
+        generate.assert_called_once_with(SCORES)
+        first.refresh_from_db()
+        self.assertEqual(first.analysis, ANALYSIS)
+
+    def test_pending_analysis_is_not_saved(self):
+        result = make_result()
+        with mock.patch.object(analysis_cache, "get_or_generate", side_effect=analysis_cache.AnalysisPending("key")):
+            response = APIClient().get(f"/api/assessment/{result.assessment_id}/result/")
+
+        self.assertEqual(response.data["analysis_status"], "pending")
+        self.assertIsNone(response.data["analysis"])
+        result.refresh_from_db()
+        self.assertIsNone(result.analysis)
+
+
+def recommend_params(values):
+    return dict(zip(views_recommend.SCORE_PARAMS, values))
+
+
+def baseline_recommend(df_jobs, job_rows, user_vec):
+    """이전 JobRecommendView: 행마다 코사인 유사도를 계산해 similarity 열에 넣고 sort_values로 상위 3개"""
+    def cosine(a, b):
+        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+    df = df_jobs.assign(similarity=[cosine(user_vec, job_vec) for job_vec in job_rows])
+    top3 = df.sort_values("similarity", ascending=False).head(3)
+    return [(row["title"], round(row["similarity"], 4)) for _, row in top3.iterrows()]
+
+
+class JobRecommendViewTests(SimpleTestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_matches_previous_pandas_view(self):
+        """직업명 순서와 유사도가 이전 구현과 정확히 같음 (반올림 후 동점인 직업도 반올림 전 값 순서)"""
+        df_jobs = pd.read_csv(KR_CSV_PATH, encoding="utf-8")
+        job_rows = list(df_jobs[DIMENSIONS].to_numpy(dtype=np.float64))
+        rng = np.random.default_rng(0)
+        for values in np.round(rng.uniform(1, 5, size=(BASELINE_QUERIES, 6)), 2):
+            response = self.client.get("/api/assessment/recommend/", recommend_params(values.tolist()))
+            self.assertEqual(response.status_code, 200)
+            results = [(job["title_ko"], job["similarity"]) for job in response.data["results"]]
+            with self.subTest(scores=values.tolist()):
+                self.assertEqual(results, baseline_recommend(df_jobs, job_rows, values))
+
+    def test_rejects_invalid_scores(self):
+        valid = [3.5, 4.0, 2.5, 3.0, 4.5, 3.25]
+        for bad in ("abc", "nan", "inf", None):
+            params = recommend_params(valid)
+            if bad is None:
+                del params["adap"]
+            else:
+                params["adap"] = bad
+            with self.subTest(adap=bad):
+                self.assertEqual(self.client.get("/api/assessment/recommend/", params).status_code, 400)
+        self.assertEqual(self.client.get("/api/assessment/recommend/", recommend_params([0] * 6)).status_code, 400)
+
+    def test_batch_matches_single_requests(self):
+        rng = np.random.default_rng(1)
+        rows = np.round(rng.uniform(1, 5, size=(200, 6)), 2).tolist() + [[1, 2, 3, 4, 5, 1]]
+        response = self.client.post(
+            "/api/assessment/recommend/batch/",
+            {"scores": rows[:-1] + [recommend_params(rows[-1])], "top_n": 3},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        for row, results in zip(rows, response.data["results"]):
+            single = self.client.get("/api/assessment/recommend/", recommend_params(row))
+            with self.subTest(scores=row):
+                self.assertEqual(results, single.data["results"])
+
+    def test_batch_rejects_invalid_body(self):
+        url = "/api/assessment/recommend/batch/"
+        for body in ([[3, 3, 3, 3, 3, 3]], {"scores": []}, {"scores": [[1, 2, 3]]},
+                     {"scores": [[0, 0, 0, 0, 0, 0]]}, {"scores": [[3] * 6], "top_n": 0}):
+            with self.subTest(body=body):
+                self.assertEqual(self.client.post(url, body, format="json").status_code, 400)
+
+    def test_details_for_recommended_jobs(self):
+        """추천 결과의 soc_code로 상세 정보를 한 번에 조회 (없는 코드는 not_found)"""
+        recommended = self.client.get("/api/assessment/recommend/", recommend_params([3.5, 4.0, 2.5, 3.0, 4.5, 3.25]))
+        codes = [job["soc_code"] for job in recommended.data["results"]]
+        self.assertEqual(len(codes), views_recommend.TOP_N)
+
+        response = self.client.get("/api/assessment/jobs/details/", {"codes": ",".join(codes + ["00-0000.00"])})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([job["soc_code"] for job in response.data["results"]], codes)
+        self.assertEqual(
+            [job["title_ko"] for job in response.data["results"]],
+            [job["title_ko"] for job in recommended.data["results"]],
+        )
+        self.assertEqual(response.data["not_found"], ["00-0000.00"])
+
+    def test_related_jobs(self):
+        recommender = get_recommender()
+        soc_code = recommender.occupations[0]["soc_code"]
+        response = self.client.get(f"/api/assessment/jobs/{soc_code}/related/", {"top_n": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 5)
+
+        target = np.array([recommender.occupations[0][dim] for dim in DIMENSIONS], dtype=np.float64)
+        for job in response.data["results"]:
+            other = recommender.get_job_details(job["soc_code"])
+            vector = np.array([other[dim] for dim in DIMENSIONS], dtype=np.float64)
+            exact = float(target @ vector / (np.linalg.norm(target) * np.linalg.norm(vector)))
+            self.assertTrue(math.isclose(job["similarity"], exact, abs_tol=1e-4))
+
+        self.assertEqual(self.client.get("/api/assessment/jobs/00-0000.00/related/").status_code, 404)
+        self.assertEqual(self.client.get(f"/api/assessment/jobs/{soc_code}/related/", {"top_n": 0}).status_code, 400)
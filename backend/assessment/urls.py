@@ -15,13 +15,16 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import AssessmentViewSet
-from .views_recommend import JobRecommendView
+from .views_recommend import JobRecommendView, JobRecommendBatchView, JobDetailsView, RelatedJobsView
 
 router = DefaultRouter()
 router.register(r'', AssessmentViewSet, basename='assessment')
 
 urlpatterns = [
   path('recommend/', JobRecommendView.as_view(), name='job-recommend'),
+  path('recommend/batch/', JobRecommendBatchView.as_view(), name='job-recommend-batch'),
+  path('jobs/details/', JobDetailsView.as_view(), name='job-details'),
+  path('jobs/<str:soc_code>/related/', RelatedJobsView.as_view(), name='job-related'),
   path('', include(router.urls)),  # 기존 assessment API
     
 ]
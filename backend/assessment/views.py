@@ -4,10 +4,9 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.shortcuts import get_object_or_404
 
-from openai import OpenAI
 import json
-import os
 import re
+from decimal import Decimal, ROUND_HALF_UP
 
 from .models import Assessment, AssessmentQuestion, AssessmentAnswer, AssessmentResult
 from .serializers import (
@@ -15,25 +14,49 @@ from .serializers import (
     AssessmentQuestionSerializer,
     AssessmentResultSerializer,
 )
-
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from config import llm_gateway
+from . import analysis_cache
+
+# 성향 분석 GPT 호출 설정
+ANALYSIS_MODEL = "gpt-4.1"
+ANALYSIS_TIMEOUT_SECONDS = 60
+# 프롬프트를 바꾸면 올려서 이전 분석 캐시를 쓰지 않게 함
+ANALYSIS_PROMPT_VERSION = 1
+
+# 분석 캐시 키에 쓰는 6개 역량 점수와 자릿수 (AssessmentResult에 저장되는 소수 둘째 자리)
+ANALYSIS_SCORE_FIELDS = (
+    "communication", "responsibility", "problem_solving",
+    "growth", "stress", "adaptation",
+)
+ANALYSIS_SCORE_STEP = Decimal("0.01")
 
 
 # ===============================================
 #   GPT 성향 분석 생성 함수
 # ===============================================
-def generate_personality_analysis(result):
+def analysis_scores(result):
+    """
+    6개 역량 점수를 저장 자릿수(소수 둘째 자리) 문자열로 통일 (분석 캐시 키 / 프롬프트 공용)
+    제출 직후의 float 평균(3.0)과 DB에서 읽은 Decimal(3.00)이 같은 키가 되도록 합니다.
+    """
+    return {
+        field: str(Decimal(str(getattr(result, field))).quantize(ANALYSIS_SCORE_STEP, rounding=ROUND_HALF_UP))
+        for field in ANALYSIS_SCORE_FIELDS
+    }
+
+
+def generate_personality_analysis(scores):
     prompt = f"""
 너는 HR 성격 평가 전문 컨설턴트이다.
 
 다음은 인적성 검사 6개 역량이다:
 
-의사소통(COMM): {result.communication}
-책임감(RESP): {result.responsibility}
-문제해결(PROB): {result.problem_solving}
-성장성(GROW): {result.growth}
-스트레스(STRE): {result.stress}
-적응력(ADAP): {result.adaptation}
+의사소통(COMM): {scores["communication"]}
+책임감(RESP): {scores["responsibility"]}
+문제해결(PROB): {scores["problem_solving"]}
+성장성(GROW): {scores["growth"]}
+스트레스(STRE): {scores["stress"]}
+적응력(ADAP): {scores["adaptation"]}
 
 요구사항:
 1) summary는 반드시 150~250자
@@ -49,13 +72,12 @@ def generate_personality_analysis(result):
 }}
 """
 
-    res = client.chat.completions.create(
-        model="gpt-4.1",
+    content = llm_gateway.chat_text(
+        model=ANALYSIS_MODEL,
         messages=[{"role": "user", "content": prompt}],
+        timeout=ANALYSIS_TIMEOUT_SECONDS,
     )
 
-    content = res.choices[0].message.content
-
     match = re.search(r"\{[\s\S]*\}", content)
     if match:
         content = match.group(0)
@@ -66,6 +88,30 @@ def generate_personality_analysis(result):
         return {"raw": content}
 
 
+def get_personality_analysis(result):
+    """
+    검사 결과의 GPT 성향 분석
+    1) AssessmentResult.analysis에 저장된 값이 있으면 그대로 사용
+    2) 없으면 점수 키로 공용 캐시(analysis_cache) 조회, 캐시에도 없으면 GPT로 생성
+    3) 결과를 AssessmentResult.analysis에 저장 (JSON 파싱에 실패한 응답은 저장하지 않음)
+    같은 점수의 분석을 다른 요청이 아직 생성 중이면 None (다음 결과 조회 때 저장된 분석 사용)
+    """
+    if result.analysis is not None:
+        return result.analysis
+
+    scores = analysis_scores(result)
+    key = analysis_cache.make_key(scores, model=ANALYSIS_MODEL, prompt_version=ANALYSIS_PROMPT_VERSION)
+    try:
+        analysis = analysis_cache.get_or_generate(key, scores, lambda: generate_personality_analysis(scores))
+    except analysis_cache.AnalysisPending:
+        return None
+
+    if analysis_cache.is_cacheable(analysis):
+        result.analysis = analysis
+        result.save(update_fields=["analysis"])
+    return analysis
+
+
 # ===============================================
 #   Assessment API
 # ===============================================
@@ -144,10 +190,11 @@ class AssessmentViewSet(viewsets.ModelViewSet):
         result = assessment.calculate_result(answers)
         result_data = AssessmentResultSerializer(result).data
 
-        analysis = generate_personality_analysis(result)
+        analysis = get_personality_analysis(result)
 
         return Response(
-            {"message": "제출 완료", "result": result_data, "analysis": analysis},
+            {"message": "제출 완료", "result": result_data, "analysis": analysis,
+             "analysis_status": "ready" if analysis is not None else "pending"},
             status=status.HTTP_200_OK
         )
 
@@ -164,12 +211,13 @@ class AssessmentViewSet(viewsets.ModelViewSet):
             return Response({"error": "결과 없음"}, status=404)
 
         result_data = AssessmentResultSerializer(result).data
-        analysis = generate_personality_analysis(result)
+        analysis = get_personality_analysis(result)
 
         return Response(
             {"assessment_id": assessment.id,
              "name": assessment.name,
              "result": result_data,
-             "analysis": analysis},
+             "analysis": analysis,
+             "analysis_status": "ready" if analysis is not None else "pending"},
             status=status.HTTP_200_OK
         )
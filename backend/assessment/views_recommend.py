@@ -1,19 +1,62 @@
-import os
 import numpy as np
-import pandas as pd
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from all_job_recommender.job_recommender import DIMENSIONS, get_recommender
+from all_job_recommender.related_jobs import RELATED_TOP_K
+
 # ----------------------
-#   1) CSV 읽기 (1회 로딩)
+#   1) 추천 엔진
 # ----------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-RECOMMENDER_DIR = os.path.join(BASE_DIR, "all_job_recommender")
-CSV_PATH = os.path.join(RECOMMENDER_DIR, "occupation_scores_kr.csv")
+# 직업 데이터(점수 행렬, 한국어 직업명)는 all_job_recommender의 JobRecommender가 한 번만 로딩하고,
+# 데이터 파일이 바뀌면 워커 재시작 없이 교체합니다. (job_recommender.get_recommender 참고)
+
+SCORE_PARAMS = ["comm", "resp", "prob", "grow", "stre", "adap"]
+TOP_N = 3
+METHOD = "cosine"
+# 반올림 전 유사도로 순위 결정 (이전 pandas 구현의 sort_values와 같은 순서, 반올림은 응답 값에만 적용)
+TIE_BREAK = "exact"
+
+# 배치 추천 설정
+BATCH_MAX_SIZE = 10000     # 한 번에 받을 수 있는 점수 벡터 개수
+BATCH_MAX_TOP_N = 20
+BATCH_CHUNK_SIZE = 1024    # 유사도 행렬을 이 행 수 단위로 나눠 계산 (메모리 상한)
+
+# 직업 상세 일괄 조회 시 한 번에 받을 수 있는 코드 개수
+DETAILS_MAX_CODES = 100
+
+# 관련 직업 기본 개수 (최대는 빌드 시 저장된 RELATED_TOP_K)
+RELATED_DEFAULT_TOP_N = 5
 
-# CSV 컬럼 예시: job_title, COMM, RESP, PROB, GROW, STRE, ADAP, description, category
-df_jobs = pd.read_csv(CSV_PATH, encoding="utf-8")
+
+def _parse_groups(value):
+    """
+    SOC 대분류 필터 파싱 ("11,15" 또는 ["11", "15"])
+    Returns:
+        대분류 코드 리스트 (필터가 없으면 None)
+    """
+    if value in (None, "", []):
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        raise ValueError
+    return [str(group).strip() for group in value if str(group).strip()] or None
+
+
+def _format_results(jobs):
+    """엔진 추천 결과를 API 응답 형식으로 변환"""
+    results = []
+    for job in jobs:
+        results.append({
+            "soc_code": job["soc_code"],
+            "title_ko": job.get("title_ko", job["title"]),
+            "similarity": job["similarity"],
+            "description": job.get("description", ""),
+            "category": job.get("category", "")
+        })
+    return results
 
 
 # ----------------------
@@ -25,44 +68,138 @@ class JobRecommendView(APIView):
 
         # 점수 가져오기
         try:
-            user_vec = np.array([
-                float(request.GET.get("comm")),
-                float(request.GET.get("resp")),
-                float(request.GET.get("prob")),
-                float(request.GET.get("grow")),
-                float(request.GET.get("stre")),
-                float(request.GET.get("adap")),
-            ])
-        except:
+            user_scores = {
+                dim: float(request.GET.get(param))
+                for dim, param in zip(DIMENSIONS, SCORE_PARAMS)
+            }
+        except (TypeError, ValueError):
             return Response({"error": "점수 형식이 잘못되었습니다."}, status=400)
 
-        # 직업 점수 벡터 생성
-        job_vectors = df_jobs[["COMM", "RESP", "PROB", "GROW", "STRE", "ADAP"]].values
+        # nan/inf 또는 모두 0인 점수는 유사도를 계산할 수 없음 (배치 API와 같은 검사)
+        user_vector = np.array(list(user_scores.values()), dtype=np.float64)
+        if not np.all(np.isfinite(user_vector)) or np.linalg.norm(user_vector) == 0:
+            return Response({"error": "점수 형식이 잘못되었습니다."}, status=400)
 
-        # 코사인 유사도
-        def cosine(a, b):
-            return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+        # 코사인 유사도 TOP 3 (groups=11,15 처럼 SOC 대분류를 지정하면 해당 분야에서만 추천)
+        try:
+            jobs = get_recommender().recommend_jobs(
+                user_scores, top_n=TOP_N, method=METHOD, groups=_parse_groups(request.GET.get("groups")),
+                tie_break=TIE_BREAK
+            )
+        except ValueError:
+            return Response({"error": "groups 형식이 잘못되었습니다."}, status=400)
 
-        sims = []
-        for i, job_row in df_jobs.iterrows():
-            job_vec = np.array([
-                job_row["COMM"], job_row["RESP"], job_row["PROB"],
-                job_row["GROW"], job_row["STRE"], job_row["ADAP"],
-            ])
-            sims.append(cosine(user_vec, job_vec))
+        return Response({"results": _format_results(jobs)}, status=200)
 
-        df_jobs["similarity"] = sims
 
-        # TOP 3
-        top3 = df_jobs.sort_values("similarity", ascending=False).head(3)
+# ----------------------
+#   3) 배치 추천 API
+# ----------------------
+class JobRecommendBatchView(APIView):
+    """
+    POST /api/assessment/recommend/batch/
+    - 여러 명의 점수 벡터를 한 번에 받아 추천 결과를 반환합니다.
+    - 요청 예시: {"scores": [[4.5, 3.8, 4.2, 3.9, 4.1, 4.3], {"comm": 4.0, ...}], "top_n": 3, "groups": ["11", "15"]}
+    - 응답: {"results": [[...1번 사용자 추천...], [...2번 사용자 추천...]]} (요청 순서 유지)
+    """
+
+    def post(self, request, format=None):
+        if not isinstance(request.data, dict):
+            return Response({"error": "요청 본문은 JSON 객체여야 합니다."}, status=400)
+
+        scores = request.data.get("scores")
+        if not isinstance(scores, list) or not scores:
+            return Response({"error": "scores는 비어있지 않은 리스트여야 합니다."}, status=400)
+        if len(scores) > BATCH_MAX_SIZE:
+            return Response({"error": f"scores는 최대 {BATCH_MAX_SIZE}개까지 요청할 수 있습니다."}, status=400)
+
+        try:
+            top_n = int(request.data.get("top_n", TOP_N))
+        except (TypeError, ValueError):
+            return Response({"error": "top_n 형식이 잘못되었습니다."}, status=400)
+        if not 1 <= top_n <= BATCH_MAX_TOP_N:
+            return Response({"error": f"top_n은 1~{BATCH_MAX_TOP_N} 사이여야 합니다."}, status=400)
+
+        # 점수 벡터 행렬 생성 (리스트 또는 comm/resp/... 키를 가진 dict 허용)
+        try:
+            rows = []
+            for item in scores:
+                if isinstance(item, dict):
+                    item = [item.get(key) for key in SCORE_PARAMS]
+                if len(item) != len(SCORE_PARAMS):
+                    raise ValueError
+                rows.append([float(v) for v in item])
+            user_matrix = np.array(rows, dtype=np.float64)
+        except (TypeError, ValueError):
+            return Response({"error": "점수 형식이 잘못되었습니다."}, status=400)
 
-        results = []
-        for _, row in top3.iterrows():
-            results.append({
-                "title_ko": row["title"],
-                "similarity": round(row["similarity"], 4),
-                "description": row.get("description", ""),
-                "category": row.get("category", "")
-            })
+        if not np.all(np.isfinite(user_matrix)) or np.any(np.linalg.norm(user_matrix, axis=1) == 0):
+            return Response({"error": "점수 형식이 잘못되었습니다."}, status=400)
 
+        try:
+            batch = get_recommender().recommend_batch(
+                user_matrix, top_n=top_n, method=METHOD, chunk_size=BATCH_CHUNK_SIZE,
+                groups=_parse_groups(request.data.get("groups")), tie_break=TIE_BREAK
+            )
+            results = [_format_results(jobs) for jobs in batch]
+        except ValueError:
+            return Response({"error": "groups 형식이 잘못되었습니다."}, status=400)
         return Response({"results": results}, status=200)
+
+
+# ----------------------
+#   4) 직업 상세 일괄 조회 API
+# ----------------------
+class JobDetailsView(APIView):
+    """
+    GET /api/assessment/jobs/details/?codes=11-1011.00,15-1252.00
+    - 추천 결과에 포함된 직업들의 상세 정보를 한 번의 요청으로 반환합니다.
+    - 응답: {"results": [...요청 순서대로...], "not_found": [...없는 코드...]}
+    """
+
+    def get(self, request, format=None):
+        codes = [code.strip() for code in request.GET.get("codes", "").split(",") if code.strip()]
+        if not codes:
+            return Response({"error": "codes가 필요합니다."}, status=400)
+        if len(codes) > DETAILS_MAX_CODES:
+            return Response({"error": f"codes는 최대 {DETAILS_MAX_CODES}개까지 요청할 수 있습니다."}, status=400)
+
+        details = get_recommender().get_jobs_details(codes)
+
+        results = [job for job in details if job is not None]
+        not_found = [code for code, job in zip(codes, details) if job is None]
+
+        return Response({"results": results, "not_found": not_found}, status=200)
+
+
+# ----------------------
+#   5) 관련 직업 API
+# ----------------------
+class RelatedJobsView(APIView):
+    """
+    GET /api/assessment/jobs/<soc_code>/related/?top_n=5
+    - 빌드 시 미리 계산된 관련 직업 테이블에서 해당 직업의 이웃을 반환합니다. (전체 스캔 없음)
+    - 응답: {"soc_code": "...", "results": [{"soc_code", "title_ko", "similarity"}, ...]}
+    """
+
+    def get(self, request, soc_code, format=None):
+        try:
+            top_n = int(request.GET.get("top_n", RELATED_DEFAULT_TOP_N))
+        except (TypeError, ValueError):
+            return Response({"error": "top_n 형식이 잘못되었습니다."}, status=400)
+        if not 1 <= top_n <= RELATED_TOP_K:
+            return Response({"error": f"top_n은 1~{RELATED_TOP_K} 사이여야 합니다."}, status=400)
+
+        jobs = get_recommender().get_related_jobs(soc_code, top_n=top_n)
+        if jobs is None:
+            return Response({"error": "해당 직업을 찾을 수 없습니다."}, status=404)
+
+        results = [
+            {
+                "soc_code": job["soc_code"],
+                "title_ko": job.get("title_ko", job["title"]),
+                "similarity": job["similarity"],
+            }
+            for job in jobs
+        ]
+        return Response({"soc_code": soc_code, "results": results}, status=200)
@@ -0,0 +1,151 @@
+"""
+파일: llm_gateway.py
+역할: OpenAI 호출 공용 게이트웨이 (interview, assessment, resume 공용)
+설명:
+- 프로세스당 OpenAI 클라이언트 하나와 keep-alive httpx 연결 풀 하나를 공유합니다.
+  요청마다 클라이언트를 새로 만들면 연결 풀도 새로 생겨 매번 TCP/TLS 연결을 다시 맺게 됩니다.
+- 호출마다 timeout을 지정할 수 있고, 429/타임아웃/연결 오류/5xx는 jitter를 준 지수 백오프로 재시도합니다.
+- 연결 풀 크기, 타임아웃, 재시도 횟수는 settings.py의 LLM_* 설정으로 조정합니다.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+
+import httpx
+import openai
+from django.conf import settings
+from openai import DefaultHttpxClient, OpenAI
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings.py에 같은 이름의 설정이 있으면 그 값을 사용)
+DEFAULTS = {
+    'LLM_TIMEOUT_SECONDS': 60.0,
+    'LLM_CONNECT_TIMEOUT_SECONDS': 5.0,
+    'LLM_MAX_RETRIES': 2,
+    'LLM_MAX_CONNECTIONS': 20,
+    'LLM_MAX_KEEPALIVE_CONNECTIONS': 10,
+    'LLM_KEEPALIVE_EXPIRY_SECONDS': 60.0,
+}
+
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def _setting(name):
+    return getattr(settings, name, DEFAULTS[name])
+
+
+def is_configured() -> bool:
+    """OpenAI API 키가 설정되어 있는지"""
+    return bool(getattr(settings, 'OPENAI_API_KEY', ''))
+
+
+def _timeout(total: float) -> httpx.Timeout:
+    """전체 timeout과 연결 timeout (연결이 안 되는 경우는 빨리 실패)"""
+    return httpx.Timeout(total, connect=min(total, _setting('LLM_CONNECT_TIMEOUT_SECONDS')))
+
+
+def get_client() -> OpenAI:
+    """
+    프로세스 공용 OpenAI 클라이언트
+    gunicorn 워커처럼 fork된 프로세스에서는 부모의 연결을 공유하지 않도록 새로 만듭니다.
+    재시도는 chat_completion에서 직접 처리하므로 클라이언트 자체 재시도는 끕니다.
+    """
+    global _client, _client_pid
+    if not is_configured():
+        raise ValueError('OpenAI API 키가 설정되지 않았습니다.')
+
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+    with _client_lock:
+        if _client is None or _client_pid != pid:
+            http_client = DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=_setting('LLM_MAX_CONNECTIONS'),
+                    max_keepalive_connections=_setting('LLM_MAX_KEEPALIVE_CONNECTIONS'),
+                    keepalive_expiry=_setting('LLM_KEEPALIVE_EXPIRY_SECONDS'),
+                ),
+                timeout=_timeout(_setting('LLM_TIMEOUT_SECONDS')),
+            )
+            _client = OpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client, max_retries=0)
+            _client_pid = pid
+    return _client
+
+
+def _retry_delay(error, attempt: int) -> float:
+    """재시도 전 대기 시간 (Retry-After 헤더 우선, 없으면 지수 백오프 + jitter)"""
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+
+
+def chat_completion(model: str, messages, timeout: float = None, max_retries: int = None, **params):
+    """
+    채팅 완성 요청 (공용 연결 풀 사용)
+    Args:
+        model: 모델 이름
+        messages: 대화 메시지 목록
+        timeout: 이 호출의 전체 timeout (초, 기본값: LLM_TIMEOUT_SECONDS)
+        max_retries: 재시도 횟수 (기본값: LLM_MAX_RETRIES)
+        **params: temperature, max_tokens, stream 등 chat.completions.create 인자
+    Returns:
+        chat.completions.create 응답 (stream=True면 청크 스트림)
+    Raises:
+        ValueError: API 키가 없는 경우
+        openai.OpenAIError: 재시도 후에도 실패한 경우
+    """
+    client = get_client()
+    timeout = _timeout(timeout or _setting('LLM_TIMEOUT_SECONDS'))
+    max_retries = _setting('LLM_MAX_RETRIES') if max_retries is None else max_retries
+
+    for attempt in range(max_retries + 1):
+        try:
+            return client.chat.completions.create(model=model, messages=messages, timeout=timeout, **params)
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(f'OpenAI API 재시도 ({attempt + 1}/{max_retries}, {delay:.1f}초 후): {type(e).__name__}')
+            time.sleep(delay)
+
+
+def chat_text(model: str, messages, timeout: float = None, max_retries: int = None, **params) -> str:
+    """채팅 완성 요청 후 응답 텍스트만 반환 (앞뒤 공백 제거)"""
+    response = chat_completion(model, messages, timeout=timeout, max_retries=max_retries, **params)
+    return (response.choices[0].message.content or '').strip()
+
+
+def chat_stream(model: str, messages, timeout: float = None, max_retries: int = None, **params):
+    """
+    스트리밍 채팅 완성 요청 (응답 텍스트 조각을 도착하는 대로 반환하는 제너레이터)
+    요청을 보내 응답이 시작되기 전까지의 오류는 재시도하지만, 스트림 도중 끊기면 예외를 그대로 전달합니다.
+    timeout은 조각 사이의 최대 대기 시간에도 적용됩니다.
+    """
+    stream = chat_completion(model, messages, timeout=timeout, max_retries=max_retries, stream=True, **params)
+    try:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        stream.close()
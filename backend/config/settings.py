@@ -148,3 +148,12 @@ if DEBUG:
 
 # OpenAI API 설정
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+
+# OpenAI 호출 공용 게이트웨이 (config/llm_gateway.py) 설정
+# 프로세스당 keep-alive 연결 풀 하나를 공유하고, 호출마다 timeout과 재시도를 적용합니다.
+LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', '60'))
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.getenv('LLM_CONNECT_TIMEOUT_SECONDS', '5'))
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '2'))
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '20'))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('LLM_MAX_KEEPALIVE_CONNECTIONS', '10'))
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv('LLM_KEEPALIVE_EXPIRY_SECONDS', '60'))
@@ -9,7 +9,7 @@
 
 from django.contrib import admin
 # ↓↓↓↓↓↓ 여기를 수정했습니다! ↓↓↓↓↓↓
-from .models import Interviewer, InterviewSession, InterviewExchange
+from .models import Interviewer, InterviewSession, InterviewExchange, FeedbackJob
 
 # (보너스) Admin 페이지에서 모델을 더 보기 좋게 관리하기 위한 클래스
 class InterviewerAdmin(admin.ModelAdmin):
@@ -45,9 +45,19 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     # ↓↓↓↓↓↓ (보너스 기능) 위에서 만든 Inline을 여기에 연결
     inlines = [InterviewExchangeInline] 
 
+class FeedbackJobAdmin(admin.ModelAdmin):
+    """
+    면접 종료 피드백 생성 작업(FeedbackJob)을 어드민에서 확인합니다.
+    (실패한 작업은 status를 '대기'로 바꾸면 워커가 다시 처리합니다)
+    """
+    list_display = ('id', 'session', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'error')
+
 # --- Admin 사이트에 모델들을 최종 등록 ---
 admin.site.register(Interviewer, InterviewerAdmin)
 admin.site.register(InterviewSession, InterviewSessionAdmin)
+admin.site.register(FeedbackJob, FeedbackJobAdmin)
 
 # Exchange 모델은 Session을 통해 주로 확인하므로, 간단하게만 등록하거나 생략해도 됩니다.
 admin.site.register(InterviewExchange)
@@ -0,0 +1,180 @@
+"""
+앱: interview (면접 시뮬레이션)
+파일: feedback_jobs.py
+역할: 면접 종료 피드백 생성 작업 큐 (DB 기반)
+설명:
+- 면접 종료 피드백은 GPT 호출이 길어서 요청 안에서 만들면 gunicorn 워커 하나를 그동안 붙잡게 됩니다.
+- 마지막 답변 요청에서는 FeedbackJob만 등록(enqueue_feedback_job)하고 바로 응답합니다.
+- 별도 프로세스(python manage.py run_feedback_worker)가 작업을 가져가(claim_next_job) 피드백을 생성합니다(run_feedback_job).
+- 별도 메시지 브로커 없이 DB 테이블만 사용하며, 워커를 여러 개 띄워도 같은 작업을 두 번 가져가지 않습니다.
+- 실패한 작업은 백오프 후 재시도하고, 워커가 중간에 죽어 오래 멈춘 작업은 다시 대기열로 돌립니다.
+"""
+
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from config import llm_gateway
+from .models import FeedbackJob, InterviewSession
+
+# 피드백 생성 GPT 설정 (워커 프로세스에서 호출하므로 요청 타임아웃보다 길게 잡음)
+FEEDBACK_MODEL = "gpt-4o"
+FEEDBACK_TEMPERATURE = 0.7
+FEEDBACK_MAX_TOKENS = 1500 # 피드백이 길 수 있으므로 토큰 여유 있게 설정
+FEEDBACK_TIMEOUT_SECONDS = 120
+
+FEEDBACK_ERROR_MESSAGE = "죄송합니다. AI 응답을 생성하는 데 실패했습니다."
+
+# 작업 재시도 설정
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 30 # 재시도 대기 시간 (시도 횟수만큼 늘어남)
+STALE_JOB_SECONDS = 600 # 이 시간 이상 '생성 중'인 작업은 워커가 죽은 것으로 보고 다시 대기열로
+
+# 한 번에 가져올 후보 작업 수 (다른 워커가 먼저 가져간 경우 다음 후보 시도)
+CLAIM_CANDIDATES = 5
+
+FEEDBACK_SYSTEM_PROMPT = (
+    "당신은 전 산업 분야를 아우르는 20년 경력의 베테랑 인사 담당자이자 면접 코치입니다. "
+    "지원자의 전체 면접 기록을 분석하여 상세한 피드백을 제공해주세요. "
+    "특히 면접의 시작인 '1분 자기소개'와 마무리는 '입사 후 포부'에 대해 면밀히 평가해주세요.\n"
+    "마크다운(Markdown) 형식을 사용하여 가독성 있게 작성하세요.\n"
+    "단, 최상단 제목('# 면접 피드백')은 제외하고 바로 '1. [총평]'부터 시작하세요.\n\n"
+    "다음 항목을 반드시 포함하여 작성하세요:\n"
+    "1. [총평] (지원자의 전반적인 인상, 강점, 태도 요약)\n"
+    "2. [자기소개 및 포부 평가] (시작과 끝맺음이 적절했는지, 인상 깊었는지 구체적 평가)\n"
+    "3. [잘한 점] (구체적인 답변 사례를 인용하여 칭찬)\n"
+    "4. [개선할 점] (답변의 논리, 구체성, 태도 등에서 부족했던 부분과 수정 제안)\n"
+    "5. [종합 점수] (100점 만점 기준, 예시: '85 / 100 점' 형태로 한 줄에 작성, 직무 적합도 반영)"
+)
+
+
+def build_feedback_messages(session: InterviewSession):
+    """
+    세션의 전체 면접 기록으로 피드백 요청 메시지 구성
+    """
+    # (1) 대화 내역 합치기 (이 부분은 자기소개/포부도 다 포함됨)
+    full_history_text = ""
+    all_exchanges = session.exchanges.select_related('interviewer').order_by('created_at')
+
+    for ex in all_exchanges:
+        role_name = ex.interviewer.role
+        full_history_text += f"면접관({role_name}): {ex.question_text}\n"
+        full_history_text += f"지원자: {ex.answer_text}\n\n"
+
+    # (2) 피드백 프롬프트 (자기소개/포부 항목 포함)
+    feedback_user_prompt = f"다음은 '{session.job_topic}' 직무 지원자의 전체 면접 기록입니다. 이에 대한 피드백을 작성해주세요:\n\n{full_history_text}"
+
+    return [
+        {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+        {"role": "user", "content": feedback_user_prompt},
+    ]
+
+
+def enqueue_feedback_job(session: InterviewSession) -> FeedbackJob:
+    """
+    피드백 생성 작업 등록
+    같은 세션에 아직 끝나지 않은 작업이 있으면 새로 만들지 않고 그 작업을 반환합니다.
+    """
+    pending = session.feedback_jobs.filter(
+        status__in=[FeedbackJob.STATUS_QUEUED, FeedbackJob.STATUS_RUNNING]
+    ).first()
+    if pending:
+        return pending
+    return FeedbackJob.objects.create(session=session)
+
+
+def requeue_stale_jobs() -> int:
+    """
+    STALE_JOB_SECONDS 이상 '생성 중'으로 남은 작업을 다시 대기열로 돌림 (워커가 중간에 종료된 경우)
+    재시도 횟수를 다 쓴 작업은 실패 처리합니다.
+    Returns:
+        다시 대기열로 돌린 작업 수
+    """
+    now = timezone.now()
+    stale = FeedbackJob.objects.filter(
+        status=FeedbackJob.STATUS_RUNNING,
+        started_at__lt=now - timedelta(seconds=STALE_JOB_SECONDS),
+    )
+    for job in stale.filter(attempts__gte=MAX_ATTEMPTS).select_related('session'):
+        _fail(job, "작업 시간 초과 (워커 중단)")
+    return stale.filter(attempts__lt=MAX_ATTEMPTS).update(
+        status=FeedbackJob.STATUS_QUEUED, run_after=now, error="작업 시간 초과 (워커 중단)"
+    )
+
+
+def claim_next_job():
+    """
+    처리할 작업 하나를 가져와 '생성 중'으로 표시
+    status 조건을 건 UPDATE로 가져가므로 워커가 여러 개여도 한 작업은 한 워커만 가져갑니다.
+    (select_for_update(skip_locked)를 지원하지 않는 SQLite에서도 동작)
+    Returns:
+        FeedbackJob 또는 None (처리할 작업 없음)
+    """
+    now = timezone.now()
+    candidates = FeedbackJob.objects.filter(
+        status=FeedbackJob.STATUS_QUEUED, run_after__lte=now
+    ).order_by('created_at').values_list('id', flat=True)[:CLAIM_CANDIDATES]
+
+    for job_id in candidates:
+        claimed = FeedbackJob.objects.filter(id=job_id, status=FeedbackJob.STATUS_QUEUED).update(
+            status=FeedbackJob.STATUS_RUNNING, started_at=now, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return FeedbackJob.objects.select_related('session').get(id=job_id)
+    return None
+
+
+def _fail(job: FeedbackJob, error: str):
+    """작업 실패 처리 (세션 피드백에는 실패 안내 문구 저장)"""
+    session = job.session
+    session.final_feedback = FEEDBACK_ERROR_MESSAGE
+    session.save(update_fields=['final_feedback'])
+
+    job.status = FeedbackJob.STATUS_FAILED
+    job.error = error
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error', 'finished_at'])
+
+
+def run_feedback_job(job: FeedbackJob) -> bool:
+    """
+    가져온 작업의 피드백을 생성하여 InterviewSession.final_feedback에 저장
+    실패하면 재시도 횟수가 남아 있는 동안 백오프 후 다시 대기열로 돌립니다.
+    Returns:
+        성공 여부
+    """
+    session = job.session
+    try:
+        if not llm_gateway.is_configured():
+            # 재시도해도 소용없으므로 바로 실패 처리
+            _fail(job, "OPENAI_API_KEY가 설정되지 않았습니다.")
+            return False
+
+        feedback = llm_gateway.chat_text(
+            model=FEEDBACK_MODEL,
+            messages=build_feedback_messages(session),
+            temperature=FEEDBACK_TEMPERATURE,
+            max_tokens=FEEDBACK_MAX_TOKENS,
+            timeout=FEEDBACK_TIMEOUT_SECONDS
+        )
+
+    except Exception as e:
+        print(f"피드백 생성 오류 (작업 {job.id}, {job.attempts}/{MAX_ATTEMPTS}회): {e}")
+        if job.attempts >= MAX_ATTEMPTS:
+            _fail(job, str(e))
+        else:
+            job.status = FeedbackJob.STATUS_QUEUED
+            job.error = str(e)
+            job.run_after = timezone.now() + timedelta(seconds=RETRY_BACKOFF_SECONDS * job.attempts)
+            job.save(update_fields=['status', 'error', 'run_after'])
+        return False
+
+    session.final_feedback = feedback
+    session.save(update_fields=['final_feedback'])
+
+    job.status = FeedbackJob.STATUS_DONE
+    job.error = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error', 'finished_at'])
+    return True
@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from interview.models import FeedbackJob
+from interview.feedback_jobs import claim_next_job, requeue_stale_jobs, run_feedback_job
+
+class Command(BaseCommand):
+    help = '면접 종료 피드백 생성 작업(FeedbackJob)을 처리하는 워커를 실행합니다. (별도 브로커 없이 DB 작업 큐 사용)'
+
+    def add_arguments(self, parser):
+        # 대기 중인 작업이 없을 때 DB를 다시 확인하기까지 쉬는 시간
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='작업 확인 주기 (초, 기본값: 1초)')
+        # 로컬 테스트/cron용: 대기 중인 작업을 모두 처리하면 종료
+        parser.add_argument('--once', action='store_true', help='대기 중인 작업을 모두 처리한 뒤 종료')
+
+    def handle(self, *args, **options):
+        poll_interval = options['poll_interval']
+        once = options['once']
+
+        self.stdout.write(self.style.SUCCESS(f"피드백 워커 시작 (확인 주기: {poll_interval}초)"))
+        processed = 0
+
+        try:
+            while True:
+                # 오래 실행되는 프로세스이므로 끊어졌거나 오래된 DB 연결 정리 (MySQL wait_timeout 대비)
+                close_old_connections()
+
+                requeued = requeue_stale_jobs()
+                if requeued:
+                    self.stdout.write(self.style.WARNING(f"멈춘 작업 {requeued}개를 다시 대기열에 넣었습니다."))
+
+                job = claim_next_job()
+                if job is None:
+                    if once:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                started = time.monotonic()
+                ok = run_feedback_job(job)
+                processed += 1
+                elapsed = time.monotonic() - started
+                if ok:
+                    self.stdout.write(self.style.SUCCESS(f"작업 {job.id} 완료 (세션 {job.session_id}, {elapsed:.1f}초)"))
+                elif job.status == FeedbackJob.STATUS_QUEUED:
+                    self.stdout.write(self.style.WARNING(f"작업 {job.id} 재시도 예정 (세션 {job.session_id}, {job.attempts}회 실패): {job.error}"))
+                else:
+                    self.stdout.write(self.style.ERROR(f"작업 {job.id} 실패 (세션 {job.session_id}, {job.attempts}회째): {job.error}"))
+
+        except KeyboardInterrupt:
+            self.stdout.write("워커를 종료합니다.")
+
+        self.stdout.write(self.style.SUCCESS(f"총 {processed}개의 작업을 처리했습니다."))
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_interviewsession_final_feedback_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedbackJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '생성 중'), ('done', '완료'), ('failed', '실패')], db_index=True, default='queued', max_length=10)),
+                ('attempts', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('session', models.ForeignKey(help_text='피드백을 생성할 면접 세션', on_delete=django.db.models.deletion.CASCADE, related_name='feedback_jobs', to='interview.interviewsession')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='interview_f_status_a2b345_idx')],
+            },
+        ),
+    ]
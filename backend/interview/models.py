@@ -10,9 +10,11 @@
   - Interviewer: 고유한 면접관 정보 (성격, 역할, GPT 시스템 프롬프트 등)
   - InterviewSession: 하나의 전체 면접 세션 (랜덤 면접관이 배정됨)
   - InterviewExchange: 세션 내에서 특정 면접관이 한 질문과 사용자의 답변을 기록
+  - FeedbackJob: 면접 종료 피드백 생성 작업 (DB 작업 큐, run_feedback_worker 명령이 처리)
 """
 
 from django.db import models
+from django.utils import timezone
 import random
 
 class Interviewer(models.Model):
@@ -116,3 +118,44 @@ class InterviewExchange(models.Model):
 
     def __str__(self):
         return f"[Q] {self.interviewer.name}: {self.question_text[:30]}..."
+
+
+class FeedbackJob(models.Model):
+    """
+    면접 종료 피드백 생성 작업 (DB 기반 작업 큐)
+    마지막 답변 요청에서는 작업만 등록하고 바로 응답하며,
+    별도 프로세스(python manage.py run_feedback_worker)가 작업을 가져가 GPT 피드백을 생성합니다.
+    생성된 피드백은 InterviewSession.final_feedback에 저장됩니다.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, '대기'),
+        (STATUS_RUNNING, '생성 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    session = models.ForeignKey(
+        InterviewSession,
+        related_name="feedback_jobs",
+        on_delete=models.CASCADE,
+        help_text="피드백을 생성할 면접 세션"
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    attempts = models.IntegerField(default=0) # 작업을 가져간 횟수 (재시도 포함)
+    error = models.TextField(blank=True, default='') # 마지막 실패 사유
+
+    run_after = models.DateTimeField(default=timezone.now) # 재시도 대기 (이 시각 이후에 다시 처리)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'run_after'])]
+
+    def __str__(self):
+        return f"[FeedbackJob {self.id}] 세션 {self.session_id}: {self.status}"
@@ -0,0 +1,247 @@
+"""
+앱: interview (면접 시뮬레이션)
+파일: tests.py
+역할: 피드백 작업 큐와 SSE 답변 스트림 테스트
+설명:
+- 작업 가져가기(claim_next_job)는 조건부 UPDATE로 한 작업을 한 워커만 가져가는지
+- 멈춘 작업 재시도/실패 처리와 피드백 생성 성공/실패 경로
+- 답변 스트림은 클라이언트 연결이 언제 끊겨도 다음 질문을 한 번만 저장하는지
+- 실행: python manage.py test interview
+"""
+
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from config import llm_gateway
+from . import feedback_jobs, views
+from .models import FeedbackJob, InterviewExchange, InterviewSession, Interviewer
+
+
+def make_session(total_questions=3):
+    """면접관 1명과 첫 질문이 있는 세션"""
+    interviewer = Interviewer.objects.create(
+        name="김면접", role="인사팀장", personality="hr", system_prompt="당신은 인사팀장입니다."
+    )
+    session = InterviewSession.objects.create(job_topic="백엔드 개발자", total_questions=total_questions)
+    session.interviewers.add(interviewer)
+    exchange = InterviewExchange.objects.create(
+        session=session, interviewer=interviewer, question_text="1분 자기소개 부탁드립니다."
+    )
+    return session, exchange
+
+
+def parse_events(chunks):
+    """SSE 이벤트 문자열 목록 -> [(이벤트, 데이터), ...]"""
+    events = []
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        for block in chunk.strip().split("\n\n"):
+            event_line, data_line = block.split("\n")
+            events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+class FeedbackJobQueueTests(TestCase):
+
+    def setUp(self):
+        self.session, _ = make_session()
+
+    def test_enqueue_reuses_pending_job(self):
+        job = feedback_jobs.enqueue_feedback_job(self.session)
+        self.assertEqual(feedback_jobs.enqueue_feedback_job(self.session), job)
+
+        job.status = FeedbackJob.STATUS_DONE
+        job.save()
+        self.assertNotEqual(feedback_jobs.enqueue_feedback_job(self.session), job)
+
+    def test_claim_takes_each_job_once(self):
+        job = feedback_jobs.enqueue_feedback_job(self.session)
+
+        claimed = feedback_jobs.claim_next_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.status, FeedbackJob.STATUS_RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNone(feedback_jobs.claim_next_job())
+
+    def test_claim_skips_job_taken_by_another_worker(self):
+        """후보 목록을 읽은 뒤 다른 워커가 먼저 가져간 작업은 건너뛰고 다음 후보를 가져감"""
+        first = FeedbackJob.objects.create(session=self.session)
+        second = FeedbackJob.objects.create(session=make_session()[0])
+        manager_filter = FeedbackJob.objects.filter
+
+        def racing_filter(*args, **kwargs):
+            if kwargs.get("id") == first.id:
+                manager_filter(id=first.id).update(status=FeedbackJob.STATUS_RUNNING, attempts=1)
+            return manager_filter(*args, **kwargs)
+
+        with mock.patch.object(FeedbackJob.objects, "filter", side_effect=racing_filter):
+            claimed = feedback_jobs.claim_next_job()
+
+        self.assertEqual(claimed.id, second.id)
+        first.refresh_from_db()
+        self.assertEqual(first.attempts, 1)  # 다른 워커가 가져간 횟수만 반영
+
+    def test_claim_waits_for_retry_backoff(self):
+        FeedbackJob.objects.create(session=self.session, run_after=timezone.now() + timedelta(seconds=60))
+        self.assertIsNone(feedback_jobs.claim_next_job())
+
+    def test_requeue_stale_jobs(self):
+        old = timezone.now() - timedelta(seconds=feedback_jobs.STALE_JOB_SECONDS + 1)
+        stale = FeedbackJob.objects.create(
+            session=self.session, status=FeedbackJob.STATUS_RUNNING, started_at=old, attempts=1
+        )
+        exhausted_session = make_session()[0]
+        exhausted = FeedbackJob.objects.create(
+            session=exhausted_session, status=FeedbackJob.STATUS_RUNNING, started_at=old,
+            attempts=feedback_jobs.MAX_ATTEMPTS
+        )
+        fresh = FeedbackJob.objects.create(
+            session=make_session()[0], status=FeedbackJob.STATUS_RUNNING, started_at=timezone.now(), attempts=1
+        )
+
+        self.assertEqual(feedback_jobs.requeue_stale_jobs(), 1)
+
+        for job in (stale, exhausted, fresh):
+            job.refresh_from_db()
+        self.assertEqual(stale.status, FeedbackJob.STATUS_QUEUED)
+        self.assertEqual(exhausted.status, FeedbackJob.STATUS_FAILED)
+        self.assertEqual(fresh.status, FeedbackJob.STATUS_RUNNING)
+        exhausted_session.refresh_from_db()
+        self.assertEqual(exhausted_session.final_feedback, feedback_jobs.FEEDBACK_ERROR_MESSAGE)
+
+    @mock.patch.object(llm_gateway, "is_configured", return_value=True)
+    def test_run_job_saves_feedback(self, _):
+        feedback_jobs.enqueue_feedback_job(self.session)
+        job = feedback_jobs.claim_next_job()
+
+        with mock.patch.object(llm_gateway, "chat_text", return_value="1. [총평] 좋습니다."):
+            self.assertTrue(feedback_jobs.run_feedback_job(job))
+
+        job.refresh_from_db()
+        self.session.refresh_from_db()
+        self.assertEqual(job.status, FeedbackJob.STATUS_DONE)
+        self.assertEqual(self.session.final_feedback, "1. [총평] 좋습니다.")
+
+    @mock.patch.object(llm_gateway, "is_configured", return_value=True)
+    @mock.patch.object(llm_gateway, "chat_text", side_effect=RuntimeError("timeout"))
+    def test_run_job_retries_then_fails(self, *_):
+        feedback_jobs.enqueue_feedback_job(self.session)
+
+        for attempt in range(1, feedback_jobs.MAX_ATTEMPTS + 1):
+            job = feedback_jobs.claim_next_job()
+            self.assertEqual(job.attempts, attempt)
+            with mock.patch("builtins.print"):
+                self.assertFalse(feedback_jobs.run_feedback_job(job))
+            job.refresh_from_db()
+            if attempt < feedback_jobs.MAX_ATTEMPTS:
+                self.assertEqual(job.status, FeedbackJob.STATUS_QUEUED)
+                self.assertGreater(job.run_after, timezone.now())
+                FeedbackJob.objects.filter(id=job.id).update(run_after=timezone.now())  # 백오프 건너뜀
+
+        self.assertEqual(job.status, FeedbackJob.STATUS_FAILED)
+        self.assertEqual(job.error, "timeout")
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.final_feedback, feedback_jobs.FEEDBACK_ERROR_MESSAGE)
+
+    def test_status_view(self):
+        job = feedback_jobs.enqueue_feedback_job(self.session)
+        client = APIClient()
+
+        response = client.get(f"/api/interview/feedback/{job.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], FeedbackJob.STATUS_QUEUED)
+        self.assertIsNone(response.data["feedback"])
+
+        self.assertEqual(client.get("/api/interview/feedback/999999/").status_code, 404)
+
+
+@mock.patch.object(llm_gateway, "is_configured", return_value=True)
+class StreamTurnTests(TestCase):
+
+    def setUp(self):
+        self.session, self.exchange = make_session(total_questions=3)
+
+    def next_turn(self):
+        return views.prepare_next_turn(self.exchange.id, "안녕하세요, 지원자입니다.")
+
+    def saved_questions(self):
+        return list(
+            self.session.exchanges.exclude(id=self.exchange.id).values_list("question_text", flat=True)
+        )
+
+    @mock.patch.object(llm_gateway, "chat_stream", return_value=iter(["경력에 ", "대해 ", "말씀해주세요."]))
+    def test_streams_and_saves_question(self, *_):
+        events = parse_events(views.stream_turn(self.next_turn()))
+
+        self.assertEqual([event for event, _ in events], ["start", "delta", "delta", "delta", "done"])
+        self.assertEqual(events[-1][1]["question_text"], "경력에 대해 말씀해주세요.")
+        self.assertEqual(self.saved_questions(), ["경력에 대해 말씀해주세요."])
+
+    @mock.patch.object(llm_gateway, "chat_stream", return_value=iter(["경력에 ", "대해 ", "말씀해주세요."]))
+    def test_disconnect_at_start_still_saves_once(self, *_):
+        stream = views.stream_turn(self.next_turn())
+        self.assertEqual(parse_events([next(stream)])[0][0], "start")
+        stream.close()
+
+        self.assertEqual(self.saved_questions(), ["경력에 대해 말씀해주세요."])
+
+    @mock.patch.object(llm_gateway, "chat_stream", return_value=iter(["경력에 ", "대해 ", "말씀해주세요."]))
+    def test_disconnect_mid_stream_saves_once(self, *_):
+        stream = views.stream_turn(self.next_turn())
+        next(stream)
+        next(stream)
+        stream.close()
+
+        self.assertEqual(self.saved_questions(), ["경력에 대해 말씀해주세요."])
+
+    def test_stream_error_saves_error_message(self, _):
+        def broken_stream(*args, **kwargs):
+            yield "경력에 "
+            raise RuntimeError("connection reset")
+
+        with mock.patch.object(llm_gateway, "chat_stream", side_effect=broken_stream), \
+                self.assertLogs("interview.views", level="ERROR"):
+            events = parse_events(views.stream_turn(self.next_turn()))
+
+        self.assertEqual([event for event, _ in events], ["start", "delta", "error", "done"])
+        self.assertEqual(self.saved_questions(), [views.GPT_ERROR_MESSAGE])
+
+    @mock.patch.object(llm_gateway, "chat_stream", return_value=iter(["질문입니다."]))
+    def test_save_failure_sends_error(self, *_):
+        with mock.patch.object(views, "complete_turn", side_effect=RuntimeError("db down")), \
+                self.assertLogs("interview.views", level="ERROR"):
+            events = parse_events(views.stream_turn(self.next_turn()))
+
+        self.assertEqual([event for event, _ in events], ["start", "delta", "error"])
+        self.assertEqual(self.saved_questions(), [])
+
+    def test_last_answer_enqueues_feedback_job(self, _):
+        session, exchange = make_session(total_questions=1)
+        events = parse_events(views.stream_turn(views.prepare_next_turn(exchange.id, "답변입니다.")))
+
+        self.assertEqual([event for event, _ in events], ["start", "done"])
+        job = FeedbackJob.objects.get(session=session)
+        self.assertEqual(events[-1][1]["feedback_job_id"], job.id)
+        self.assertEqual(job.status, FeedbackJob.STATUS_QUEUED)
+
+    @mock.patch.object(llm_gateway, "chat_stream", return_value=iter(["경력에 ", "대해 ", "말씀해주세요."]))
+    def test_stream_view(self, *_):
+        response = APIClient().post(
+            "/api/interview/answer/stream/",
+            {"exchange_id": self.exchange.id, "user_answer": "안녕하세요, 지원자입니다."},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/event-stream"))
+
+        events = parse_events([b"".join(response.streaming_content)])
+        self.assertEqual(events[0][0], "start")
+        self.assertEqual(events[-1][0], "done")
+        self.assertEqual(events[-1][1]["question_text"], "경력에 대해 말씀해주세요.")
+        self.assertEqual(self.saved_questions(), ["경력에 대해 말씀해주세요."])
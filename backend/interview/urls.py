@@ -19,5 +19,13 @@ urlpatterns = [
     # POST /api/interview/answer/
     # 'views.SubmitAnswerView'를 사용합니다.
     path('answer/', views.SubmitAnswerView.as_view(), name='interview-answer'), 
+
+    # POST /api/interview/answer/stream/
+    # 'views.SubmitAnswerStreamView'를 사용합니다. (다음 질문/피드백을 SSE로 스트리밍)
+    path('answer/stream/', views.SubmitAnswerStreamView.as_view(), name='interview-answer-stream'), 
+
+    # GET /api/interview/feedback/<job_id>/
+    # 'views.FeedbackJobStatusView'를 사용합니다. (면접 종료 피드백 생성 작업 상태 조회)
+    path('feedback/<int:job_id>/', views.FeedbackJobStatusView.as_view(), name='interview-feedback-status'), 
     
 ]
\ No newline at end of file
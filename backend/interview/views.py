@@ -6,40 +6,52 @@
 - 면접 시뮬레이션 관련 API 엔드포인트의 비즈니스 로직을 작성합니다.
 - 종료 조건: DB에 저장된 횟수(8~12회) 도달 시 종료
 - ★추가됨: 면접 종료 시 전체 대화를 분석하여 '면접 피드백'을 생성합니다.
+  (피드백은 작업 큐에 등록하고 run_feedback_worker 프로세스가 생성, feedback_jobs.py 참고)
 """
 
-import os
-import openai
+import json
+import logging
 import random 
 from typing import List, Dict
 
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from .models import Interviewer, InterviewSession, InterviewExchange
-from .serializers import InterviewExchangeSerializer, InterviewSessionDetailSerializer
+from .models import Interviewer, InterviewSession, InterviewExchange, FeedbackJob
+from .serializers import InterviewerSerializer, InterviewExchangeSerializer, InterviewSessionDetailSerializer
+from config import llm_gateway
+from .feedback_jobs import enqueue_feedback_job
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------
 # 1. GPT API 연동 헬퍼 함수
 # -----------------------------------------------------------------
 
-openai.api_key = os.environ.get("OPENAI_API_KEY")
+# GPT 호출 timeout (초)
+GPT_TIMEOUT_SECONDS = 60
 
-if not openai.api_key:
+if not llm_gateway.is_configured():
     print("경고: OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-def get_gpt_response(
+# GPT 호출 설정
+GPT_MODEL = "gpt-4o"
+GPT_TEMPERATURE = 0.7
+GPT_MAX_TOKENS = 1500 # 피드백이 길 수 있으므로 토큰 여유 있게 설정
+
+GPT_NOT_CONFIGURED_MESSAGE = "오류: 서버에 OPENAI_API_KEY가 설정되지 않았습니다."
+GPT_ERROR_MESSAGE = "죄송합니다. AI 응답을 생성하는 데 실패했습니다."
+
+def build_gpt_messages(
     system_prompt: str, 
     user_prompt: str, 
     history: List[Dict[str, str]] = None
-) -> str:
+) -> List[Dict[str, str]]:
     """
-    GPT API를 호출하여 응답을 받아옵니다.
+    시스템 프롬프트 + 이전 대화 + 사용자 프롬프트 순서의 GPT 메시지 목록
     """
-    if not openai.api_key:
-        return "오류: 서버에 OPENAI_API_KEY가 설정되지 않았습니다."
-
     messages = []
     messages.append({"role": "system", "content": system_prompt})
     
@@ -47,23 +59,250 @@ def get_gpt_response(
         messages.extend(history)
         
     messages.append({"role": "user", "content": user_prompt})
+    return messages
+
+def get_gpt_response(
+    system_prompt: str, 
+    user_prompt: str, 
+    history: List[Dict[str, str]] = None
+) -> str:
+    """
+    GPT API를 호출하여 응답을 받아옵니다.
+    """
+    return request_gpt_text(build_gpt_messages(system_prompt, user_prompt, history))
+
+def request_gpt_text(messages: List[Dict[str, str]]) -> str:
+    """
+    메시지 목록으로 GPT API를 호출하여 응답 텍스트를 받아옵니다. (실패 시 안내 문구)
+    """
+    if not llm_gateway.is_configured():
+        return GPT_NOT_CONFIGURED_MESSAGE
 
     try:
-        response = openai.chat.completions.create(
-            model="gpt-4o",
+        return llm_gateway.chat_text(
+            model=GPT_MODEL,
             messages=messages,
-            temperature=0.7,
-            max_tokens=1500 # 피드백이 길 수 있으므로 토큰 여유 있게 설정
+            temperature=GPT_TEMPERATURE,
+            max_tokens=GPT_MAX_TOKENS,
+            timeout=GPT_TIMEOUT_SECONDS
         )
-        answer = response.choices[0].message.content
-        return answer.strip()
 
     except Exception as e:
         print(f"GPT API 호출 오류: {e}")
-        return "죄송합니다. AI 응답을 생성하는 데 실패했습니다."
+        return GPT_ERROR_MESSAGE
+
+def stream_gpt_response(messages: List[Dict[str, str]]):
+    """
+    GPT API 응답을 토큰 조각 단위로 받아오는 제너레이터 (스트리밍)
+    오류는 호출한 쪽에서 처리하도록 그대로 전달합니다.
+    """
+    if not llm_gateway.is_configured():
+        yield GPT_NOT_CONFIGURED_MESSAGE
+        return
+
+    yield from llm_gateway.chat_stream(
+        model=GPT_MODEL,
+        messages=messages,
+        temperature=GPT_TEMPERATURE,
+        max_tokens=GPT_MAX_TOKENS,
+        timeout=GPT_TIMEOUT_SECONDS
+    )
+
+# -----------------------------------------------------------------
+# 2. 답변 처리 헬퍼 (일반 응답 / 스트리밍 응답 공용)
+# -----------------------------------------------------------------
+
+FINISHED_MESSAGE = "수고하셨습니다. 면접이 종료되었습니다. 잠시 후 피드백을 확인해주세요."
+LAST_QUESTION_TEXT = "마지막 질문입니다. 만약 우리 회사에 입사하게 된다면, 어떤 포부를 가지고 일하고 싶으신가요?"
+
+def prepare_next_turn(exchange_id, user_answer) -> Dict:
+    """
+    답변을 저장하고 다음 차례(다음 질문 또는 면접 종료)를 준비합니다.
+    면접이 끝났으면 피드백 생성 작업을 큐에 등록합니다. (GPT 호출은 워커 프로세스에서)
+    Returns:
+        {
+            "session": 면접 세션,
+            "is_finished": 면접 종료 여부,
+            "feedback_job": 종료 시 등록한 피드백 생성 작업 (진행 중이면 None),
+            "interviewer": 다음 질문을 할 면접관 (종료 시 None),
+            "fixed_text": GPT 없이 고정된 질문 (없으면 None),
+            "messages": GPT에 보낼 메시지 (고정 질문이거나 종료 시 None),
+        }
+    Raises:
+        InterviewExchange.DoesNotExist: 유효하지 않은 exchange_id
+        ValueError: 세션에 면접관이 없는 경우
+    """
+    # 1. 답변 저장
+    current_exchange = InterviewExchange.objects.get(id=exchange_id)
+    current_exchange.answer_text = user_answer
+    current_exchange.save()
+    
+    session = current_exchange.session
+    job_topic = session.job_topic
+
+    # 2. 현재까지 답변 완료된 개수 확인
+    answered_count = session.exchanges.filter(answer_text__isnull=False).count()
+
+    # -------------------------------------------------------
+    # 3. 종료 조건 확인 & 피드백 생성 작업 등록
+    # -------------------------------------------------------
+    if answered_count >= session.total_questions:
+        session.status = 'completed'
+        session.save()
+
+        return {
+            "session": session,
+            "is_finished": True,
+            "feedback_job": enqueue_feedback_job(session),
+            "interviewer": None,
+            "fixed_text": None,
+            "messages": None,
+        }
+
+    # -------------------------------------------------------
+    # 4. 다음 면접관 결정
+    # -------------------------------------------------------
+    session_interviewers = list(session.interviewers.all())
+    if not session_interviewers:
+        raise ValueError("면접관 없음")
+
+    next_interviewer_index = answered_count % len(session_interviewers)
+    next_interviewer = session_interviewers[next_interviewer_index]
+
+    # -------------------------------------------------------
+    # [수정 3] 마지막 질문인지 확인하여 '입사 후 포부' 고정
+    # -------------------------------------------------------
+    # 예: 총 6문제인데 지금 5개를 대답했다면(count=5), 이번에 만들 질문은 6번째(마지막) 질문임.
+    if answered_count == session.total_questions - 1:
+        return {
+            "session": session,
+            "is_finished": False,
+            "feedback_job": None,
+            "interviewer": next_interviewer,
+            "fixed_text": LAST_QUESTION_TEXT,
+            "messages": None,
+        }
+
+    # (그 외 중간 질문들은 GPT가 생성)
+    history = []
+    previous_exchanges = session.exchanges.all().order_by('created_at')
+    for ex in previous_exchanges:
+        history.append({"role": "assistant", "content": ex.question_text})
+        if ex.answer_text:
+            history.append({"role": "user", "content": ex.answer_text})
+
+    system_prompt = next_interviewer.system_prompt
+    user_prompt = f"{job_topic} 면접 상황입니다. 위 대화에 이어서 꼬리 질문을 해주세요."
+
+    return {
+        "session": session,
+        "is_finished": False,
+        "feedback_job": None,
+        "interviewer": next_interviewer,
+        "fixed_text": None,
+        "messages": build_gpt_messages(system_prompt, user_prompt, history),
+    }
+
+def finished_response(turn: Dict) -> Dict:
+    """
+    면접 종료 응답 (피드백은 feedback_job_id로 /feedback/<id>/에서 조회)
+    """
+    return {
+        "id": None, 
+        "is_finished": True, 
+        "question_text": FINISHED_MESSAGE,
+        "feedback": None,
+        "feedback_job_id": turn["feedback_job"].id,
+        "interviewer": None
+    }
+
+def complete_turn(turn: Dict, text: str) -> Dict:
+    """
+    생성된 다음 질문을 InterviewExchange로 저장하고 응답 데이터를 반환합니다.
+    """
+    new_exchange = InterviewExchange.objects.create(
+        session=turn["session"],
+        interviewer=turn["interviewer"],
+        question_text=text
+    )
+    return InterviewExchangeSerializer(new_exchange).data
+
+def sse_event(event: str, data) -> str:
+    """Server-Sent Events 형식의 이벤트 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def turn_pieces(turn: Dict):
+    """다음 질문 텍스트 조각 (고정 질문이면 한 조각, 아니면 GPT 스트리밍)"""
+    if turn["messages"] is None:
+        return iter([turn["fixed_text"]])
+    return stream_gpt_response(turn["messages"])
+
+def stream_turn(turn: Dict):
+    """
+    다음 질문을 SSE로 전송하는 제너레이터
+    이벤트 순서:
+    - start: 종료 여부와 면접관 정보 (GPT 호출 전에 바로 전송)
+    - delta: 생성되는 텍스트 조각 {"text": "..."}
+    - error: GPT 호출 또는 저장이 실패한 경우 (GPT 실패 시 저장되는 텍스트는 실패 안내 문구로 대체)
+    - done: 저장이 끝난 최종 응답 (일반 /answer/ 응답과 같은 형식)
+    면접 종료 시에는 start 다음 바로 done(feedback_job_id 포함)을 보냅니다.
+    클라이언트 연결이 언제 끊겨도(start 전송 시점 포함) 남은 응답을 끝까지 받아 다음 질문을 한 번만 저장합니다.
+    """
+    interviewer = turn["interviewer"]
+    pieces = None
+    chunks = []
+    failed = False
+    saved = turn["is_finished"] # 면접 종료 시에는 저장할 질문이 없음 (피드백은 작업 큐)
+
+    try:
+        yield sse_event("start", {
+            "is_finished": turn["is_finished"],
+            "question_text": FINISHED_MESSAGE if turn["is_finished"] else None,
+            "interviewer": InterviewerSerializer(interviewer).data if interviewer else None,
+        })
+
+        if turn["is_finished"]:
+            yield sse_event("done", finished_response(turn))
+            return
+
+        pieces = turn_pieces(turn)
+        try:
+            for piece in pieces:
+                chunks.append(piece)
+                yield sse_event("delta", {"text": piece})
+        except GeneratorExit:
+            raise
+        except Exception:
+            logger.exception("GPT API 스트리밍 오류")
+            failed = True
+            yield sse_event("error", {"error": GPT_ERROR_MESSAGE})
+
+        saved = True
+        try:
+            data = complete_turn(turn, GPT_ERROR_MESSAGE if failed else "".join(chunks).strip())
+        except Exception:
+            logger.exception("다음 질문 저장 오류")
+            yield sse_event("error", {"error": "다음 질문을 저장하지 못했습니다."})
+            return
+        yield sse_event("done", data)
+
+    except GeneratorExit:
+        # 클라이언트 연결 끊김: 아직 저장 전이면 남은 응답을 받아 저장만 하고 종료
+        if not saved:
+            try:
+                for piece in (pieces if pieces is not None else turn_pieces(turn)):
+                    chunks.append(piece)
+            except Exception:
+                logger.exception("GPT API 스트리밍 오류 (연결 끊김 후)")
+                failed = True
+            try:
+                complete_turn(turn, GPT_ERROR_MESSAGE if failed else "".join(chunks).strip())
+            except Exception:
+                logger.exception("다음 질문 저장 오류 (연결 끊김 후)")
+        raise
 
 # -----------------------------------------------------------------
-# 2. 핵심 API 뷰 (Views)
+# 3. 핵심 API 뷰 (Views)
 # -----------------------------------------------------------------
 
 class StartInterviewView(APIView):
@@ -125,7 +364,7 @@ class SubmitAnswerView(APIView):
     - 답변 제출 및 다음 질문 생성
     - 종료 조건: DB에 저장된 total_questions 횟수에 도달하면 종료
     - ★수정됨: 마지막 순서(total - 1)일 때 '입사 후 포부' 질문 고정
-    - ★종료 시: 전체 면접 내용을 분석하여 피드백 제공
+    - ★종료 시: 피드백 생성 작업을 등록하고 바로 응답 (feedback_job_id로 /feedback/<id>/ 조회)
     """
     permission_classes = [AllowAny] # 누구나 접근 가능하게 허용
     authentication_classes = []     # 로그인 검사 안 함
@@ -138,107 +377,73 @@ class SubmitAnswerView(APIView):
             return Response({"error": "필수 데이터 누락"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            # 1. 답변 저장
-            current_exchange = InterviewExchange.objects.get(id=exchange_id)
-            current_exchange.answer_text = user_answer
-            current_exchange.save()
-            
-            session = current_exchange.session
-            job_topic = session.job_topic
+            turn = prepare_next_turn(exchange_id, user_answer)
 
-            # 2. 현재까지 답변 완료된 개수 확인
-            answered_count = session.exchanges.filter(answer_text__isnull=False).count()
+            # 면접 종료: 피드백은 워커가 생성하므로 작업 id만 응답
+            if turn["is_finished"]:
+                return Response(finished_response(turn), status=status.HTTP_202_ACCEPTED)
 
-            # -------------------------------------------------------
-            # 3. 종료 조건 확인 & 피드백 생성 (기존과 동일)
-            # -------------------------------------------------------
-            if answered_count >= session.total_questions:
-                session.status = 'completed'
-                session.save()
-
-                # (1) 대화 내역 합치기 (이 부분은 자기소개/포부도 다 포함됨)
-                full_history_text = ""
-                all_exchanges = session.exchanges.all().order_by('created_at')
-                
-                for ex in all_exchanges:
-                    role_name = ex.interviewer.role
-                    full_history_text += f"면접관({role_name}): {ex.question_text}\n"
-                    full_history_text += f"지원자: {ex.answer_text}\n\n"
-
-                # (2) [수정] 피드백 프롬프트 강화 (자기소개/포부 항목 추가)
-                feedback_system_prompt = (
-                    "당신은 전 산업 분야를 아우르는 20년 경력의 베테랑 인사 담당자이자 면접 코치입니다. "
-                    "지원자의 전체 면접 기록을 분석하여 상세한 피드백을 제공해주세요. "
-                    "특히 면접의 시작인 '1분 자기소개'와 마무리는 '입사 후 포부'에 대해 면밀히 평가해주세요.\n"
-                    "마크다운(Markdown) 형식을 사용하여 가독성 있게 작성하세요.\n"
-                    "단, 최상단 제목('# 면접 피드백')은 제외하고 바로 '1. [총평]'부터 시작하세요.\n\n"
-                    "다음 항목을 반드시 포함하여 작성하세요:\n"
-                    "1. [총평] (지원자의 전반적인 인상, 강점, 태도 요약)\n"
-                    "2. [자기소개 및 포부 평가] (시작과 끝맺음이 적절했는지, 인상 깊었는지 구체적 평가)\n" 
-                    "3. [잘한 점] (구체적인 답변 사례를 인용하여 칭찬)\n"
-                    "4. [개선할 점] (답변의 논리, 구체성, 태도 등에서 부족했던 부분과 수정 제안)\n"
-                    "5. [종합 점수] (100점 만점 기준, 예시: '85 / 100 점' 형태로 한 줄에 작성, 직무 적합도 반영)"
-                )
-                
-                feedback_user_prompt = f"다음은 '{job_topic}' 직무 지원자의 전체 면접 기록입니다. 이에 대한 피드백을 작성해주세요:\n\n{full_history_text}"
-
-                # (3) GPT에게 피드백 요청
-                feedback_result = get_gpt_response(feedback_system_prompt, feedback_user_prompt)
-                
-                # (4) DB 저장 및 응답
-                session.final_feedback = feedback_result
-                session.save()
-
-                return Response({
-                    "id": None, 
-                    "is_finished": True, 
-                    "question_text": "수고하셨습니다. 면접이 종료되었습니다. 잠시 후 피드백을 확인해주세요.",
-                    "feedback": feedback_result,
-                    "interviewer": None
-                }, status=status.HTTP_200_OK)
+            # 다음 질문 생성 (마지막 질문은 고정) 후 저장
+            next_question_text = turn["fixed_text"] or request_gpt_text(turn["messages"])
+            return Response(complete_turn(turn, next_question_text), status=status.HTTP_201_CREATED)
 
-            # -------------------------------------------------------
-            # 4. 다음 면접관 결정
-            # -------------------------------------------------------
-            session_interviewers = list(session.interviewers.all())
-            if not session_interviewers:
-                 return Response({"error": "면접관 없음"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except InterviewExchange.DoesNotExist:
+            return Response({"error": "유효하지 않은 exchange_id"}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            next_interviewer_index = answered_count % len(session_interviewers)
-            next_interviewer = session_interviewers[next_interviewer_index]
 
-            # -------------------------------------------------------
-            # [수정 3] 마지막 질문인지 확인하여 '입사 후 포부' 고정
-            # -------------------------------------------------------
-            # 예: 총 6문제인데 지금 5개를 대답했다면(count=5), 이번에 만들 질문은 6번째(마지막) 질문임.
-            if answered_count == session.total_questions - 1:
-                next_question_text = "마지막 질문입니다. 만약 우리 회사에 입사하게 된다면, 어떤 포부를 가지고 일하고 싶으신가요?"
-            
-            else:
-                # (그 외 중간 질문들은 GPT가 생성)
-                history = []
-                previous_exchanges = session.exchanges.all().order_by('created_at')
-                for ex in previous_exchanges:
-                    history.append({"role": "assistant", "content": ex.question_text})
-                    if ex.answer_text:
-                        history.append({"role": "user", "content": ex.answer_text})
-
-                system_prompt = next_interviewer.system_prompt
-                user_prompt = f"{job_topic} 면접 상황입니다. 위 대화에 이어서 꼬리 질문을 해주세요."
-                
-                next_question_text = get_gpt_response(system_prompt, user_prompt, history)
-
-            # 7. 저장 및 응답
-            new_exchange = InterviewExchange.objects.create(
-                session=session,
-                interviewer=next_interviewer,
-                question_text=next_question_text
-            )
-            
-            serializer = InterviewExchangeSerializer(new_exchange)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+class SubmitAnswerStreamView(APIView):
+    """
+    POST /api/interview/answer/stream/
+    - /answer/와 같은 처리를 하되, 다음 질문을 생성되는 대로 SSE(text/event-stream)로 전송
+    - 스트림이 끝나면 전체 텍스트를 InterviewExchange에 저장
+    - 면접 종료 시 피드백은 /answer/와 마찬가지로 작업 큐에 등록 (feedback_job_id 응답)
+    - 이벤트 형식은 stream_turn 참고
+    """
+    permission_classes = [AllowAny] # 누구나 접근 가능하게 허용
+    authentication_classes = []     # 로그인 검사 안 함
+
+    def post(self, request, *args, **kwargs):
+        exchange_id = request.data.get('exchange_id')
+        user_answer = request.data.get('user_answer')
 
+        if not exchange_id or not user_answer:
+            return Response({"error": "필수 데이터 누락"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            turn = prepare_next_turn(exchange_id, user_answer)
         except InterviewExchange.DoesNotExist:
             return Response({"error": "유효하지 않은 exchange_id"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        response = StreamingHttpResponse(stream_turn(turn), content_type='text/event-stream; charset=utf-8')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no' # nginx 등 프록시의 응답 버퍼링 끄기
+        return response
+
+
+class FeedbackJobStatusView(APIView):
+    """
+    GET /api/interview/feedback/<job_id>/
+    - 면접 종료 피드백 생성 작업 상태 조회
+    - status: queued(대기) / running(생성 중) / done(완료) / failed(실패)
+    - 완료 또는 실패 시 feedback에 InterviewSession.final_feedback 반환 (실패 시 안내 문구)
+    """
+    permission_classes = [AllowAny] # 누구나 접근 가능하게 허용
+    authentication_classes = []     # 로그인 검사 안 함
+
+    def get(self, request, job_id, *args, **kwargs):
+        try:
+            job = FeedbackJob.objects.select_related('session').get(id=job_id)
+        except FeedbackJob.DoesNotExist:
+            return Response({"error": "유효하지 않은 job_id"}, status=status.HTTP_404_NOT_FOUND)
+
+        finished = job.status in (FeedbackJob.STATUS_DONE, FeedbackJob.STATUS_FAILED)
+        return Response({
+            "job_id": job.id,
+            "session_id": job.session_id,
+            "status": job.status,
+            "feedback": job.session.final_feedback if finished else None,
+        }, status=status.HTTP_200_OK)
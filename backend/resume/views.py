@@ -6,12 +6,11 @@
 
 import json
 import logging
-from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from openai import OpenAI
+from config import llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -288,21 +287,18 @@ STAR 기법을 적용한 답변 전략을 3-4줄로 작성하세요. 반드시 
 피해야 할 표현을 제시하세요.
 """
 
-def get_openai_client():
-    if not settings.OPENAI_API_KEY:
-        raise ValueError('OpenAI API 키가 설정되지 않았습니다.')
-    return OpenAI(api_key=settings.OPENAI_API_KEY)
+# 이력서 분석 GPT 호출 timeout (초) - 응답이 길어(최대 3000 토큰) 여유 있게 설정
+ANALYSIS_TIMEOUT_SECONDS = 90
 
 def call_openai_api(prompt, max_tokens=2000):
     try:
-        client = get_openai_client()
-        response = client.chat.completions.create(
+        return llm_gateway.chat_text(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=max_tokens,
-            temperature=0.7
+            temperature=0.7,
+            timeout=ANALYSIS_TIMEOUT_SECONDS
         )
-        return response.choices[0].message.content.strip()
     except ValueError as e:
         logger.error(f'OpenAI API ValueError: {e}')
         raise
@@ -21,6 +21,10 @@ pip install -r requirements.txt
 python manage.py migrate
 python manage.py collectstatic --noinput
 sudo systemctl restart gunicorn
+# 피드백 워커도 새 코드로 재시작 (서비스가 설정된 서버만)
+if systemctl list-unit-files | grep -q '^feedback-worker.service'; then
+    sudo systemctl restart feedback-worker
+fi
 echo "✅ 백엔드 배포 완료"
 
 # 프론트엔드 빌드 및 배포
@@ -125,8 +125,30 @@ RestartSec=3
 WantedBy=multi-user.target
 EOF
 
+# 면접 피드백 워커 systemd 서비스 생성 (면접 종료 피드백을 gunicorn 밖에서 생성)
+echo "🔧 피드백 워커 서비스 설정 중..."
+sudo tee /etc/systemd/system/feedback-worker.service > /dev/null <<EOF
+[Unit]
+Description=Interview feedback worker for interview-simulation
+After=network.target
+
+[Service]
+User=$USER
+Group=www-data
+WorkingDirectory=/var/www/interview-simulation/backend
+# .env 파일에서 환경 변수 로드
+EnvironmentFile=/var/www/interview-simulation/backend/.env
+ExecStart=/var/www/interview-simulation/backend/venv/bin/python manage.py run_feedback_worker
+Restart=always
+RestartSec=3
+
+[Install]
+WantedBy=multi-user.target
+EOF
+
 sudo systemctl daemon-reload
 sudo systemctl enable gunicorn
+sudo systemctl enable feedback-worker
 
 # MySQL 설정
 echo "🐬 MySQL 설정 중..."
@@ -8,6 +8,9 @@ import assessmentAPI from "../services/assessmentAPI";
 import RadarChart from "../components/RadarChart";
 import "./AssessmentResult.css";
 
+// 추천 직업마다 보여줄 비슷한 직업 수
+const RELATED_JOBS_COUNT = 3;
+
 const AssessmentResult = () => {
   const navigate = useNavigate();
   const location = useLocation();
@@ -32,6 +35,12 @@ const AssessmentResult = () => {
   // 추천 직업
   const [recommendedJob, setRecommendedJob] = useState([]);
 
+  // 추천 직업 상세 정보 (soc_code -> 상세)
+  const [jobDetails, setJobDetails] = useState({});
+
+  // 추천 직업별 비슷한 직업 (soc_code -> 목록)
+  const [relatedJobs, setRelatedJobs] = useState({});
+
   // -------------------------------
   // 1) 새로고침 시 결과 재요청
   // -------------------------------
@@ -81,6 +90,27 @@ const AssessmentResult = () => {
 
         if (res.data?.results && res.data.results.length > 0) {
           setRecommendedJob(res.data.results);
+
+          // 추천된 직업들의 상세 정보를 한 번의 요청으로 조회
+          const details = await assessmentAPI.getJobsDetails(
+            res.data.results.map((job) => job.soc_code)
+          );
+          setJobDetails(
+            Object.fromEntries(
+              (details.data?.results || []).map((job) => [job.soc_code, job])
+            )
+          );
+
+          // 추천 직업마다 미리 계산된 비슷한 직업 조회
+          const related = await Promise.all(
+            res.data.results.slice(0, 3).map((job) =>
+              assessmentAPI
+                .getRelatedJobs(job.soc_code, RELATED_JOBS_COUNT)
+                .then((r) => [job.soc_code, r.data?.results || []])
+                .catch(() => [job.soc_code, []])
+            )
+          );
+          setRelatedJobs(Object.fromEntries(related));
         }
       } catch (err) {
         console.error("추천 API 오류:", err);
@@ -193,6 +223,19 @@ const AssessmentResult = () => {
       {recommendedJob.slice(0, 3).map((job, i) => (
         <div key={i} className="job-item">
           <p><strong>{i + 1}위:</strong> {job.title_ko}</p>
+          {jobDetails[job.soc_code] && (
+            <p className="job-detail">{jobDetails[job.soc_code].title}</p>
+          )}
+          {relatedJobs[job.soc_code]?.length > 0 && (
+            <div className="related-jobs">
+              <h4>비슷한 직업</h4>
+              <ul>
+                {relatedJobs[job.soc_code].map((related) => (
+                  <li key={related.soc_code}>{related.title_ko}</li>
+                ))}
+              </ul>
+            </div>
+          )}
           <button
             className="simul-btn"
             onClick={() =>
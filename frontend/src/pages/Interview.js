@@ -6,6 +6,10 @@ import './Interview.css';
 import interviewersImage from '../assets/interview.gif';
 import { API_BASE_URL } from '../services/apiConfig';
 
+// 면접 종료 피드백 조회 주기 / 최대 조회 횟수 (약 5분)
+const FEEDBACK_POLL_INTERVAL_MS = 2000;
+const FEEDBACK_POLL_MAX_TRIES = 150;
+
 function Interview() {
   // -----------------------------------------------------------
   // 0. 초기 설정 및 상태 관리
@@ -18,6 +22,8 @@ function Interview() {
   const [conversation, setConversation] = useState([]);
   const [currentInput, setCurrentInput] = useState('');
   const [isLoading, setIsLoading] = useState(false);
+  // 다음 질문/피드백을 스트리밍으로 받는 중 (첫 글자가 도착하면 isLoading은 해제됨)
+  const [isStreaming, setIsStreaming] = useState(false);
   const [currentExchangeId, setCurrentExchangeId] = useState(null);
   
   const [isSessionStarted, setIsSessionStarted] = useState(false);
@@ -84,6 +90,54 @@ function Interview() {
     }
   };
 
+  // SSE(text/event-stream) 응답을 읽어 이벤트마다 onEvent(event, data) 호출
+  const readEventStream = async (response, onEvent) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder('utf-8');
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // 이벤트는 빈 줄로 구분됨
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = 'message';
+        let data = '';
+        block.split('\n').forEach(line => {
+          if (line.startsWith('event:')) event = line.slice(6).trim();
+          else if (line.startsWith('data:')) data += line.slice(5).trim();
+        });
+        if (data) onEvent(event, JSON.parse(data));
+      }
+    }
+  };
+
+  // 면접 종료 피드백은 서버 워커가 생성하므로 완료될 때까지 작업 상태를 주기적으로 조회
+  const pollFeedback = async (jobId) => {
+    for (let i = 0; i < FEEDBACK_POLL_MAX_TRIES; i++) {
+      try {
+        const response = await fetch(`${API_BASE_URL}/interview/feedback/${jobId}/`);
+        if (response.ok) {
+          const data = await response.json();
+          if (data.status === 'done' || data.status === 'failed') {
+            setFeedback(data.feedback || '피드백을 생성하지 못했습니다.');
+            return;
+          }
+        }
+      } catch (error) {
+        console.error(error);
+      }
+      await new Promise(resolve => setTimeout(resolve, FEEDBACK_POLL_INTERVAL_MS));
+    }
+    setFeedback('피드백 생성이 지연되고 있습니다. 잠시 후 다시 시도해주세요.');
+  };
+
   const handleSubmitAnswer = async (e) => {
     e.preventDefault();
     if (!currentInput.trim()) return;
@@ -91,11 +145,23 @@ function Interview() {
     const userAnswer = currentInput;
     setCurrentInput('');
     setIsLoading(true);
+    setIsStreaming(true);
 
     setConversation(prev => [...prev, { sender: 'user', text: userAnswer }]);
 
+    // 마지막 AI 메시지의 텍스트 변경
+    const updateLastAiText = (update) => {
+      setConversation(prev => {
+        const next = [...prev];
+        const last = next[next.length - 1];
+        next[next.length - 1] = { ...last, text: update(last.text) };
+        return next;
+      });
+    };
+
     try {
-      const response = await fetch(`${API_BASE_URL}/interview/answer/`, {
+      // 다음 질문을 생성되는 대로 받아서 바로 표시 (면접 종료 시 피드백은 작업 상태 조회)
+      const response = await fetch(`${API_BASE_URL}/interview/answer/stream/`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
@@ -105,28 +171,44 @@ function Interview() {
       });
 
       if (!response.ok) throw new Error(response.statusText);
-      const data = await response.json();
 
-      setConversation(prev => [...prev, { 
-        sender: 'ai', 
-        text: data.question_text,
-        interviewer: data.interviewer 
-      }]);
-
-      if (data.is_finished) {
-        setIsFinished(true);
-        setCurrentExchangeId(null);
-        if (data.feedback) {
-          setFeedback(data.feedback);
+      await readEventStream(response, (event, data) => {
+        if (event === 'start') {
+          setConversation(prev => [...prev, { 
+            sender: 'ai', 
+            text: data.is_finished ? data.question_text : '',
+            interviewer: data.interviewer 
+          }]);
+          if (data.is_finished) {
+            setIsFinished(true);
+            setCurrentExchangeId(null);
+            setIsLoading(false);
+          }
+        } else if (event === 'delta') {
+          setIsLoading(false);
+          updateLastAiText(text => text + data.text);
+        } else if (event === 'error') {
+          console.error(data.error);
+        } else if (event === 'done') {
+          // 서버에 저장된 최종 결과로 교체
+          if (data.is_finished) {
+            if (data.feedback) {
+              setFeedback(data.feedback);
+            } else if (data.feedback_job_id) {
+              pollFeedback(data.feedback_job_id);
+            }
+          } else {
+            updateLastAiText(() => data.question_text);
+            setCurrentExchangeId(data.id);
+          }
         }
-      } else {
-        setCurrentExchangeId(data.id);
-      }
+      });
 
     } catch (error) {
       console.error(error);
     } finally {
       setIsLoading(false);
+      setIsStreaming(false);
     }
   };
 
@@ -220,9 +302,9 @@ function Interview() {
                     value={currentInput}
                     onChange={(e) => setCurrentInput(e.target.value)}
                     placeholder="답변을 입력하세요..."
-                    disabled={isLoading}
+                    disabled={isLoading || isStreaming}
                   />
-                  <button type="submit" disabled={isLoading || !currentInput}>
+                  <button type="submit" disabled={isLoading || isStreaming || !currentInput}>
                     제출
                   </button>
                 </form>
@@ -241,7 +323,7 @@ function Interview() {
                   </div>
                   
                   <div className="button-group">
-                    <button className="download-btn" onClick={handleDownload}>
+                    <button className="download-btn" onClick={handleDownload} disabled={isStreaming}>
                       💾 리포트 저장
                     </button>
                     <button className="restart-btn" onClick={handleRestart}>
@@ -33,10 +33,22 @@ const assessmentAPI = {
   // 결과 히스토리 조회 API 함수 작성 (필요시)
   getHistory: () => api.get('/assessment/history/'),
 
-// AI 직업 추천 API
-getRecommendedJob: (comm, resp, prob, grow, stre, adap) =>
+// AI 직업 추천 API (groups: SOC 대분류 코드 배열, 예: ['11', '15'])
+getRecommendedJob: (comm, resp, prob, grow, stre, adap, groups) =>
   api.get(`/assessment/recommend/`, {
-    params: { comm, resp, prob, grow, stre, adap }
+    params: { comm, resp, prob, grow, stre, adap, ...(groups?.length ? { groups: groups.join(',') } : {}) }
+  }),
+
+// 직업 상세 일괄 조회 API (soc_code 배열)
+getJobsDetails: (socCodes) =>
+  api.get(`/assessment/jobs/details/`, {
+    params: { codes: socCodes.join(',') }
+  }),
+
+// 관련 직업 조회 API
+getRelatedJobs: (socCode, topN = 5) =>
+  api.get(`/assessment/jobs/${socCode}/related/`, {
+    params: { top_n: topN }
   }),
 };
 